@@ -0,0 +1,162 @@
+"""Time the public API end to end against a local stub of the data API.
+
+Every scenario calls the client as a user would, over HTTP, against the stub
+server of ``benchmarks.stub_server`` running in its own process, so the
+server does not compete with the client for the interpreter. The latency of
+each call, the rows and megabytes it processed per second and the peak of
+the memory it allocated (measured in a separate run, as tracing slows the
+calls down) are reported. Run from the repository root with::
+
+    python -m benchmarks.bench_api
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from urllib.request import urlopen
+
+import quandl
+from benchmarks.stub_server import STATS_PATH, StubApi, StubApiServer
+
+MERGED_CODES = ['WIKI/AAPL.4', 'WIKI/MSFT.4', 'WIKI/AMZN.4', 'WIKI/GOOG.4', 'WIKI/META.4']
+
+
+def serve(sizes, queue):
+    server = StubApiServer(StubApi(**sizes))
+    queue.put(server.api_base)
+    server.serve_forever()
+
+
+def get_dataset(args, folder):
+    return len(quandl.get('WIKI/AAPL').index)
+
+
+def get_dataset_csv(args, folder):
+    return len(quandl.get('WIKI/AAPL', wire_format='csv').index)
+
+
+def get_merged_datasets(args, folder):
+    return len(quandl.get(MERGED_CODES).index) * len(MERGED_CODES)
+
+
+def get_table(args, folder):
+    return len(quandl.get_table('ZACKS/FC', paginate=True).index)
+
+
+def get_table_csv(args, folder):
+    return len(quandl.get_table('ZACKS/FC', paginate=True, wire_format='csv').index)
+
+
+def get_point_in_time(args, folder):
+    return len(quandl.get_point_in_time('ZACKS/FC', interval='asofdate', date='2020-12-31',
+                                        paginate=True).index)
+
+
+def bulkdownload(args, folder):
+    quandl.bulkdownload('WIKI', filename=folder)
+    return args.bulk_rows
+
+
+def export_table(args, folder):
+    quandl.export_table('ZACKS/FC', filename=folder)
+    return args.export_rows
+
+
+def export_table_iterator(args, folder):
+    return sum(len(df.index) for df in quandl.export_table('ZACKS/FC', returns='iterator'))
+
+
+SCENARIOS = [
+    ('get', get_dataset),
+    ('get csv', get_dataset_csv),
+    ('get merged', get_merged_datasets),
+    ('get_table paginated', get_table),
+    ('get_table csv', get_table_csv),
+    ('get_point_in_time', get_point_in_time),
+    ('bulkdownload', bulkdownload),
+    ('export_table', export_table),
+    ('export_table iterator', export_table_iterator),
+]
+
+
+def server_stats(api_base):
+    # reading the stats resets them
+    with urlopen(api_base[:-len('/api/v3')] + STATS_PATH) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+def measure(scenario, args, api_base, folder):
+    scenario(args, folder)  # imports, connections and metadata are not timed
+    server_stats(api_base)
+
+    seconds = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        rows = scenario(args, folder)
+        seconds.append(time.perf_counter() - started)
+    stats = server_stats(api_base)
+
+    tracemalloc.start()
+    scenario(args, folder)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    server_stats(api_base)
+
+    return {'rows': rows, 'requests': stats['requests'] / float(args.repeat),
+            'megabytes': stats['bytes'] / float(args.repeat) / 2 ** 20,
+            'best': min(seconds), 'median': statistics.median(seconds),
+            'peak_megabytes': peak / float(2 ** 20)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenarios', nargs='+', choices=[name for name, _ in SCENARIOS],
+                        default=[name for name, _ in SCENARIOS])
+    parser.add_argument('--dataset-rows', type=int, default=5000)
+    parser.add_argument('--page-rows', type=int, default=10000)
+    parser.add_argument('--pages', type=int, default=10)
+    parser.add_argument('--bulk-rows', type=int, default=200000)
+    parser.add_argument('--export-rows', type=int, default=200000)
+    parser.add_argument('--fixtures', help='folder of recorded payloads to serve')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    sizes = {'dataset_rows': args.dataset_rows, 'page_rows': args.page_rows,
+             'pages': args.pages, 'bulk_rows': args.bulk_rows,
+             'export_rows': args.export_rows, 'fixtures': args.fixtures}
+    queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(sizes, queue), daemon=True)
+    server.start()
+    api_base = queue.get(timeout=60)
+
+    # the stub must be reached directly even when a proxy is configured
+    os.environ['NO_PROXY'] = '127.0.0.1'
+    quandl.ApiConfig.api_key = 'benchmark'
+    quandl.ApiConfig.api_base = api_base
+    folder = tempfile.mkdtemp(prefix='quandl-bench-')
+
+    print('%-22s %9s %10s %9s %11s %11s %12s %9s %9s' % (
+        'scenario', 'requests', 'MB', 'rows', 'best (ms)', 'median (ms)', 'rows/s', 'MB/s',
+        'peak MB'))
+    try:
+        for name, scenario in SCENARIOS:
+            if name not in args.scenarios:
+                continue
+            result = measure(scenario, args, api_base, folder)
+            print('%-22s %9.1f %10.2f %9d %11.1f %11.1f %12.0f %9.1f %9.1f' % (
+                name, result['requests'], result['megabytes'], result['rows'],
+                result['best'] * 1000, result['median'] * 1000,
+                result['rows'] / result['median'], result['megabytes'] / result['median'],
+                result['peak_megabytes']))
+    finally:
+        server.terminate()
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Time ``import quandl`` and the first use of its heavier entry points.
+
+Every statement runs in a fresh interpreter, so nothing is already imported,
+and the best of several runs is reported next to the heavy dependencies the
+statement loaded. Run from the repository root with::
+
+    python -m benchmarks.bench_import_time
+"""
+import argparse
+import subprocess
+import sys
+
+HEAVY_MODULES = ['requests', 'pandas', 'numpy', 'dateutil', 'inflection', 'more_itertools']
+
+STATEMENTS = [
+    'import quandl',
+    'import quandl; quandl.ApiConfig.api_key = "key"',
+    'import quandl; quandl.Dataset',
+    'import quandl; quandl.get_table',
+]
+
+SCRIPT = """
+import sys, time
+started = time.perf_counter()
+%s
+elapsed = time.perf_counter() - started
+print(elapsed)
+print(' '.join(m for m in %r if m in sys.modules))
+"""
+
+
+def time_statement(statement):
+    output = subprocess.check_output([sys.executable, '-c', SCRIPT % (statement, HEAVY_MODULES)])
+    elapsed, _, loaded = output.decode('utf-8').partition('\n')
+    return float(elapsed), loaded.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print('%-50s %10s  %s' % ('statement', 'best (ms)', 'heavy modules loaded'))
+    for statement in STATEMENTS:
+        runs = [time_statement(statement) for _ in range(args.repeat)]
+        best = min(elapsed for elapsed, _ in runs)
+        print('%-50s %10.1f  %s' % (statement, best * 1000, runs[0][1] or '-'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Compare the JSON decoders ``JsonUtil`` can use on data response bodies.
+
+Response bodies recorded from the API, the ``*.json`` files of the folder
+given with ``--fixtures`` (the folder ``benchmarks.stub_server`` serves), are
+decoded by the standard library and by orjson and ujson when they are
+installed. Without recorded bodies, payloads shaped like datatable and
+dataset responses are generated with a fixed seed. Run from the repository
+root with::
+
+    python -m benchmarks.bench_json_decoders --fixtures path/to/recorded
+"""
+import argparse
+import json
+import os
+import random
+import timeit
+
+import pandas as pd
+
+DATES = pd.bdate_range('2000-01-03', periods=5000).strftime('%Y-%m-%d')
+
+
+def datatable_payload(rows):
+    generator = random.Random(0)
+    data = list([['TICK%s' % (index % 500), DATES[index % len(DATES)],
+                  round(generator.uniform(1, 500), 4), generator.randint(0, 10 ** 7)]
+                 for index in range(rows)])
+    return json.dumps({
+        'datatable': {
+            'data': data,
+            'columns': [{'name': 'ticker', 'type': 'String'},
+                        {'name': 'date', 'type': 'Date'},
+                        {'name': 'close', 'type': 'BigDecimal(34,12)'},
+                        {'name': 'volume', 'type': 'Integer'}]},
+        'meta': {'next_cursor_id': None}}).encode('utf-8')
+
+
+def dataset_payload(rows):
+    generator = random.Random(0)
+    data = list([[DATES[index % len(DATES)]]
+                 + [round(generator.uniform(1, 500), 4) for _ in range(4)]
+                 + [float(generator.randint(0, 10 ** 7))] for index in range(rows)])
+    return json.dumps({
+        'dataset_data': {
+            'column_names': ['Date', 'Open', 'High', 'Low', 'Close', 'Volume'],
+            'data': data, 'limit': None, 'order': None}}).encode('utf-8')
+
+
+def recorded_payloads(folder):
+    payloads = []
+    for name in sorted(os.listdir(folder)):
+        if name.endswith('.json'):
+            with open(os.path.join(folder, name), 'rb') as f:
+                payloads.append((name[:-len('.json')], f.read()))
+    return payloads
+
+
+def generated_payloads(rows):
+    return list([(name, build(count)) for count in rows
+                 for name, build in (('datatable', datatable_payload),
+                                     ('dataset', dataset_payload))])
+
+
+def rows_of(payload):
+    document = json.loads(payload)
+    for key in ('datatable', 'dataset_data'):
+        if key in document:
+            return len(document[key].get('data', []))
+    return 0
+
+
+def decoders():
+    found = [('json', json.loads)]
+    for name in ('orjson', 'ujson'):
+        try:
+            found.append((name, __import__(name).loads))
+        except ImportError:
+            pass
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--fixtures', help='folder of recorded response bodies to decode')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='rows of the generated payloads, when no fixtures are given')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        payloads = recorded_payloads(args.fixtures)
+        if not payloads:
+            parser.error('no .json files in %s' % args.fixtures)
+    else:
+        payloads = generated_payloads(args.rows)
+
+    available = decoders()
+    print('%20s %8s %10s' % ('payload', 'rows', 'size (kB)')
+          + ''.join('%12s' % ('%s (s)' % name) for name, _ in available))
+    for payload_name, payload in payloads:
+        timings = list([min(timeit.repeat(lambda: loads(payload),
+                                          number=1, repeat=args.repeat))
+                        for _, loads in available])
+        print('%20s %8d %10d' % (payload_name, rows_of(payload), len(payload) // 1024)
+              + ''.join('%12.4f' % timing for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
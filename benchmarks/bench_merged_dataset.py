@@ -0,0 +1,62 @@
+"""Compare how the multiset merge scales with the number of datasets.
+
+The single pass alignment used by ``MergedDataset`` is timed against the
+pairwise ``pd.merge`` loop it replaced. Run from the repository root with::
+
+    python -m benchmarks.bench_merged_dataset
+"""
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from quandl.model.merged_dataset import MergedDataset
+
+
+def build_data_frames(count, rows, columns):
+    random = np.random.RandomState(0)
+    dates = pd.bdate_range('2000-01-03', periods=rows * 2, name='Date')
+    data_frames = []
+    for index in range(count):
+        # every dataset covers a different, partly overlapping, range of dates
+        start = random.randint(0, rows)
+        data_frames.append(pd.DataFrame(
+            random.rand(rows, columns),
+            index=dates[start:start + rows],
+            columns=['DB/CODE%s - column.%s' % (index, x) for x in range(columns)]))
+    return data_frames
+
+
+def pairwise_merge(data_frames):
+    merged_data_frame = pd.DataFrame()
+    for data_frame in data_frames:
+        merged_data_frame = pd.merge(
+            merged_data_frame, data_frame, right_index=True, left_index=True, how='outer')
+    return merged_data_frame
+
+
+def single_pass_merge(data_frames):
+    return MergedDataset([])._merge_data_frames(data_frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[10, 100, 250, 500, 1000])
+    parser.add_argument('--rows', type=int, default=250)
+    parser.add_argument('--columns', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print('%8s %14s %14s %9s' % ('datasets', 'pairwise (s)', 'single (s)', 'speedup'))
+    for count in args.counts:
+        data_frames = build_data_frames(count, args.rows, args.columns)
+        pairwise = min(timeit.repeat(lambda: pairwise_merge(data_frames),
+                                     number=1, repeat=args.repeat))
+        single = min(timeit.repeat(lambda: single_pass_merge(data_frames),
+                                   number=1, repeat=args.repeat))
+        print('%8d %14.4f %14.4f %8.1fx' % (count, pairwise, single, pairwise / single))
+
+
+if __name__ == '__main__':
+    main()
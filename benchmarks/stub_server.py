@@ -0,0 +1,314 @@
+"""A local stand-in for the data API, serving payloads shaped like real ones.
+
+Datasets, paginated datatables, point in time pages, bulk database files and
+table exports, in JSON or CSV, are generated once, deterministically, and then served from
+memory, so a benchmark only measures the client. Payloads recorded from the
+API can be served instead by saving them in a folder given as ``fixtures``,
+named after their route (``dataset_data.json``, ``datatable_page.json``,
+``bulk_download.zip`` or ``export.zip``). Run from the repository root with::
+
+    python -m benchmarks.stub_server --port 8000
+
+and point ``quandl.ApiConfig.api_base`` to ``http://127.0.0.1:8000/api/v3``.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import re
+import threading
+import zipfile
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = '/api/v3'
+STATS_PATH = '/__stats__'
+
+DATASET_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+DATATABLE_COLUMNS = [{'name': 'ticker', 'type': 'String'},
+                     {'name': 'per_end_date', 'type': 'Date'},
+                     {'name': 'per_type', 'type': 'String'},
+                     {'name': 'shares_out', 'type': 'Integer'},
+                     {'name': 'tot_revnu', 'type': 'BigDecimal(16,4)'},
+                     {'name': 'eps_diluted', 'type': 'Double'}]
+TICKERS = ['AAPL', 'MSFT', 'AMZN', 'GOOG', 'META', 'NVDA', 'TSLA', 'JPM', 'XOM', 'WMT']
+
+
+class StubApi(object):
+    """ The payloads served by the stub server, built for the given sizes. """
+
+    def __init__(self, dataset_rows=5000, page_rows=10000, pages=10, bulk_rows=200000,
+                 export_rows=200000, fixtures=None):
+        self.pages = pages
+        self.fixtures = fixtures
+        self._random = random.Random(0)
+        self.dataset_body = self._fixture('dataset_data.json') or \
+            self._dataset_body(dataset_rows)
+        self._page_template = self._fixture('datatable_page.json') or \
+            self._page_template_body(page_rows)
+        self.page_bodies = [self._page_body(index) for index in range(pages)]
+        self.dataset_csv = self._csv(json.loads(self.dataset_body.decode('utf-8'))['dataset_data'],
+                                     'column_names')
+        self.page_csv = self._csv(json.loads(self._page_template.decode('utf-8'))['datatable'],
+                                  'columns')
+        self.bulk_file = self._fixture('bulk_download.zip') or self._bulk_file(bulk_rows)
+        self.export_file = self._fixture('export.zip') or self._export_file(export_rows)
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+    def dataset_metadata(self, database_code, dataset_code):
+        return self._json({'dataset': {
+            'database_code': database_code, 'dataset_code': dataset_code,
+            'name': '%s/%s prices' % (database_code, dataset_code),
+            'column_names': DATASET_COLUMNS, 'frequency': 'daily', 'type': 'Time Series',
+            'oldest_available_date': '2000-01-03', 'newest_available_date': '2020-12-31'}})
+
+    def datatable_metadata(self, vendor_code, datatable_code):
+        return self._json({'datatable': {
+            'vendor_code': vendor_code, 'datatable_code': datatable_code,
+            'name': '%s/%s fundamentals' % (vendor_code, datatable_code),
+            'columns': DATATABLE_COLUMNS, 'filters': ['ticker'], 'primary_key': ['ticker'],
+            'status': {'refreshed_at': '2020-12-31T00:00:00.000Z', 'status': 'ON TIME'}}})
+
+    def page(self, cursor_id):
+        return self.page_bodies[self._page_index(cursor_id)]
+
+    def next_cursor_id(self, cursor_id):
+        index = self._page_index(cursor_id) + 1
+        return str(index) if index < self.pages else None
+
+    def _page_index(self, cursor_id):
+        # cursors are the index of the page they point to
+        index = int(cursor_id) if cursor_id and cursor_id.isdigit() else 0
+        return min(index, self.pages - 1)
+
+    def export_link(self, host, vendor_code, datatable_code):
+        link = 'http://%s%s/files/%s_%s.zip' % (host, API_PREFIX, vendor_code, datatable_code)
+        return self._json({'datatable_bulk_download': {
+            'file': {'status': 'fresh', 'data_snapshot_time': '2020-12-31 00:00:00 UTC',
+                     'link': link},
+            'datatable': {'last_refreshed_time': '2020-12-31 00:00:00 UTC'}}})
+
+    def record(self, size):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+
+    def stats(self):
+        with self._lock:
+            stats = {'requests': self.requests, 'bytes': self.bytes_sent}
+            self.requests = 0
+            self.bytes_sent = 0
+        return self._json(stats)
+
+    def _fixture(self, name):
+        if not self.fixtures:
+            return None
+        path = os.path.join(self.fixtures, name)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _dataset_body(self, rows):
+        values = []
+        day = date(2020, 12, 31)
+        price = 100.0
+        for _ in range(rows):
+            price = max(1.0, price + self._random.uniform(-2, 2))
+            values.append([day.isoformat(), round(price, 2), round(price + 1.5, 2),
+                           round(price - 1.5, 2), round(price + 0.25, 2),
+                           self._random.randint(10 ** 5, 10 ** 7)])
+            day -= timedelta(days=1)
+        return self._json({'dataset_data': {
+            'limit': None, 'transform': None, 'column_index': None,
+            'column_names': DATASET_COLUMNS, 'start_date': values[-1][0],
+            'end_date': values[0][0], 'frequency': 'daily', 'data': values,
+            'collapse': None, 'order': 'desc'}})
+
+    def _datatable_rows(self, rows):
+        start = date(2000, 3, 31)
+        for index in range(rows):
+            # twenty years of quarters for every ticker, then again
+            quarter = index // len(TICKERS) % 80
+            yield [TICKERS[index % len(TICKERS)],
+                   (start + timedelta(days=91 * quarter)).isoformat(),
+                   self._random.choice(['Q', 'A']),
+                   self._random.randint(10 ** 6, 10 ** 10),
+                   round(self._random.uniform(10 ** 3, 10 ** 6), 4),
+                   round(self._random.uniform(-5, 15), 2)]
+
+    def _page_template_body(self, rows):
+        return self._json({'datatable': {'data': list(self._datatable_rows(rows)),
+                                         'columns': DATATABLE_COLUMNS},
+                           'meta': {'next_cursor_id': None}})
+
+    def _page_body(self, index):
+        page = json.loads(self._page_template.decode('utf-8'))
+        page['meta']['next_cursor_id'] = str(index + 1) if index + 1 < self.pages else None
+        return self._json(page)
+
+    def _bulk_file(self, rows):
+        output = io.StringIO()
+        writer = csv.writer(output)
+        day = date(2020, 12, 31)
+        for index in range(rows):
+            ticker = TICKERS[index % len(TICKERS)]
+            if index % len(TICKERS) == 0:
+                day -= timedelta(days=1)
+            writer.writerow([ticker, day.isoformat()] +
+                            [round(self._random.uniform(1, 500), 2) for _ in range(4)] +
+                            [self._random.randint(10 ** 5, 10 ** 7)])
+        return self._zip('WIKI.csv', output.getvalue())
+
+    def _export_file(self, rows):
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow([column['name'] for column in DATATABLE_COLUMNS])
+        writer.writerows(self._datatable_rows(rows))
+        return self._zip('ZACKS_FC.csv', output.getvalue())
+
+    @staticmethod
+    def _csv(data, columns_key):
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow([column['name'] if isinstance(column, dict) else column
+                         for column in data[columns_key]])
+        writer.writerows(data['data'])
+        return output.getvalue().encode('utf-8')
+
+    @staticmethod
+    def _zip(name, content):
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(name, content)
+        return output.getvalue()
+
+    @staticmethod
+    def _json(data):
+        return json.dumps(data).encode('utf-8')
+
+
+class StubApiHandler(BaseHTTPRequestHandler):
+    # keep-alive, so the pooled session of the client is exercised as in production
+    protocol_version = 'HTTP/1.1'
+    # headers and body are written separately, which on a kept-alive connection
+    # would otherwise wait for the delayed ack of the client on every response
+    disable_nagle_algorithm = True
+    ROUTES = [
+        (r'/datasets/([^/]+)/([^/.]+)/metadata(?:\.json)?$', 'dataset_metadata'),
+        (r'/datasets/([^/]+)/([^/.]+)/data\.csv$', 'dataset_csv'),
+        (r'/datasets/([^/]+)/([^/.]+)(?:/data)?(?:\.json)?$', 'dataset_data'),
+        (r'/datatables/([^/]+)/([^/.]+)/metadata(?:\.json)?$', 'datatable_metadata'),
+        (r'/datatables/([^/]+)/([^/.]+)\.json$', 'datatable_export'),
+        (r'/datatables/([^/]+)/([^/.]+)\.csv$', 'datatable_csv'),
+        (r'/datatables/([^/]+)/([^/.]+)$', 'datatable_page'),
+        (r'/pit/([^/]+)/([^/]+)/.+$', 'datatable_page'),
+        (r'/databases/([^/]+)/data(?:\.json)?$', 'bulk_download'),
+        (r'/files/.+\.zip$', 'export_file'),
+    ]
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == STATS_PATH:
+            return self._send(200, 'application/json', self.server.api.stats(), record=False)
+        params = parse_qs(url.query)
+        path = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else url.path
+        for pattern, route in self.ROUTES:
+            match = re.match(pattern, path)
+            if match:
+                return getattr(self, route)(match, params)
+        self._send(404, 'application/json', StubApi._json({'quandl_error': {
+            'code': 'QECx02', 'message': 'No route for %s' % url.path}}))
+
+    def dataset_metadata(self, match, params):
+        self._send(200, 'application/json', self.server.api.dataset_metadata(*match.groups()))
+
+    def dataset_data(self, match, params):
+        self._send(200, 'application/json', self.server.api.dataset_body)
+
+    def dataset_csv(self, match, params):
+        self._send(200, 'text/csv', self.server.api.dataset_csv)
+
+    def datatable_metadata(self, match, params):
+        self._send(200, 'application/json', self.server.api.datatable_metadata(*match.groups()))
+
+    def datatable_export(self, match, params):
+        host = self.headers.get('Host') or '%s:%s' % self.server.server_address
+        self._send(200, 'application/json', self.server.api.export_link(host, *match.groups()))
+
+    def datatable_page(self, match, params):
+        cursor_id = params.get('qopts.cursor_id', [None])[0]
+        self._send(200, 'application/json', self.server.api.page(cursor_id))
+
+    def datatable_csv(self, match, params):
+        # csv pages carry their cursor in a header
+        cursor_id = self.server.api.next_cursor_id(params.get('qopts.cursor_id', [None])[0])
+        self._send(200, 'text/csv', self.server.api.page_csv,
+                   {'Cursor_ID': cursor_id} if cursor_id else None)
+
+    def bulk_download(self, match, params):
+        self._send_file(self.server.api.bulk_file)
+
+    def export_file(self, match, params):
+        self._send_file(self.server.api.export_file)
+
+    def _send_file(self, content):
+        byte_range = re.match(r'bytes=(\d+)-(\d*)$', self.headers.get('Range') or '')
+        if not byte_range:
+            return self._send(200, 'application/zip', content, {'Accept-Ranges': 'bytes'})
+        start = int(byte_range.group(1))
+        end = int(byte_range.group(2)) if byte_range.group(2) else len(content) - 1
+        end = min(end, len(content) - 1)
+        self._send(206, 'application/zip', content[start:end + 1],
+                   {'Accept-Ranges': 'bytes',
+                    'Content-Range': 'bytes %s-%s/%s' % (start, end, len(content))})
+
+    def _send(self, status, content_type, body, headers=None, record=True):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        if record:
+            self.server.api.record(len(body))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubApiServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, api, host='127.0.0.1', port=0):
+        HTTPServer.__init__(self, (host, port), StubApiHandler)
+        self.api = api
+
+    @property
+    def api_base(self):
+        return 'http://%s:%s%s' % (self.server_address[0], self.server_address[1], API_PREFIX)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--fixtures', help='folder of recorded payloads to serve')
+    args = parser.parse_args()
+
+    server = StubApiServer(StubApi(fixtures=args.fixtures), port=args.port)
+    print('Serving %s' % server.api_base)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
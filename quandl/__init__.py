@@ -1,17 +1,61 @@
 # -*- coding: utf-8 -*-
 
+import importlib
+import sys
+import types
+
 from .api_config import ApiConfig, save_key, read_key
 
 from .errors.quandl_error import *
 
-from .model.database import Database
-from .model.dataset import Dataset
-from .model.datatable import Datatable
-from .model.point_in_time import PointInTime
-from .model.data import Data
-from .model.merged_dataset import MergedDataset
-from .get import get
-from .bulkdownload import bulkdownload
-from .export_table import export_table
-from .get_table import get_table
-from .get_point_in_time import get_point_in_time
\ No newline at end of file
+# the models and functions below pull in requests, pandas and numpy, so they
+# are only imported the first time they are used, keeping `import quandl` fast
+_LAZY_ATTRIBUTES = {
+    'Database': '.model.database',
+    'Dataset': '.model.dataset',
+    'Datatable': '.model.datatable',
+    'PointInTime': '.model.point_in_time',
+    'Data': '.model.data',
+    'MergedDataset': '.model.merged_dataset',
+    'MetadataCache': '.utils.metadata_cache_util',
+    'Instrumentation': '.utils.instrumentation_util',
+    'TimingAggregator': '.utils.instrumentation_util',
+    'get': '.get',
+    'sync': '.sync',
+    'bulkdownload': '.bulkdownload',
+    'export_table': '.export_table',
+    'export_tables': '.export_table',
+    'get_table': '.get_table',
+    'get_point_in_time': '.get_point_in_time',
+    'iter_table': '.iter_table',
+    'iter_point_in_time': '.iter_point_in_time'
+}
+
+__all__ = ['ApiConfig', 'save_key', 'read_key',
+           'QuandlError', 'AuthenticationError', 'InvalidRequestError', 'LimitExceededError',
+           'NotFoundError', 'ServiceUnavailableError', 'InternalServerError', 'ForbiddenError',
+           'InvalidDataError', 'ColumnNotFound', 'DeadlineExceededError'] + sorted(_LAZY_ATTRIBUTES)
+
+
+class _LazyModule(types.ModuleType):
+
+    def __getattr__(self, name):
+        if name not in _LAZY_ATTRIBUTES:
+            raise AttributeError("module %r has no attribute %r" % (self.__name__, name))
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], self.__name__)
+        value = getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        # importing a submodule such as quandl.get binds it to the package, which
+        # would hide the function of the same name the package exports
+        if name in _LAZY_ATTRIBUTES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super(_LazyModule, self).__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super(_LazyModule, self).__dir__()) | set(_LAZY_ATTRIBUTES))
+
+
+sys.modules[__name__].__class__ = _LazyModule
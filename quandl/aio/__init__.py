@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+# asyncio versions of the quick methods, requires the optional aiohttp dependency
+
+from .connection import AsyncConnection
+from .operations import AsyncOperation
+from .get import get, dataset_data
+from .get_table import get_table, get_point_in_time
+
+close = AsyncConnection.close_session
@@ -0,0 +1,170 @@
+import asyncio
+import weakref
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from quandl.api_config import ApiConfig
+from quandl.connection import Connection
+from quandl.utils.concurrency_util import AdaptiveConcurrency
+from quandl.utils.deadline_util import Deadline
+from quandl.utils.rate_limit_util import RateLimiter
+
+
+class AsyncConnection(object):
+    """ asyncio counterpart of `Connection`. Requests are sent through one
+    `aiohttp.ClientSession` per event loop and retried with the same settings
+    as the blocking client. Bodies are read in full and handed back as
+    `requests.Response` objects, so responses are decoded and errors raised
+    exactly as they are by `Connection`.
+    """
+    _sessions = weakref.WeakKeyDictionary()
+    # seconds between checks for a free slot while requests are at their bound
+    SLOT_POLL_INTERVAL = 0.05
+
+    @classmethod
+    async def request(cls, http_verb, url, **options):
+        deadline = options.pop('deadline', None)
+        options['headers'] = Connection.request_headers(options.get('headers', {}))
+
+        abs_url = '%s/%s' % (ApiConfig.api_base, url)
+
+        try:
+            return await cls.execute_request(http_verb, abs_url, deadline=deadline, **options)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # a request cut short by the deadline reports how far the call got
+            if deadline is not None and deadline.remaining() <= 0:
+                raise deadline.error()
+            raise
+
+    @classmethod
+    async def execute_request(cls, http_verb, url, deadline=None, **options):
+        session = cls.get_session()
+        retries = ApiConfig.number_of_retries if ApiConfig.use_retries else 0
+        ssl = None if ApiConfig.verify_ssl else False
+
+        attempt = 0
+        while True:
+            # every attempt only gets what is left of the deadline
+            timeout = cls._client_timeout(options.get('timeout'), deadline)
+            max_delay = None if deadline is None else deadline.remaining()
+            delay = RateLimiter.reserve(max_delay=max_delay)
+            if max_delay is not None and delay >= max_delay:
+                raise deadline.error()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            acquired = await cls._acquire_slot(deadline)
+            try:
+                async with session.request(http_verb.upper(), url,
+                                           params=cls._query_params(options.get('params')),
+                                           json=options.get('json'),
+                                           headers=options['headers'],
+                                           ssl=ssl, timeout=timeout) as resp:
+                    body = await resp.read()
+                    response = cls._build_response(resp, body)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= retries:
+                    raise
+                await cls._sleep_before_retry(cls._backoff(attempt), deadline)
+                attempt += 1
+                continue
+            finally:
+                if acquired:
+                    AdaptiveConcurrency.release()
+            AdaptiveConcurrency.record(response.status_code, response.headers)
+
+            if response.status_code in ApiConfig.retry_status_codes and attempt < retries:
+                await cls._sleep_before_retry(cls._backoff(attempt, response), deadline)
+                attempt += 1
+                continue
+
+            if response.status_code < 200 or response.status_code >= 300:
+                Connection.handle_api_error(response)
+            return response
+
+    @classmethod
+    def get_session(cls):
+        loop = asyncio.get_event_loop()
+        session = cls._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=ApiConfig.aio_connection_limit)
+            session = aiohttp.ClientSession(connector=connector)
+            cls._sessions[loop] = session
+        return session
+
+    @classmethod
+    async def close_session(cls):
+        session = cls._sessions.pop(asyncio.get_event_loop(), None)
+        if session is not None:
+            await session.close()
+
+    @staticmethod
+    def _query_params(params):
+        # encode values the way requests does: lists repeat their key, None is dropped
+        if params is None:
+            return None
+        query = []
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)) or hasattr(value, 'tolist'):
+                query.extend([(key, str(x)) for x in value])
+            else:
+                query.append((key, str(value)))
+        return query
+
+    # the event loop keeps running while waiting for a slot of AdaptiveConcurrency
+    @classmethod
+    async def _acquire_slot(cls, deadline=None):
+        while AdaptiveConcurrency.is_enabled():
+            acquired, wait = AdaptiveConcurrency.try_acquire()
+            if acquired:
+                return True
+            if deadline is not None:
+                remaining = deadline.remaining()
+                # a pause lasting past the deadline is not waited out
+                if remaining <= 0 or (wait is not None and wait >= remaining):
+                    raise deadline.error()
+                if wait is None:
+                    wait = min(cls.SLOT_POLL_INTERVAL, remaining)
+            await asyncio.sleep(cls.SLOT_POLL_INTERVAL if wait is None else wait)
+        return False
+
+    @staticmethod
+    async def _sleep_before_retry(wait, deadline=None):
+        # a retry that could not start before the deadline is not made
+        if deadline is not None and wait >= deadline.remaining():
+            raise deadline.error()
+        await asyncio.sleep(wait)
+
+    @staticmethod
+    def _client_timeout(timeout, deadline=None):
+        timeout = Connection.request_timeout(timeout)
+        total = None
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+            total = deadline.remaining()
+        connect, read = Deadline.split_timeout(timeout)
+        return aiohttp.ClientTimeout(total=total, sock_connect=connect, sock_read=read)
+
+    @staticmethod
+    def _backoff(attempt, response=None):
+        if response is not None:
+            retry_after = AdaptiveConcurrency.retry_after(response.headers)
+            # like urllib3, the server's own wait is honored even past the longest backoff
+            if retry_after is not None:
+                return retry_after
+        backoff = ApiConfig.retry_backoff_factor * (2 ** attempt)
+        return min(backoff, ApiConfig.max_wait_between_retries)
+
+    @staticmethod
+    def _build_response(resp, body):
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.url = str(resp.url)
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.encoding = resp.get_encoding() if body else None
+        response._content = body
+        return response
@@ -0,0 +1,71 @@
+import asyncio
+
+from six import string_types
+
+from quandl.errors.quandl_error import InvalidRequestError, NotFoundError, ColumnNotFound
+from quandl.get import _build_merged_dataset_args, _convert_params_to_v3, _parse_dataset_code
+from quandl.message import Message
+from quandl.model.data import Data
+from quandl.model.dataset import Dataset
+from quandl.model.merged_dataset import MergedDataset
+from quandl.utils.api_key_util import ApiKeyUtil
+from .operations import AsyncOperation, pop_request_options
+
+
+async def get(dataset, **kwargs):
+    """Coroutine returning a dataframe of the requested dataset from Quandl.
+    Takes the same arguments as :func:`quandl.get`. The datasets of a multiset
+    call are all requested at once on the running event loop.
+    :returns: :class:`pandas.DataFrame` or :class:`numpy.ndarray`
+    """
+
+    _convert_params_to_v3(kwargs)
+
+    data_format = kwargs.pop('returns', 'pandas')
+    # every dataset is already requested concurrently
+    kwargs.pop('max_workers', None)
+    request_options = pop_request_options(kwargs, 'get(%s)' % (dataset,))
+
+    ApiKeyUtil.init_api_key_from_args(kwargs)
+
+    if isinstance(dataset, string_types):
+        dataset_args = _parse_dataset_code(dataset)
+        if dataset_args['column_index'] is not None:
+            kwargs.update({'column_index': dataset_args['column_index']})
+        data = await dataset_data(Dataset(dataset_args['code']), params=kwargs,
+                                  handle_column_not_found=True, **request_options)
+    elif isinstance(dataset, list):
+        merged_dataset = MergedDataset(_build_merged_dataset_args(dataset))
+        options = dict(request_options, params=kwargs, handle_not_found_error=True,
+                       handle_column_not_found=True)
+        dataset_data_list = await asyncio.gather(*[
+            dataset_data(dataset, **merged_dataset.dataset_data_options(dataset, **options))
+            for dataset in merged_dataset.__dataset_objects__()])
+        data = merged_dataset.merge_data(dataset_data_list, **options)
+    else:
+        raise InvalidRequestError(Message.ERROR_DATASET_FORMAT)
+
+    if data_format == 'numpy':
+        return data.to_numpy()
+    return data.to_pandas()
+
+
+async def dataset_data(dataset, **options):
+    """Awaitable counterpart of :meth:`quandl.model.dataset.Dataset.data`."""
+    handle_not_found_error = options.pop('handle_not_found_error', False)
+    handle_column_not_found = options.pop('handle_column_not_found', False)
+    deadline = options.get('deadline')
+    updated_options = dataset.data_options(**options)
+    try:
+        data = await AsyncOperation.all(Data, **updated_options)
+        if deadline is not None:
+            deadline.advance(datasets=1)
+        return data
+    except NotFoundError:
+        if handle_not_found_error:
+            return dataset.not_found_data()
+        raise
+    except ColumnNotFound:
+        if handle_column_not_found:
+            return dataset.not_found_data()
+        raise
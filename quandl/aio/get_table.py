@@ -0,0 +1,33 @@
+from quandl.get_point_in_time import pop_pit_options
+from quandl.model.datatable import Datatable
+from quandl.model.point_in_time import PointInTime
+from .operations import pop_request_options
+from .pagination import AsyncPaginator
+
+
+async def get_table(datatable_code, **options):
+    """Coroutine counterpart of :func:`quandl.get_table`."""
+    return await _paginated_data_frame(Datatable(datatable_code), options,
+                                       'get_table(%s)' % datatable_code)
+
+
+async def get_point_in_time(datatable_code, **options):
+    """Coroutine counterpart of :func:`quandl.get_point_in_time`."""
+    pit_options = pop_pit_options(options)
+    return await _paginated_data_frame(PointInTime(datatable_code, pit=pit_options), options,
+                                       'get_point_in_time(%s)' % datatable_code)
+
+
+async def _paginated_data_frame(datatable, options, description):
+    paginate = options.pop('paginate', None)
+    # pages are awaited one after the other, there is nothing to prefetch
+    options.pop('prefetch_pages', None)
+    request_options = pop_request_options(options, description)
+    data = None
+    async for next_data in AsyncPaginator(datatable, options, paginate=paginate,
+                                          **request_options):
+        if data is None:
+            data = next_data
+        else:
+            data.extend(next_data)
+    return data.to_pandas()
@@ -0,0 +1,61 @@
+from quandl.errors.quandl_error import InvalidRequestError
+from quandl.message import Message
+from quandl.utils.deadline_util import Deadline
+from quandl.utils.json_util import JsonUtil
+from .connection import AsyncConnection
+
+
+def pop_request_options(options, description):
+    """ Takes the options of a call that are meant for the connection rather
+    than the api out of `options`. The response cache and the csv wire format
+    of the blocking client are not available here.
+    """
+    if 'cache_ttl' in options:
+        raise InvalidRequestError(Message.ERROR_AIO_OPTION_NOT_SUPPORTED % 'cache_ttl')
+    if options.pop('wire_format', 'json') != 'json':
+        raise InvalidRequestError(Message.ERROR_AIO_OPTION_NOT_SUPPORTED % 'wire_format csv')
+    request_options = {}
+    if 'timeout' in options:
+        request_options['timeout'] = options.pop('timeout')
+    deadline = Deadline.start(options.pop('deadline', None), description)
+    if deadline is not None:
+        request_options['deadline'] = deadline
+    return request_options
+
+
+class AsyncOperation(object):
+    """ Awaitable versions of the `GetOperation` and `ListOperation` requests.
+    Models still build their requests and parse the responses, only the
+    request itself goes through `AsyncConnection`.
+    """
+
+    @classmethod
+    async def request_json(cls, http_verb, path, **options):
+        r = await AsyncConnection.request(http_verb, path, **options)
+        return JsonUtil.decode_response(r)
+
+    @classmethod
+    async def get_raw_data(cls, model):
+        if model._raw_data:
+            return model._raw_data
+        http_verb, path, options = model.raw_data_request()
+        if model.load_cached_raw_data(path, options) is not None:
+            return model._raw_data
+        response_data = await cls.request_json(http_verb, path, **options)
+        return model.set_raw_data_from_response(response_data)
+
+    @classmethod
+    async def all(cls, klass, **options):
+        http_verb, path, options = klass.all_request(**options)
+        response_data = await cls.request_json(http_verb, path, **options)
+        return klass.build_list(response_data)
+
+    @classmethod
+    async def request_page(cls, klass, datatable, **options):
+        http_verb, path, options = klass.page_request(datatable, **options)
+        return await cls.request_json(http_verb, path, **options)
+
+    @classmethod
+    async def page(cls, klass, datatable, **options):
+        response_data = await cls.request_page(klass, datatable, **options)
+        return klass.build_page(response_data)
@@ -0,0 +1,35 @@
+import copy
+
+from quandl.model.data import Data
+from quandl.utils.pagination_util import Paginator
+from .operations import AsyncOperation
+
+
+class AsyncPaginator(Paginator):
+    """ Iterates over the cursor pages of a datatable (or point in time) request
+    with `async for`, following the same page limits as `Paginator`.
+    """
+
+    def __aiter__(self):
+        return self._pages()
+
+    async def _pages(self):
+        options = self.options
+        page_count = 0
+        while True:
+            if self.deadline is not None:
+                self.deadline.check()
+            next_options = copy.deepcopy(options)
+            response_data = await AsyncOperation.request_page(
+                Data, self.datatable, params=next_options, **self.request_options)
+            next_cursor_id = response_data['meta']['next_cursor_id']
+            if self.deadline is not None:
+                self.deadline.advance(pages=1, rows=len(response_data['datatable']['data']))
+
+            yield Data.build_page(response_data)
+
+            if not self._has_next_page(page_count, next_cursor_id):
+                break
+
+            page_count = page_count + 1
+            options['qopts.cursor_id'] = next_cursor_id
@@ -7,6 +7,15 @@ class ApiConfig:
     api_base = '{}data.nasdaq.com/api/v3'.format(api_protocol)
     api_version = None  # This is not used but keeping for backwards compatibility
     page_limit = 100
+    # number of pages requested ahead while get_table(paginate=True) builds results
+    prefetch_pages = 1
+    # decode data responses while they download instead of loading the whole body
+    use_streaming_decoder = False
+    # callable used to decode JSON bodies, None picks orjson or ujson when installed
+    json_decoder = None
+    # format dataset data and datatable pages are requested in, 'json' or 'csv'.
+    # CSV is smaller and parsed by pandas, datatables then need a metadata call
+    wire_format = 'json'
 
     use_retries = True
     number_of_retries = 5
@@ -15,6 +24,70 @@ class ApiConfig:
     retry_status_codes = [429] + list(range(500, 512))
     verify_ssl = True
 
+    # seconds to wait for a connection to the api, and for the next bytes of a
+    # response once connected, None waits forever. Calls can override both with
+    # `timeout`, a number of seconds or a (connect, read) tuple
+    connect_timeout = 10
+    read_timeout = 120
+    # seconds a get, get_table or get_point_in_time call may take across every
+    # dataset and page it requests, None for no limit. Calls can set their own
+    # with `deadline`
+    deadline = None
+
+    # size of the keep-alive connection pool shared by all requests
+    pool_connections = 10
+    pool_maxsize = 10
+
+    # directory of the on-disk response cache, None disables caching
+    cache_dir = None
+    # seconds a cached response is used before it is revalidated or fetched again
+    cache_ttl = 24 * 60 * 60
+    # bytes kept in cache_dir before the least recently used responses are removed
+    cache_max_size = 512 * 1024 * 1024
+
+    # seconds the metadata of datasets, databases and datatables is reused by new
+    # model objects of the same code, None disables the cache. Only the most
+    # recently used metadata_cache_max_entries are kept
+    metadata_cache_ttl = None
+    metadata_cache_max_entries = 10000
+
+    # directory of the local dataset copies kept up to date by quandl.sync()
+    sync_dir = os.path.join(os.path.expanduser('~'), '.quandl_sync')
+
+    # connections the quandl.aio client keeps open at once on each event loop
+    aio_connection_limit = 100
+
+    # connections used by bulk downloads from servers accepting byte ranges,
+    # and the size of the parts the file is split into
+    bulk_download_workers = 4
+    bulk_download_part_size = 16 * 1024 * 1024
+
+    # seconds before a table export that is still generating is checked again,
+    # doubling after every check up to Datatable.WAIT_GENERATION_INTERVAL
+    export_poll_interval = 1
+    # table exports polled and downloaded at once by quandl.export_tables()
+    export_workers = 4
+
+    # requests sent to the api per second and per UTC day, unlimited while None.
+    # Processes given the same rate_limit_file share the limits
+    rate_limit_per_second = None
+    rate_limit_per_day = None
+    rate_limit_file = None
+
+    # upper bound of api requests in flight at once across threads, which is
+    # halved whenever the api throttles and grows back while requests succeed.
+    # Unbounded while None
+    max_concurrent_requests = None
+    # longest pause in seconds a Retry-After or rate limit reset holds every caller
+    # back for, however long the api asks for. Unbounded while None
+    max_throttle_pause = 60
+
+    # identical GET requests made at the same time by several threads share one call
+    coalesce_requests = False
+
+    # number of datasets fetched in parallel by a multiset quandl.get() call
+    max_workers = 1
+
 
 def save_key(apikey, filename=None):
     if filename is None:
@@ -1,10 +1,19 @@
+import os
 import re
+import threading
+import time
 
 import requests
-from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 
 from .util import Util
+from .utils.cache_util import ResponseCache
+from .utils.coalesce_util import RequestCoalescer
+from .utils.concurrency_util import AdaptiveConcurrency
+from .utils.instrumentation_util import Instrumentation
+from .utils.json_util import JsonUtil
+from .utils.rate_limit_util import RateLimiter
+from .utils.retry_util import ApiRetry
 from .version import VERSION
 from .api_config import ApiConfig
 from quandl.errors.quandl_error import (
@@ -14,13 +23,49 @@ from quandl.errors.quandl_error import (
 
 
 class Connection:
+    # A single pooled session is shared by every request made in this process so
+    # keep-alive connections are reused across pages and datasets.
+    _session = None
+    _session_pid = None
+    _session_config = None
+    _session_lock = threading.Lock()
+
     @classmethod
     def request(cls, http_verb, url, **options):
-        if 'headers' in options:
-            headers = options['headers']
-        else:
-            headers = {}
+        cache_ttl = options.pop('cache_ttl', None)
+        deadline = options.pop('deadline', None)
+        options['timeout'] = cls.request_timeout(options.get('timeout'), deadline)
+        options['headers'] = cls.request_headers(options.get('headers', {}))
+
+        abs_url = '%s/%s' % (ApiConfig.api_base, url)
+
+        def send():
+            if ResponseCache.is_cacheable(http_verb, **options):
+                return cls.execute_cached_request(http_verb, abs_url, cache_ttl,
+                                                  deadline=deadline, **options)
+            return cls.execute_request(http_verb, abs_url, deadline=deadline, **options)
+
+        try:
+            if RequestCoalescer.is_coalescable(http_verb, **options):
+                return RequestCoalescer.request(
+                    RequestCoalescer.key(http_verb, abs_url, **options), send, deadline)
+            return send()
+        except requests.exceptions.RequestException:
+            # a request cut short by the deadline reports how far the call got
+            if deadline is not None and deadline.remaining() <= 0:
+                raise deadline.error()
+            raise
 
+    @classmethod
+    def request_timeout(cls, timeout=None, deadline=None):
+        if timeout is None:
+            timeout = (ApiConfig.connect_timeout, ApiConfig.read_timeout)
+        if deadline is not None:
+            return deadline.request_timeout(timeout)
+        return timeout
+
+    @classmethod
+    def request_headers(cls, headers):
         accept_value = 'application/json'
         if ApiConfig.api_version:
             accept_value += ", application/vnd.quandl+json;version=%s" % ApiConfig.api_version
@@ -30,22 +75,53 @@ class Connection:
                                        'request-source-version': VERSION}, headers)
         if ApiConfig.api_key:
             headers = Util.merge_to_dicts({'x-api-token': ApiConfig.api_key}, headers)
+        return headers
 
-        options['headers'] = headers
-
-        abs_url = '%s/%s' % (ApiConfig.api_base, url)
-
-        return cls.execute_request(http_verb, abs_url, **options)
+    @classmethod
+    def execute_cached_request(cls, http_verb, url, cache_ttl=None, deadline=None, **options):
+        if cache_ttl is None:
+            cache_ttl = ApiConfig.cache_ttl
+        key = ResponseCache.key(http_verb, url, options.get('params'))
+
+        cached = ResponseCache.load(key)
+        if cached is not None:
+            meta, body = cached
+            if ResponseCache.is_fresh(meta, cache_ttl):
+                return ResponseCache.build_response(meta, body)
+            options['headers'] = Util.merge_to_dicts(options.get('headers', {}),
+                                                     ResponseCache.validators(meta))
+
+        response = cls.execute_request(http_verb, url, deadline=deadline, **options)
+        if response.status_code == 304 and cached is not None:
+            meta = ResponseCache.revalidated(key, meta, body, response)
+            return ResponseCache.build_response(meta, body)
+
+        ResponseCache.store(key, response, options.get('params'))
+        return response
 
     @classmethod
-    def execute_request(cls, http_verb, url, **options):
+    def execute_request(cls, http_verb, url, deadline=None, **options):
         session = cls.get_session()
+        rate_limit_wait = RateLimiter.wait(deadline)
+        queued = Instrumentation.start()
 
         try:
-            response = session.request(method=http_verb,
-                                       url=url,
-                                       verify=ApiConfig.verify_ssl,
-                                       **options)
+            with AdaptiveConcurrency.slot(deadline), ApiRetry.within(deadline) as attempts:
+                # the request is timed from when it holds a slot, waits are reported apart
+                started = Instrumentation.start()
+                response = session.request(method=http_verb,
+                                           url=url,
+                                           verify=ApiConfig.verify_ssl,
+                                           **options)
+            AdaptiveConcurrency.record(response.status_code, response.headers)
+            if started is not None:
+                fields = cls.request_event_fields(http_verb, url, response, started, attempts)
+                Instrumentation.finish('request', started,
+                                       rate_limit_wait_seconds=rate_limit_wait,
+                                       slot_wait_seconds=started - queued, **fields)
+            # only revalidation requests made for the response cache come back unmodified
+            if response.status_code == 304:
+                return response
             if response.status_code < 200 or response.status_code >= 300:
                 cls.handle_api_error(response)
             else:
@@ -55,33 +131,87 @@ class Connection:
                 cls.handle_api_error(e.response)
             raise e
 
+    @classmethod
+    def request_event_fields(cls, http_verb, url, response, started, attempts):
+        # the body of a streamed response is only read later by the caller
+        streamed = not response._content_consumed
+        # requests times every attempt up to the headers of the last one
+        headers_at = started + response.elapsed.total_seconds()
+        last_attempt_at = attempts['last_attempt_at'] or started
+        download_seconds = None if streamed else max(0.0, time.perf_counter() - headers_at)
+        return {'method': http_verb, 'url': url, 'status': response.status_code,
+                'bytes': None if streamed else len(response.content or b''),
+                'retries': attempts['retries'],
+                'retry_wait_seconds': attempts['retry_wait_seconds'],
+                'ttfb_seconds': max(0.0, headers_at - last_attempt_at),
+                'download_seconds': download_seconds}
+
     @classmethod
     def get_session(cls):
+        session_config = cls._get_session_config()
+        with cls._session_lock:
+            # never reuse sockets inherited from a parent process after a fork
+            if cls._session is not None and cls._session_pid != os.getpid():
+                cls._session = None
+            if cls._session is not None and cls._session_config != session_config:
+                cls._session.close()
+                cls._session = None
+            if cls._session is None:
+                cls._session = cls._build_session()
+                cls._session_pid = os.getpid()
+                cls._session_config = session_config
+            return cls._session
+
+    @classmethod
+    def close_session(cls):
+        with cls._session_lock:
+            if cls._session is not None and cls._session_pid == os.getpid():
+                cls._session.close()
+            cls._session = None
+            cls._session_pid = None
+            cls._session_config = None
+
+    @classmethod
+    def _build_session(cls):
         session = requests.Session()
-        adapter = HTTPAdapter(max_retries=cls.get_retries())
+        adapter = HTTPAdapter(max_retries=cls.get_retries(),
+                              pool_connections=ApiConfig.pool_connections,
+                              pool_maxsize=ApiConfig.pool_maxsize)
         session.mount(ApiConfig.api_protocol, adapter)
 
         return session
 
+    @classmethod
+    def _get_session_config(cls):
+        # the session is rebuilt whenever any setting used to build it changes
+        return (ApiConfig.api_protocol,
+                ApiConfig.use_retries,
+                ApiConfig.number_of_retries,
+                ApiConfig.retry_backoff_factor,
+                ApiConfig.max_wait_between_retries,
+                tuple(ApiConfig.retry_status_codes),
+                ApiConfig.pool_connections,
+                ApiConfig.pool_maxsize)
+
     @classmethod
     def get_retries(cls):
         if not ApiConfig.use_retries:
-            return Retry(total=0)
+            return ApiRetry(total=0)
 
-        Retry.BACKOFF_MAX = ApiConfig.max_wait_between_retries
-        retries = Retry(total=ApiConfig.number_of_retries,
-                        connect=ApiConfig.number_of_retries,
-                        read=ApiConfig.number_of_retries,
-                        status_forcelist=ApiConfig.retry_status_codes,
-                        backoff_factor=ApiConfig.retry_backoff_factor,
-                        raise_on_status=False)
+        retries = ApiRetry(total=ApiConfig.number_of_retries,
+                           connect=ApiConfig.number_of_retries,
+                           read=ApiConfig.number_of_retries,
+                           status_forcelist=ApiConfig.retry_status_codes,
+                           backoff_factor=ApiConfig.retry_backoff_factor,
+                           backoff_max=ApiConfig.max_wait_between_retries,
+                           raise_on_status=False)
 
         return retries
 
     @classmethod
     def parse(cls, response):
         try:
-            return response.json()
+            return JsonUtil.decode_response(response)
         except ValueError:
             raise QuandlError(http_status=response.status_code, http_body=response.text)
 
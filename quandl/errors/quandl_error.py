@@ -37,7 +37,12 @@ class InvalidRequestError(QuandlError):
 
 
 class LimitExceededError(QuandlError):
-    pass
+
+    @property
+    def retry_after(self):
+        # seconds the api asked to wait before sending the next request, if it said
+        from quandl.utils.concurrency_util import AdaptiveConcurrency
+        return AdaptiveConcurrency.retry_after(self.http_headers)
 
 
 class NotFoundError(QuandlError):
@@ -62,3 +67,12 @@ class InvalidDataError(QuandlError):
 
 class ColumnNotFound(QuandlError):
     pass
+
+
+class DeadlineExceededError(QuandlError):
+
+    def __init__(self, quandl_message=None, deadline=None, progress=None, **kwargs):
+        super(DeadlineExceededError, self).__init__(quandl_message, **kwargs)
+        # the seconds the call was given and what it had received by then
+        self.deadline = deadline
+        self.progress = progress if progress is not None else {}
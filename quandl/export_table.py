@@ -1,5 +1,9 @@
-from quandl.errors.quandl_error import InvalidRequestError
+import os
+
+from quandl.errors.quandl_error import InvalidRequestError, QuandlError
 from .utils.api_key_util import ApiKeyUtil
+from .utils.export_manager_util import ExportManager
+from .utils.table_writer_util import ParquetTableWriter
 from .model.datatable import Datatable
 from .message import Message
 
@@ -10,6 +14,10 @@ def export_table(datatable_code, **kwargs):
     :param str filename: The filename for the download. \
     If not specified, will download to the current working directory
     :param str api_key: Most databases require api_key for bulk download
+    :param str returns: `file` to save the zip file, `iterator` for a generator of \
+    dataframes read while the file downloads, or `parquet` to write the table to \
+    filename as a Parquet file. Default: `file`
+    :param int chunksize: Rows per dataframe for the iterator and parquet returns
     """
 
     # discourage users from using authtoken
@@ -19,4 +27,67 @@ def export_table(datatable_code, **kwargs):
     ApiKeyUtil.init_api_key_from_args(kwargs)
 
     filename = kwargs.pop('filename', '.')
-    return Datatable(datatable_code).download_file(filename, **kwargs)
+    returns = kwargs.pop('returns', 'file')
+    chunksize = kwargs.pop('chunksize', None)
+    datatable = Datatable(datatable_code)
+    if returns == 'iterator':
+        return datatable.export_data_frames(chunksize=chunksize, **kwargs)
+    elif returns == 'parquet':
+        return _export_parquet(datatable, filename, chunksize, kwargs)
+    elif returns != 'file':
+        raise InvalidRequestError(Message.ERROR_EXPORT_RETURNS % returns)
+    return datatable.download_file(filename, **kwargs)
+
+
+def export_tables(datatable_codes, **kwargs):
+    """Downloads several entire tables as zip files at once.
+    Every export is requested straight away and downloaded as soon as its file is
+    generated, instead of one table after another.
+    :param datatable_codes: A list of datatable codes, or a dict of datatable codes \
+    to the filters of each table
+    :param str filename: The folder the zip files are downloaded to. \
+    If not specified, will download to the current working directory
+    :param int max_workers: Exports polled and downloaded at once. \
+    Default: `ApiConfig.export_workers`
+    :param str api_key: Most databases require api_key for bulk download
+    Other params are filters applied to every table.
+    :returns: list of :class:`quandl.utils.export_manager_util.ExportJob` with the \
+    path and timings of each table. The first failed export is raised once the \
+    others are finished
+    """
+    if 'authtoken' in kwargs:
+        raise InvalidRequestError(Message.ERROR_AUTHTOKEN_NOT_SUPPORTED)
+
+    ApiKeyUtil.init_api_key_from_args(kwargs)
+
+    folder = kwargs.pop('filename', '.')
+    if not isinstance(folder, str) or not os.path.isdir(folder):
+        raise QuandlError(Message.ERROR_FOLDER_ISSUE)
+
+    manager = ExportManager(folder, max_workers=kwargs.pop('max_workers', None))
+    if not isinstance(datatable_codes, dict):
+        datatable_codes = dict([(code, {}) for code in datatable_codes])
+    for datatable_code, params in datatable_codes.items():
+        manager.submit(datatable_code, **dict(kwargs, **params))
+
+    jobs = manager.run()
+    for job in jobs:
+        if job.error is not None:
+            raise job.error
+    return jobs
+
+
+def _export_parquet(datatable, filename, chunksize, params):
+    path = filename
+    if os.path.isdir(filename):
+        path = os.path.join(filename, '%s.parquet' % datatable.code.replace('/', '_'))
+
+    writer = ParquetTableWriter(path)
+    try:
+        column_types = datatable.export_column_types()
+        for data_frame in datatable.export_data_frames(chunksize=chunksize, **params):
+            writer.write_data_frame(data_frame, [column_types.get(name, 'String')
+                                                 for name in data_frame.columns])
+    finally:
+        writer.close()
+    return path
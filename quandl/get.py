@@ -2,6 +2,7 @@ from quandl.errors.quandl_error import InvalidRequestError
 from .model.dataset import Dataset
 from .model.merged_dataset import MergedDataset
 from .utils.api_key_util import ApiKeyUtil
+from .utils.deadline_util import Deadline
 from .message import Message
 from six import string_types
 import warnings
@@ -24,6 +25,16 @@ def get(dataset, **kwargs):
     :param str order: options are asc, desc. Default: `asc`
     :param str returns: specify what format you wish your dataset returned as,
         either `numpy` for a numpy ndarray or `pandas`. Default: `pandas`
+    :param int max_workers: Number of datasets fetched in parallel when a list
+        of codes is requested. Default: `ApiConfig.max_workers`
+    :param int cache_ttl: Seconds a cached response is reused when
+        `ApiConfig.cache_dir` is set. Default: `ApiConfig.cache_ttl`
+    :param str wire_format: `csv` to download the data as CSV parsed by pandas, smaller
+        and faster to decode than the default `json`. Default: `ApiConfig.wire_format`
+    :param timeout: Seconds to wait for a connection and for response data, or
+        a (connect, read) tuple. Default: `ApiConfig.connect_timeout`, `ApiConfig.read_timeout`
+    :param float deadline: Seconds the whole call may take across every dataset, after
+        which `DeadlineExceededError` is raised. Default: `ApiConfig.deadline`
     :returns: :class:`pandas.DataFrame` or :class:`numpy.ndarray`
     Note that Pandas expects timeseries data to be sorted ascending for most
     timeseries functionality to work.
@@ -34,6 +45,17 @@ def get(dataset, **kwargs):
     _convert_params_to_v3(kwargs)
 
     data_format = kwargs.pop('returns', 'pandas')
+    max_workers = kwargs.pop('max_workers', None)
+    data_options = {}
+    if 'cache_ttl' in kwargs:
+        data_options['cache_ttl'] = kwargs.pop('cache_ttl')
+    if 'timeout' in kwargs:
+        data_options['timeout'] = kwargs.pop('timeout')
+    if 'wire_format' in kwargs:
+        data_options['wire_format'] = kwargs.pop('wire_format')
+    deadline = Deadline.start(kwargs.pop('deadline', None), 'get(%s)' % (dataset,))
+    if deadline is not None:
+        data_options['deadline'] = deadline
 
     ApiKeyUtil.init_api_key_from_args(kwargs)
 
@@ -45,15 +67,20 @@ def get(dataset, **kwargs):
         dataset_args = _parse_dataset_code(dataset)
         if dataset_args['column_index'] is not None:
             kwargs.update({'column_index': dataset_args['column_index']})
-        data = Dataset(dataset_args['code']).data(params=kwargs, handle_column_not_found=True)
+        data = Dataset(dataset_args['code']).data(params=kwargs, handle_column_not_found=True,
+                                                  **data_options)
     # Array
     elif isinstance(dataset, list):
         args = _build_merged_dataset_args(dataset)
         # handle_not_found_error if set to True will add an empty DataFrame
         # for a non-existent dataset instead of raising an error
+        merged_options = dict(data_options)
+        if max_workers is not None:
+            merged_options['max_workers'] = max_workers
         data = MergedDataset(args).data(params=kwargs,
                                         handle_not_found_error=True,
-                                        handle_column_not_found=True)
+                                        handle_column_not_found=True,
+                                        **merged_options)
     # If wrong format
     else:
         raise InvalidRequestError(Message.ERROR_DATASET_FORMAT)
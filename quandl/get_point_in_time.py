@@ -1,55 +1,51 @@
 from quandl.model.point_in_time import PointInTime
-from quandl.errors.quandl_error import LimitExceededError
-from .api_config import ApiConfig
-from .message import Message
 from quandl.errors.quandl_error import InvalidRequestError
-import warnings
-import copy
+from .utils.deadline_util import Deadline
+from .utils.pagination_util import Paginator
+from .utils.table_writer_util import TableWriter
 
 
 def get_point_in_time(datatable_code, **options):
-    validate_pit_options(options)
-    pit_options = {}
-
-    # Remove the PIT params/keys from the options to not send it as a query params
-    for k in ['interval', 'date', 'start_date', 'end_date']:
-        if k in options.keys():
-            pit_options[k] = options.pop(k)
+    pit_options = pop_pit_options(options)
 
     if 'paginate' in options.keys():
         paginate = options.pop('paginate')
     else:
         paginate = None
 
-    data = None
-    page_count = 0
-    while True:
-        next_options = copy.deepcopy(options)
-        next_data = PointInTime(datatable_code, pit=pit_options).data(params=next_options)
+    prefetch_pages = options.pop('prefetch_pages', None)
+    cache_ttl = options.pop('cache_ttl', None)
+    timeout = options.pop('timeout', None)
+    deadline = Deadline.start(options.pop('deadline', None),
+                              'get_point_in_time(%s)' % datatable_code)
+    output = options.pop('output', 'pandas')
+    path = options.pop('path', None)
+
+    pages = Paginator(PointInTime(datatable_code, pit=pit_options), options,
+                      paginate=paginate, prefetch_pages=prefetch_pages,
+                      cache_ttl=cache_ttl, timeout=timeout, deadline=deadline)
+    # other outputs write every page to path as it arrives and return the path
+    if output != 'pandas':
+        return TableWriter.write_pages(output, path, pages)
 
+    data = None
+    for next_data in pages:
         if data is None:
             data = next_data
         else:
             data.extend(next_data)
+    return data.to_pandas()
 
-        if page_count >= ApiConfig.page_limit:
-            raise LimitExceededError(
-                Message.WARN_DATA_LIMIT_EXCEEDED % (datatable_code,
-                                                    ApiConfig.api_key
-                                                    )
-            )
-
-        next_cursor_id = next_data.meta['next_cursor_id']
 
-        if next_cursor_id is None:
-            break
-        elif paginate is not True and next_cursor_id is not None:
-            warnings.warn(Message.WARN_PAGE_LIMIT_EXCEEDED, UserWarning)
-            break
+def pop_pit_options(options):
+    validate_pit_options(options)
+    pit_options = {}
 
-        page_count = page_count + 1
-        options['qopts.cursor_id'] = next_cursor_id
-    return data.to_pandas()
+    # Remove the PIT params/keys from the options to not send it as a query params
+    for k in ['interval', 'date', 'start_date', 'end_date']:
+        if k in options.keys():
+            pit_options[k] = options.pop(k)
+    return pit_options
 
 
 def validate_pit_options(options):
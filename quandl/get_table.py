@@ -1,9 +1,7 @@
 from quandl.model.datatable import Datatable
-from quandl.errors.quandl_error import LimitExceededError
-from .api_config import ApiConfig
-from .message import Message
-import warnings
-import copy
+from .utils.deadline_util import Deadline
+from .utils.pagination_util import Paginator
+from .utils.table_writer_util import TableWriter
 
 
 def get_table(datatable_code, **options):
@@ -11,33 +9,27 @@ def get_table(datatable_code, **options):
         paginate = options.pop('paginate')
     else:
         paginate = None
+    prefetch_pages = options.pop('prefetch_pages', None)
+    cache_ttl = options.pop('cache_ttl', None)
+    timeout = options.pop('timeout', None)
+    wire_format = options.pop('wire_format', None)
+    deadline = Deadline.start(options.pop('deadline', None),
+                              'get_table(%s)' % datatable_code)
+    output = options.pop('output', 'pandas')
+    path = options.pop('path', None)
+
+    pages = Paginator(Datatable(datatable_code), options,
+                      paginate=paginate, prefetch_pages=prefetch_pages,
+                      cache_ttl=cache_ttl, timeout=timeout, deadline=deadline,
+                      wire_format=wire_format)
+    # other outputs write every page to path as it arrives and return the path
+    if output != 'pandas':
+        return TableWriter.write_pages(output, path, pages)
 
     data = None
-    page_count = 0
-    while True:
-        next_options = copy.deepcopy(options)
-        next_data = Datatable(datatable_code).data(params=next_options)
-
+    for next_data in pages:
         if data is None:
             data = next_data
         else:
             data.extend(next_data)
-
-        if page_count >= ApiConfig.page_limit:
-            raise LimitExceededError(
-                Message.WARN_DATA_LIMIT_EXCEEDED % (datatable_code,
-                                                    ApiConfig.api_key
-                                                    )
-            )
-
-        next_cursor_id = next_data.meta['next_cursor_id']
-
-        if next_cursor_id is None:
-            break
-        elif paginate is not True and next_cursor_id is not None:
-            warnings.warn(Message.WARN_PAGE_LIMIT_EXCEEDED, UserWarning)
-            break
-
-        page_count = page_count + 1
-        options['qopts.cursor_id'] = next_cursor_id
     return data.to_pandas()
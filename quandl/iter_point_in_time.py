@@ -0,0 +1,20 @@
+from quandl.model.point_in_time import PointInTime
+from .get_point_in_time import pop_pit_options
+from .utils.deadline_util import Deadline
+from .utils.pagination_util import Paginator
+
+
+def iter_point_in_time(datatable_code, **options):
+    """Return a generator of dataframes, one per page of the requested point in
+    time data. Takes the same options as `get_point_in_time` and pages through
+    the results like `iter_table`.
+    """
+    pit_options = pop_pit_options(options)
+    prefetch_pages = options.pop('prefetch_pages', None)
+    cache_ttl = options.pop('cache_ttl', None)
+    timeout = options.pop('timeout', None)
+    deadline = Deadline.start(options.pop('deadline', None),
+                              'iter_point_in_time(%s)' % datatable_code)
+    return Paginator(PointInTime(datatable_code, pit=pit_options), options, paginate=True,
+                     prefetch_pages=prefetch_pages, cache_ttl=cache_ttl,
+                     timeout=timeout, deadline=deadline).data_frames()
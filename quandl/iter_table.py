@@ -0,0 +1,23 @@
+from quandl.model.datatable import Datatable
+from .utils.deadline_util import Deadline
+from .utils.pagination_util import Paginator
+
+
+def iter_table(datatable_code, **options):
+    """Return a generator of dataframes, one per page of the requested datatable.
+    Every cursor page is requested, with the next pages prefetched while the
+    current one is processed, so only a few pages are held in memory at once.
+    Takes the same filters as `get_table`, plus `prefetch_pages`, `cache_ttl`,
+    `wire_format`, `timeout` and `deadline`, which counts from this call and so
+    includes the time spent processing the pages already yielded.
+    Raises `LimitExceededError` after `ApiConfig.page_limit` pages like `get_table`.
+    """
+    prefetch_pages = options.pop('prefetch_pages', None)
+    cache_ttl = options.pop('cache_ttl', None)
+    timeout = options.pop('timeout', None)
+    wire_format = options.pop('wire_format', None)
+    deadline = Deadline.start(options.pop('deadline', None), 'iter_table(%s)' % datatable_code)
+    return Paginator(Datatable(datatable_code), options, paginate=True,
+                     prefetch_pages=prefetch_pages, cache_ttl=cache_ttl,
+                     timeout=timeout, deadline=deadline,
+                     wire_format=wire_format).data_frames()
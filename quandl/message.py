@@ -21,6 +21,17 @@ class Message:
     ERROR_REQUESTED_INDEX_OUT_OF_RANGE = '%s : The requested index %s is out of range. The \
         minimum index is 1 and the maximum index is %s'
     ERROR_REQUESTED_COLUMN_NOT_EXIST = 'Requested column index %s does not exist'
+    ERROR_OUTPUT_FORMAT = 'Unknown output %s. Supported outputs are pandas, %s'
+    ERROR_OUTPUT_PATH_REQUIRED = 'A path is required to write the %s output to'
+    ERROR_RANGE_NOT_SATISFIED = 'The server did not return the requested %s of the file'
+    ERROR_RANGE_INCOMPLETE = 'The server returned %s of the %s bytes requested by %s'
+    ERROR_EXPORT_RETURNS = 'Unknown returns %s. Supported values are file, iterator, parquet'
+    ERROR_WIRE_FORMAT = 'Unknown wire_format %s. Supported values are json, csv'
+    ERROR_AIO_OPTION_NOT_SUPPORTED = '%s is not supported by quandl.aio'
+    ERROR_DEADLINE_EXCEEDED = '%s did not finish within its deadline of %s seconds, \
+        having received %s'
+    ERROR_OUTPUT_REQUIRES_PYARROW = 'Writing parquet output requires pyarrow, \
+        install it with: pip install pyarrow'
 
     WARN_DATA_LIMIT_EXCEEDED = 'This call exceeds the amount of data that quandl.get_table() allows. \
         Please use the following link in your browser, which will download the full results as \
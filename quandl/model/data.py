@@ -8,7 +8,10 @@ class Data(DataListOperation, DataMixin, ModelBase):
 
     def __init__(self, data, **options):
         self.meta = options['meta']
-        self._raw_data = Util.convert_to_dates(data)
+        # rows built by a DataList already have their date columns converted
+        if options.get('convert_dates', True):
+            data = Util.convert_to_dates(data)
+        self._raw_data = data
 
         # Optimization for when a list of data points are created from a
         # dataset (via the model_list class)
@@ -1,6 +1,212 @@
+from array import array
+
+import six
+from six.moves import zip_longest
+
+from quandl.util import Util
 from .model_list import ModelList
 from .data_mixin import DataMixin
 
 
+class DataColumns(object):
+    """ Column buffers for the rows of a data response, filled one row at a time
+    while the response is decoded. Columns that start with numbers are kept in
+    compact arrays and fall back to lists when a null or a value that does not
+    fit is found.
+    """
+
+    def __init__(self):
+        self.columns = []
+        self.row_count = 0
+
+    def append_row(self, row):
+        if len(row) != len(self.columns):
+            # rows of a different width are padded with None like pandas does
+            while len(self.columns) < len(row):
+                self.columns.append(self._new_column(row[len(self.columns)]))
+            row = list(row) + [None] * (len(self.columns) - len(row))
+        for index, value in enumerate(row):
+            try:
+                self.columns[index].append(value)
+            except (TypeError, OverflowError):
+                self.columns[index] = self._widen_column(self.columns[index], value)
+        self.row_count += 1
+
+    def _new_column(self, first_value):
+        column = [None] * self.row_count
+        if self.row_count == 0 and not isinstance(first_value, bool):
+            if isinstance(first_value, float):
+                column = array('d')
+            elif isinstance(first_value, six.integer_types):
+                column = array('q')
+        return column
+
+    @staticmethod
+    def _widen_column(column, value):
+        # nulls and numbers the array cannot hold exactly turn the column into a
+        # plain list, so rows read back the same values the JSON decoder gives
+        column = list(column)
+        column.append(value)
+        return column
+
+    def __getitem__(self, index):
+        return list([column[index] for column in self.columns])
+
+    def __len__(self):
+        return self.row_count
+
+
+class ArrayChunks(object):
+    """ The numpy or pandas arrays of a column decoded from several CSV pages,
+    joined once when the column is read rather than again for every page.
+    """
+
+    def __init__(self, *chunks):
+        self.chunks = list(chunks)
+
+    def append(self, chunk):
+        self.chunks.append(chunk)
+
+    def join(self):
+        if len(self.chunks) > 1:
+            import pandas as pd
+            values = pd.concat([pd.Series(chunk) for chunk in self.chunks], ignore_index=True)
+            if pd.api.types.is_extension_array_dtype(values.dtype):
+                self.chunks = [values.array]
+            else:
+                self.chunks = [values.to_numpy()]
+        return self.chunks[0]
+
+
 class DataList(DataMixin, ModelList):
-    pass
+    """ Holds the rows of a data response column by column. DataFrames are built
+    straight from the columns and the per row `Data` objects are only created
+    when the list is indexed or iterated over. Date columns are converted as a
+    whole rather than cell by cell.
+    """
+
+    def __init__(self, klass, values, meta):
+        self.klass = klass
+        self.meta = self.convert_meta(meta)
+        self._converted_column_names = Util.convert_column_names(self.meta)
+        self._values = None
+        self._row_count = 0
+        self._columns = [[] for _ in self._meta_column_names()]
+        self._extend_rows(values)
+
+    @property
+    def values(self):
+        if self._values is None:
+            self._values = list([self.klass(
+                row,
+                meta=self.meta,
+                converted_column_names=self._converted_column_names,
+                convert_dates=False
+            ) for row in self.to_list()])
+        return self._values
+
+    def extend(self, other):
+        if isinstance(other, DataList):
+            self._extend_columns(other._joined_columns(), other._row_count)
+        else:
+            self._extend_rows([x.to_list() for x in other])
+
+    def to_list(self):
+        columns = self._joined_columns()
+        for index in self._date_column_indexes():
+            if index < len(columns):
+                columns[index] = [Util.parse_date(x) for x in columns[index]]
+        for index in self._datetime_column_indexes():
+            if index < len(columns):
+                columns[index] = [Util.convert_to_date(x) for x in columns[index]]
+        return list([list(row) for row in zip(*columns)])
+
+    def __getitem__(self, k):
+        return self.values[k]
+
+    def __len__(self):
+        return self._row_count
+
+    def _build_data_frame(self, columns):
+        import pandas as pd
+        if self._row_count == 0:
+            return pd.DataFrame(data=[], columns=columns)
+
+        # key the columns by position so duplicate column names are kept
+        columns_values = self._joined_columns()
+        df = pd.DataFrame(dict(enumerate(columns_values)), columns=range(len(columns_values)))
+        df.columns = columns
+        return df
+
+    # dates are kept as they were received until the list is converted, using the
+    # datatable column types or the leading date column of dataset responses
+    def _date_column_indexes(self):
+        if 'column_types' in self.meta.keys():
+            return [index for index, column_type in enumerate(self.meta['column_types'])
+                    if Util.normalize_column_type(column_type) == 'date']
+        elif 'column_names' in self.meta.keys():
+            return [0]
+        return []
+
+    def _datetime_column_indexes(self):
+        return [index for index, column_type in enumerate(self.meta.get('column_types', []))
+                if Util.normalize_column_type(column_type) == 'datetime']
+
+    def _meta_column_names(self):
+        if 'columns' in self.meta.keys():
+            return self.meta['columns']
+        return self.meta.get('column_names', [])
+
+    def _joined_columns(self):
+        return list([column.join() if isinstance(column, ArrayChunks) else column
+                     for column in self._columns])
+
+    def _extend_rows(self, rows):
+        if isinstance(rows, DataColumns):
+            # the decoded buffers are taken over rather than copied
+            self._extend_columns(rows.columns, rows.row_count, copy=False)
+            return
+        rows = list(rows)
+        if not rows:
+            return
+        # rows shorter than the others are padded with None like pandas does
+        columns = list([list(column) for column in zip_longest(*rows)])
+        self._extend_columns(columns, len(rows), copy=False)
+
+    def _extend_columns(self, columns, row_count, copy=True):
+        if row_count == 0:
+            return
+        if self._row_count == 0:
+            self._columns = list([column[:] if copy else column for column in columns])
+        else:
+            width = max(len(self._columns), len(columns))
+            for index in range(width):
+                if index >= len(self._columns):
+                    self._columns.append([None] * self._row_count)
+                if index < len(columns):
+                    new_values = columns[index]
+                else:
+                    new_values = [None] * row_count
+                self._columns[index] = self._concat_column(self._columns[index], new_values)
+        self._row_count += row_count
+        self._values = None
+
+    @staticmethod
+    def _concat_column(column, new_values):
+        if isinstance(column, array):
+            if isinstance(new_values, array) and new_values.typecode == column.typecode:
+                column.extend(new_values)
+                return column
+            column = list(column)
+        elif isinstance(column, ArrayChunks):
+            if hasattr(new_values, 'dtype'):
+                column.append(new_values)
+                return column
+            column = list(column.join())
+        elif not isinstance(column, list):
+            # columns decoded from csv are numpy or pandas arrays
+            if hasattr(new_values, 'dtype'):
+                return ArrayChunks(column, new_values)
+            column = list(column)
+        column.extend(new_values)
+        return column
@@ -1,24 +1,27 @@
-import pandas as pd
 from quandl.errors.quandl_error import ColumnNotFound
+from quandl.util import Util
+from quandl.utils.instrumentation_util import Instrumentation
 
 
 class DataMixin(object):
     # DataFrame will respect order of input list of list
     def to_pandas(self, keep_column_indexes=[]):
-        data = self.to_list()
-
-        # ensure pandas gets a list of lists
-        if data and isinstance(data, list) and not isinstance(data[0], list):
-            data = [data]
+        started = Instrumentation.start()
         if 'columns' in self.meta.keys():
-            df = pd.DataFrame(data=data, columns=self.columns)
+            df = self._build_data_frame(self.columns)
             for index, column_type in enumerate(self.column_types):
-                if column_type == 'Date':
-                    df[self.columns[index]] = df[self.columns[index]].apply(pd.to_datetime)
+                column_type = Util.normalize_column_type(column_type)
+                if column_type == 'date':
+                    df[self.columns[index]] = Util.convert_column_to_datetimes(
+                        df[self.columns[index]])
+                elif column_type == 'datetime':
+                    df[self.columns[index]] = Util.convert_column_to_utc_datetimes(
+                        df[self.columns[index]])
         else:
-            df = pd.DataFrame(data=data, columns=self.column_names)
+            df = self._build_data_frame(self.column_names)
             # ensure our first column of time series data is of pd.datetime
-            df[self.column_names[0]] = df[self.column_names[0]].apply(pd.to_datetime)
+            df[self.column_names[0]] = Util.convert_column_to_datetimes(
+                df[self.column_names[0]])
             df.set_index(self.column_names[0], inplace=True)
 
         # unfortunately to_records() cannot handle unicode in 2.7
@@ -32,8 +35,20 @@ class DataMixin(object):
             # it is the index, so column 0 is the first column after Date index
             keep_column_indexes = list([x - 1 for x in keep_column_indexes])
             df = df.iloc[:, keep_column_indexes]
+        if started is not None:
+            Instrumentation.finish('to_pandas', started, rows=len(df.index),
+                                   columns=len(df.columns))
         return df
 
+    def _build_data_frame(self, columns):
+        import pandas as pd
+        data = self.to_list()
+
+        # ensure pandas gets a list of lists
+        if data and isinstance(data, list) and not isinstance(data[0], list):
+            data = [data]
+        return pd.DataFrame(data=data, columns=columns)
+
     def to_numpy(self):
         return self.to_pandas().to_records()
 
@@ -10,11 +10,13 @@ from quandl.message import Message
 from quandl.operations.get import GetOperation
 from quandl.operations.list import ListOperation
 from quandl.util import Util
+from quandl.utils.download_util import FileDownloader
 from .model_base import ModelBase
 
 
 class Database(GetOperation, ListOperation, ModelBase):
-    BULK_CHUNK_SIZE = 512
+    # size of the first reads of a bulk download, later reads grow with the throughput
+    BULK_CHUNK_SIZE = 64 * 1024
 
     @classmethod
     def get_code_from_meta(cls, metadata):
@@ -47,11 +49,8 @@ class Database(GetOperation, ListOperation, ModelBase):
         file_path = file_or_folder_path
         if os.path.isdir(file_or_folder_path):
             file_path = file_or_folder_path + '/' + os.path.basename(urlparse(r.url).path)
-        with open(file_path, 'wb') as fd:
-            for chunk in r.iter_content(self.BULK_CHUNK_SIZE):
-                fd.write(chunk)
 
-        return file_path
+        return FileDownloader(file_path, chunk_size=self.BULK_CHUNK_SIZE).download(r)
 
     def _bulk_download_path(self):
         url = self.default_path() + '/data'
@@ -36,23 +36,30 @@ class Dataset(GetOperation, ListOperation, ModelBase):
         # for a non-existent dataset instead of raising an error
         handle_not_found_error = options.pop('handle_not_found_error', False)
         handle_column_not_found = options.pop('handle_column_not_found', False)
-        # default order to ascending, and respect whatever user passes in
-        params = {
-            'database_code': self.database_code,
-            'dataset_code': self.dataset_code,
-            'order': 'asc'
-        }
-        updated_options = Util.merge_options('params', params, **options)
+        updated_options = self.data_options(**options)
         try:
             return Data.all(**updated_options)
         except NotFoundError:
             if handle_not_found_error:
-                return DataList(Data, [], {'column_names': [six.u('None'), six.u('Not Found')]})
+                return self.not_found_data()
             raise
         except ColumnNotFound:
             if handle_column_not_found:
-                return DataList(Data, [], {'column_names': [six.u('None'), six.u('Not Found')]})
+                return self.not_found_data()
             raise
 
+    def data_options(self, **options):
+        # default order to ascending, and respect whatever user passes in
+        params = {
+            'database_code': self.database_code,
+            'dataset_code': self.dataset_code,
+            'order': 'asc'
+        }
+        return Util.merge_options('params', params, **options)
+
+    @staticmethod
+    def not_found_data():
+        return DataList(Data, [], {'column_names': [six.u('None'), six.u('Not Found')]})
+
     def database(self):
         return quandl.model.database.Database(self.database_code)
@@ -1,15 +1,19 @@
+import io
 import os
 from time import sleep
 
 from six.moves.urllib.request import urlopen
 
+from quandl.api_config import ApiConfig
 from quandl.connection import Connection
 from quandl.errors.quandl_error import QuandlError
 from quandl.message import Message
 from quandl.operations.get import GetOperation
 from quandl.operations.list import ListOperation
 from quandl.util import Util
+from quandl.utils.json_util import JsonUtil
 from quandl.utils.request_type_util import RequestType
+from quandl.utils.zip_stream_util import ZipStreamReader
 from .data import Data
 from .model_base import ModelBase
 
@@ -20,6 +24,17 @@ log = logging.getLogger(__name__)
 class Datatable(GetOperation, ListOperation, ModelBase):
     BULK_CHUNK_SIZE = 16 * 1024
     WAIT_GENERATION_INTERVAL = 30
+    EXPORT_CHUNK_SIZE = 100000
+    # pandas dtypes of the exported columns by normalized column type, nullable so
+    # missing values are kept. Date and datetime columns are converted after parsing
+    EXPORT_DTYPES = {
+        'integer': 'Int64',
+        'double': 'float64',
+        'float': 'float64',
+        'bigdecimal': 'float64',
+        'boolean': 'boolean',
+        'string': 'object'
+    }
 
     @classmethod
     def get_path(cls):
@@ -34,17 +49,70 @@ class Datatable(GetOperation, ListOperation, ModelBase):
         if not isinstance(file_or_folder_path, str):
             raise QuandlError(Message.ERROR_FOLDER_ISSUE)
 
-        file_is_ready = False
-
-        while not file_is_ready:
-            file_is_ready = self._request_file_info(file_or_folder_path, params=options)
-            if not file_is_ready:
-                log.debug(Message.LONG_GENERATION_TIME)
-                sleep(self.WAIT_GENERATION_INTERVAL)
+        file_link = self._wait_for_file_link(params=options)
+        return self._download_file_with_link(file_or_folder_path, file_link, self.code)
+
+    def export_data_frames(self, chunksize=None, **options):
+        """ Yields the exported table as dataframes of up to `chunksize` rows.
+        The zip file is decompressed while it downloads and never written to
+        disk, and the columns are typed using the datatable metadata.
+        """
+        import pandas as pd
+        file_link = self._wait_for_file_link(params=options)
+        column_types = dict([(name, Util.normalize_column_type(column_type))
+                             for name, column_type in self.export_column_types().items()])
+        dtypes = self.column_dtypes(column_types)
+
+        response = urlopen(file_link, timeout=ApiConfig.read_timeout)
+        reader = io.BufferedReader(ZipStreamReader(response), self.BULK_CHUNK_SIZE)
+        chunks = pd.read_csv(reader, chunksize=chunksize or self.EXPORT_CHUNK_SIZE, dtype=dtypes)
+        try:
+            for data_frame in chunks:
+                for name in data_frame.columns:
+                    if column_types.get(name) == 'date':
+                        data_frame[name] = Util.convert_column_to_datetimes(data_frame[name])
+                    elif column_types.get(name) == 'datetime':
+                        data_frame[name] = Util.convert_column_to_utc_datetimes(data_frame[name])
+                yield data_frame
+        finally:
+            chunks.close()
+            reader.close()
+
+    # the name and type of every column of the datatable, from its metadata
+    def export_column_types(self):
+        return dict([(column['name'], column['type']) for column in self.columns])
+
+    # the pandas dtype CSV values of each column are read as. Dates are left as
+    # text and columns of other types are left for pandas to infer
+    def column_dtypes(self, column_types=None):
+        if column_types is None:
+            column_types = self.export_column_types()
+        column_types = dict([(name, Util.normalize_column_type(column_type))
+                             for name, column_type in column_types.items()])
+        return dict([(name, self.EXPORT_DTYPES[column_type])
+                     for name, column_type in column_types.items()
+                     if column_type in self.EXPORT_DTYPES])
+
+    def _wait_for_file_link(self, **options):
+        interval = None
+        while True:
+            file_link = self._request_file_link(**options)
+            if file_link is not None:
+                return file_link
+            log.debug(Message.LONG_GENERATION_TIME)
+            interval = self.next_generation_wait(interval)
+            sleep(interval)
+
+    # the file is checked again soon after the export starts, then less and less
+    # often, so a file that is ready quickly is not left waiting for a full interval
+    @classmethod
+    def next_generation_wait(cls, interval=None):
+        if interval is None:
+            return min(ApiConfig.export_poll_interval, cls.WAIT_GENERATION_INTERVAL)
+        return min(interval * 2, cls.WAIT_GENERATION_INTERVAL)
 
-    def _request_file_info(self, file_or_folder_path, **options):
+    def _request_file_link(self, **options):
         url = self._download_request_path()
-        code_name = self.code
         options['params']['qopts.export'] = 'true'
 
         request_type = RequestType.get_request_type(url, **options)
@@ -53,18 +121,15 @@ class Datatable(GetOperation, ListOperation, ModelBase):
 
         r = Connection.request(request_type, url, **updated_options)
 
-        response_data = r.json()
+        response_data = JsonUtil.decode_response(r)
 
         file_info = response_data['datatable_bulk_download']['file']
 
         status = file_info['status']
 
         if status == 'fresh':
-            file_link = file_info['link']
-            self._download_file_with_link(file_or_folder_path, file_link, code_name)
-            return True
-        else:
-            return False
+            return file_info['link']
+        return None
 
     def _download_file_with_link(self, file_or_folder_path, file_link, code_name):
         file_path = file_or_folder_path
@@ -72,7 +137,7 @@ class Datatable(GetOperation, ListOperation, ModelBase):
             file_path = os.path.join(file_or_folder_path,
                                      '{}.{}'.format(code_name.replace('/', '_'), 'zip'))
 
-        res = urlopen(file_link)
+        res = urlopen(file_link, timeout=ApiConfig.read_timeout)
 
         with open(file_path, 'wb') as fd:
             while True:
@@ -85,6 +150,7 @@ class Datatable(GetOperation, ListOperation, ModelBase):
             "File path: %s",
             file_path
         )
+        return file_path
 
     def _download_request_path(self):
         url = self.default_path()
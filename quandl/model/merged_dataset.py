@@ -1,6 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from more_itertools import unique_everseen
 import pandas as pd
 from six import string_types
+from quandl.api_config import ApiConfig
 from .model_base import ModelBase
 from quandl.util import Util
 from .merged_data_list import MergedDataList
@@ -32,23 +34,26 @@ class MergedDataset(ModelBase):
     def data(self, **options):
         # if there is only one column_index, use the api to fetch
         # else fetch all the data and filter column indexes requested locally
-        dataset_data_list = [self._get_dataset_data(dataset, **options)
-                             for dataset in self.__dataset_objects__()]
-
+        max_workers = options.pop('max_workers', None)
+        if max_workers is None:
+            max_workers = ApiConfig.max_workers
+        dataset_data_list = self._get_datasets_data(max_workers, **options)
+        return self.merge_data(dataset_data_list, **options)
+
+    # combine the data fetched for every dataset, in the order of the dataset codes
+    def merge_data(self, dataset_data_list, **options):
         # build data frames and filter locally when necessary
         data_frames = [dataset_data.to_pandas(
             keep_column_indexes=self._keep_column_indexes(index))
             for index, dataset_data in enumerate(dataset_data_list)]
 
-        merged_data_frame = pd.DataFrame()
-
         for index, data_frame in enumerate(data_frames):
             metadata = self.__dataset_objects__()[index]
             # use code to prevent metadata api call
             data_frame.rename(
                 columns=lambda x: self._rename_columns(metadata.code, x), inplace=True)
-            merged_data_frame = pd.merge(
-                merged_data_frame, data_frame, right_index=True, left_index=True, how='outer')
+
+        merged_data_frame = self._merge_data_frames(data_frames)
 
         merged_data_metadata = self._build_data_meta(dataset_data_list, merged_data_frame)
 
@@ -60,8 +65,77 @@ class MergedDataset(ModelBase):
             Data, merged_data_frame, merged_data_metadata,
             ascending=self._order_is_ascending(**options))
 
+    # fetch every dataset, concurrently when more than one worker is allowed,
+    # returning the results in the same order as the dataset codes
+    def _get_datasets_data(self, max_workers, **options):
+        datasets = self.__dataset_objects__()
+        if max_workers <= 1 or len(datasets) <= 1:
+            return [self._get_dataset_data(dataset, **options) for dataset in datasets]
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(datasets)))
+        futures = [executor.submit(self._get_dataset_data, dataset, **options)
+                   for dataset in datasets]
+        try:
+            # result() re-raises the first error in dataset order
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    # align every data frame on the union of their dates in a single pass,
+    # rather than merging them pairwise and copying the accumulated frame each time
+    def _merge_data_frames(self, data_frames):
+        if not data_frames:
+            return pd.DataFrame()
+        # concat can only align unique indexes, so datasets with repeated dates
+        # are merged pairwise, which pairs every repeated date like a join
+        if not all(df.index.is_unique for df in data_frames):
+            return self._merge_data_frames_pairwise(data_frames)
+
+        index_name = next((df.index.name for df in data_frames if len(df.index) > 0), None)
+        aligned_data_frames = []
+        for data_frame in data_frames:
+            # datasets that were not found come back with an empty index of their own
+            if len(data_frame.index) == 0:
+                data_frame = data_frame.copy()
+                data_frame.index = pd.DatetimeIndex([], name=index_name)
+            aligned_data_frames.append(data_frame)
+
+        merged_data_frame = pd.concat(aligned_data_frames, axis=1, join='outer', sort=True)
+        merged_data_frame.columns = self._merged_data_frame_columns(data_frames)
+        return merged_data_frame
+
+    def _merge_data_frames_pairwise(self, data_frames):
+        merged_data_frame = pd.DataFrame()
+        for data_frame in data_frames:
+            merged_data_frame = pd.merge(
+                merged_data_frame, data_frame, right_index=True, left_index=True, how='outer')
+        return merged_data_frame
+
+    # keep the suffixes pandas merge gives to columns requested more than once
+    def _merged_data_frame_columns(self, data_frames):
+        columns = []
+        for data_frame in data_frames:
+            new_columns = list(data_frame.columns)
+            overlap = set(columns).intersection(new_columns)
+            if overlap:
+                columns = [x + '_x' if x in overlap else x for x in columns]
+                new_columns = [x + '_y' if x in overlap else x for x in new_columns]
+            columns.extend(new_columns)
+        return columns
+
     # for MergeDataset data calls
     def _get_dataset_data(self, dataset, **options):
+        deadline = options.get('deadline')
+        if deadline is not None:
+            deadline.check()
+        dataset_data = dataset.data(**self.dataset_data_options(dataset, **options))
+        if deadline is not None:
+            deadline.advance(datasets=1)
+        return dataset_data
+
+    def dataset_data_options(self, dataset, **options):
         updated_options = options
         # if we have only one column index, let the api
         # handle the column filtering since the api supports this
@@ -70,7 +144,7 @@ class MergedDataset(ModelBase):
             # only change the options per request
             updated_options = options.copy()
             updated_options = Util.merge_options('params', params, **updated_options)
-        return dataset.data(**updated_options)
+        return updated_options
 
     def _build_data_meta(self, dataset_data_list, df):
         merged_data_metadata = {}
@@ -1,10 +1,72 @@
+from quandl.api_config import ApiConfig
+from quandl.connection import Connection
 from quandl.model.data_list import DataList
+from quandl.util import Util
+from quandl.utils.csv_util import CsvDecoder
+from quandl.utils.instrumentation_util import Instrumentation
 from .list import ListOperation
-from quandl.errors.quandl_error import (InvalidDataError, ColumnNotFound)
+from quandl.errors.quandl_error import (InvalidDataError, ColumnNotFound, InvalidRequestError)
 from quandl.message import Message
 
 
 class DataListOperation(ListOperation):
+    WIRE_FORMATS = ['json', 'csv']
+
+    @classmethod
+    def all(cls, **options):
+        if not cls.use_csv(options):
+            return super(DataListOperation, cls).all(**options)
+        http_verb, path, options = cls.all_request(**options)
+        response_data = cls.request_csv(http_verb, path, CsvDecoder().decode_dataset_data,
+                                        **options)
+        return cls.build_list(response_data)
+
+    @classmethod
+    def request_page(cls, datatable, **options):
+        # point in time tables have no metadata to type the columns of a csv page with
+        if not cls.use_csv(options) or not hasattr(datatable, 'column_dtypes'):
+            return super(DataListOperation, cls).request_page(datatable, **options)
+        http_verb, path, options = cls.page_request(datatable, **options)
+        # filters too long for a url are posted, and only answered in json
+        if http_verb != 'get':
+            return cls.request_json(http_verb, path, **options)
+
+        column_types = datatable.export_column_types()
+        decoder = CsvDecoder(datatable.column_dtypes(column_types))
+        return cls.request_csv(http_verb, path,
+                               lambda r: decoder.decode_datatable(r, column_types), **options)
+
+    @classmethod
+    def use_csv(cls, options):
+        wire_format = options.pop('wire_format', None) or ApiConfig.wire_format
+        if wire_format not in cls.WIRE_FORMATS:
+            raise InvalidRequestError(Message.ERROR_WIRE_FORMAT % wire_format)
+        return wire_format == 'csv'
+
+    @classmethod
+    def request_csv(cls, http_verb, path, decode, **options):
+        options['headers'] = Util.merge_to_dicts(options.get('headers', {}),
+                                                 {'accept': 'text/csv'})
+        r = Connection.request(http_verb, path + '.csv', **options)
+        started = Instrumentation.start()
+        response_data = decode(r)
+        if started is not None:
+            Instrumentation.finish('decode', started, streamed=False, wire_format='csv',
+                                   bytes=len(r.content))
+        return response_data
+
+    # data cells are left as received, DataList converts its date columns
+    # using the column types, so only the response metadata is scanned here
+    @classmethod
+    def convert_response_dates(cls, response_data):
+        for key in ['dataset_data', 'datatable']:
+            if key in response_data and 'data' in response_data[key]:
+                values = response_data[key].pop('data')
+                Util.convert_to_dates(response_data)
+                response_data[key]['data'] = values
+                return
+        Util.convert_to_dates(response_data)
+
     @classmethod
     def create_list_from_response(cls, data):
         cls.validate_dataset_data_response(data['dataset_data'])
@@ -25,6 +87,10 @@ class DataListOperation(ListOperation):
                     'next_cursor_id': data['meta']['next_cursor_id']}
         return DataList(cls, values, metadata)
 
+    @classmethod
+    def streamed_data_paths(cls):
+        return [('dataset_data', 'data'), ('datatable', 'data')]
+
     @classmethod
     def list_path(cls):
         return "datasets/:database_code/:dataset_code/data"
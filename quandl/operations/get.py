@@ -3,6 +3,8 @@ from inflection import singularize
 from .operation import Operation
 from quandl.connection import Connection
 from quandl.util import Util
+from quandl.utils.json_util import JsonUtil
+from quandl.utils.metadata_cache_util import MetadataCache
 
 
 class GetOperation(Operation):
@@ -15,14 +17,32 @@ class GetOperation(Operation):
         if self._raw_data:
             return self._raw_data
 
-        cls = self.__class__
+        http_verb, path, options = self.raw_data_request()
+        if self.load_cached_raw_data(path, options) is not None:
+            return self._raw_data
+
+        r = Connection.request(http_verb, path, **options)
+        return self.set_raw_data_from_response(JsonUtil.decode_response(r))
+
+    # building the request and reading the response are kept apart from the
+    # request itself so other transports (see quandl.aio) can share them
+    def raw_data_request(self):
         params = {'id': str(self.code)}
         options = Util.merge_options('params', params, **self.options)
 
-        path = Util.constructed_path(cls.get_path(), options['params'])
+        path = Util.constructed_path(self.__class__.get_path(), options['params'])
+        return 'get', path, options
+
+    # metadata fetched recently for the same code is shared through MetadataCache
+    def load_cached_raw_data(self, path, options):
+        cached = MetadataCache.get(self.__class__, self.code, path, options.get('params'))
+        if cached is not None:
+            self._raw_data = cached
+        return cached
 
-        r = Connection.request('get', path, **options)
-        response_data = r.json()
+    def set_raw_data_from_response(self, response_data):
         Util.convert_to_dates(response_data)
-        self._raw_data = response_data[singularize(cls.lookup_key())]
+        self._raw_data = response_data[singularize(self.__class__.lookup_key())]
+        _, path, options = self.raw_data_request()
+        MetadataCache.put(self.__class__, self.code, path, options.get('params'), self._raw_data)
         return self._raw_data
@@ -1,39 +1,113 @@
 from .operation import Operation
+from quandl.api_config import ApiConfig
 from quandl.connection import Connection
 from quandl.util import Util
 from quandl.model.paginated_list import PaginatedList
+from quandl.utils.instrumentation_util import Instrumentation
+from quandl.utils.json_util import JsonUtil
 from quandl.utils.request_type_util import RequestType
+from quandl.utils.json_stream_util import StreamingJsonDecoder
 
 
 class ListOperation(Operation):
 
     @classmethod
     def all(cls, **options):
+        http_verb, path, options = cls.all_request(**options)
+        response_data = cls.request_json(http_verb, path, **options)
+        return cls.build_list(response_data)
+
+    @classmethod
+    def all_request(cls, **options):
         if 'params' not in options:
             options['params'] = {}
         path = Util.constructed_path(cls.list_path(), options['params'])
-        r = Connection.request('get', path, **options)
-        response_data = r.json()
-        Util.convert_to_dates(response_data)
+        return 'get', path, options
+
+    @classmethod
+    def build_list(cls, response_data):
+        started = Instrumentation.start()
+        cls.convert_response_dates(response_data)
+        Instrumentation.finish('convert_dates', started)
+
+        started = Instrumentation.start()
         resource = cls.create_list_from_response(response_data)
+        if started is not None:
+            Instrumentation.finish('build', started, model=cls.__name__, rows=len(resource))
         return resource
 
     @classmethod
     def page(cls, datatable, **options):
+        response_data = cls.request_page(datatable, **options)
+        return cls.build_page(response_data)
+
+    # fetching a page and building it are separate steps so pagination can
+    # request the next cursor while the previous page is still being built
+    @classmethod
+    def request_page(cls, datatable, **options):
+        http_verb, path, options = cls.page_request(datatable, **options)
+        return cls.request_json(http_verb, path, **options)
+
+    @classmethod
+    def page_request(cls, datatable, **options):
         params = {'id': str(datatable.code)}
         path = Util.constructed_path(datatable.default_path(), params)
 
         request_type = RequestType.get_request_type(path, **options)
 
         updated_options = Util.convert_options(request_type=request_type, **options)
+        # options that are not query params are handed on to the connection
+        for name in ['cache_ttl', 'timeout', 'deadline']:
+            if name in options:
+                updated_options[name] = options[name]
 
-        r = Connection.request(request_type, path, **updated_options)
+        return request_type, path, updated_options
 
-        response_data = r.json()
-        Util.convert_to_dates(response_data)
+    @classmethod
+    def request_json(cls, http_verb, path, **options):
+        data_paths = cls.streamed_data_paths()
+        if ApiConfig.use_streaming_decoder and data_paths:
+            options['stream'] = True
+            r = Connection.request(http_verb, path, **options)
+            # decoding a streamed response includes reading it
+            started = Instrumentation.start()
+            try:
+                response_data = StreamingJsonDecoder(data_paths).decode(r)
+            finally:
+                r.close()
+            Instrumentation.finish('decode', started, bytes=None, streamed=True)
+            return response_data
+
+        r = Connection.request(http_verb, path, **options)
+        started = Instrumentation.start()
+        response_data = JsonUtil.decode_response(r)
+        if started is not None:
+            content = getattr(r, 'content', None)
+            Instrumentation.finish('decode', started, streamed=False,
+                                   bytes=len(content) if isinstance(content, bytes) else None)
+        return response_data
+
+    # response arrays that can be decoded row by row into column buffers
+    @classmethod
+    def streamed_data_paths(cls):
+        return []
+
+    @classmethod
+    def build_page(cls, response_data):
+        started = Instrumentation.start()
+        cls.convert_response_dates(response_data)
+        Instrumentation.finish('convert_dates', started)
+
+        started = Instrumentation.start()
         resource = cls.create_datatable_list_from_response(response_data)
+        if started is not None:
+            Instrumentation.finish('build', started, model=cls.__name__, rows=len(resource))
         return resource
 
+    @classmethod
+    def convert_response_dates(cls, response_data):
+        Util.convert_to_dates(response_data)
+
     @classmethod
     def create_list_from_response(cls, data):
         return PaginatedList(cls, data[cls.lookup_key()], data['meta'])
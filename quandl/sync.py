@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+from six import string_types
+
+from quandl.errors.quandl_error import InvalidRequestError
+from .api_config import ApiConfig
+from .get import _convert_params_to_v3, _parse_dataset_code
+from .message import Message
+from .model.dataset import Dataset
+from .utils.api_key_util import ApiKeyUtil
+
+# transforms computed over the whole requested range, which change every row
+# whenever a new one arrives and so are always fetched in full
+FULL_REFRESH_TRANSFORMS = ['cumul', 'normalize', 'rdiff_from']
+# transforms that depend on the row before, so one extra stored row is refetched
+ROW_ON_ROW_TRANSFORMS = ['diff', 'rdiff']
+# params applied to the stored copy locally rather than sent with the request
+LOCAL_PARAMS = ['order', 'rows']
+
+
+def sync(dataset, directory=None, **kwargs):
+    """Return dataframe of a dataset kept up to date in a local copy.
+    The first call downloads the dataset like `get` and stores it, later calls
+    only request the rows from the newest stored date onwards and merge them
+    into the stored copy.
+    :param str dataset: Dataset code, optionally with a column index, e.g. `NSE/OIL.1`
+    :param str directory: Where local copies are stored. Default: `ApiConfig.sync_dir`
+    :param str api_key: Downloads are limited to 50 unless api_key is specified
+    :param str start_date, end_date: Optional datefilers, otherwise entire
+           dataset is returned
+    :param str collapse: Options are daily, weekly, monthly, quarterly, annual
+    :param str transform: options are diff, rdiff, rdiff_from, cumul, and normalize.
+        cumul, normalize and rdiff_from change every row whenever data is added,
+        so datasets using them are downloaded in full on every call
+    :param int rows: Number of rows which will be returned
+    :param str order: options are asc, desc. Default: `asc`
+    :param str returns: specify what format you wish your dataset returned as,
+        either `numpy` for a numpy ndarray or `pandas`. Default: `pandas`
+    :returns: :class:`pandas.DataFrame` or :class:`numpy.ndarray`
+    A separate copy is stored for every combination of the other params.
+    """
+    if not isinstance(dataset, string_types):
+        raise InvalidRequestError(Message.ERROR_DATASET_FORMAT)
+
+    _convert_params_to_v3(kwargs)
+
+    data_format = kwargs.pop('returns', 'pandas')
+    local_params = dict([(k, kwargs.pop(k)) for k in LOCAL_PARAMS if k in kwargs])
+
+    ApiKeyUtil.init_api_key_from_args(kwargs)
+
+    dataset_args = _parse_dataset_code(dataset)
+    if dataset_args['column_index'] is not None:
+        kwargs.update({'column_index': dataset_args['column_index']})
+
+    path = _sync_path(directory or ApiConfig.sync_dir, dataset_args['code'], kwargs)
+    stored = _read_stored(path)
+    data_frame = _refresh(dataset_args['code'], stored, kwargs)
+    if stored is None or not data_frame.equals(stored):
+        _write_stored(path, data_frame)
+
+    if 'rows' in local_params:
+        data_frame = data_frame.tail(int(local_params['rows']))
+    if local_params.get('order') == 'desc':
+        data_frame = data_frame.iloc[::-1]
+
+    if data_format == 'numpy':
+        return data_frame.to_records()
+    return data_frame.copy()
+
+
+def _refresh(code, stored, params):
+    overlap = _overlap_rows(params)
+    if stored is None or overlap is None or len(stored.index) <= overlap:
+        return _fetch_data_frame(code, params)
+
+    # refetch the newest stored rows too: the latest row of a collapsed dataset
+    # may cover a period that was still in progress, and row on row transforms
+    # need the row before the first one that is replaced
+    boundary = stored.index[-2]
+    fetch_params = dict(params)
+    fetch_params['start_date'] = (
+        stored.index[-(overlap + 1)] + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+    fetched = _fetch_data_frame(code, fetch_params)
+    if len(fetched.index) == 0:
+        return stored
+
+    merged = pd.concat([stored[stored.index <= boundary], fetched[fetched.index > boundary]])
+    return merged[~merged.index.duplicated(keep='last')].sort_index()
+
+
+def _overlap_rows(params):
+    transform = params.get('transform')
+    if transform in FULL_REFRESH_TRANSFORMS:
+        return None
+    if transform in ROW_ON_ROW_TRANSFORMS:
+        return 2
+    return 1
+
+
+def _fetch_data_frame(code, params):
+    params = dict(params, order='asc')
+    data = Dataset(code).data(params=params, handle_column_not_found=True)
+    return data.to_pandas()
+
+
+def _sync_path(directory, code, params):
+    # the api key does not change the data so it is not part of the name
+    identity = json.dumps(sorted((k, str(v)) for k, v in params.items() if k != 'api_key'))
+    digest = hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(directory, '%s-%s.pkl' % (code.replace('/', '_'), digest))
+
+
+def _read_stored(path):
+    if not os.path.exists(path):
+        return None
+    return pd.read_pickle(path)
+
+
+def _write_stored(path, data_frame):
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    os.close(fd)
+    try:
+        data_frame.to_pickle(temp_path)
+        # other processes reading the copy never see a partly written file
+        os.replace(temp_path, path)
+    except Exception:
+        os.remove(temp_path)
+        raise
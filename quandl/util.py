@@ -1,11 +1,13 @@
 from inflection import parameterize
-import dateutil.parser
+import datetime
 import re
-import pandas
+import sys
 from six import string_types
 
 
 class Util(object):
+    DATE_FORMAT = '%Y-%m-%d'
+
     @staticmethod
     def constructed_path(path, params={}):
         for key in list(params.copy().keys()):
@@ -53,13 +55,51 @@ class Util(object):
     def convert_to_date(value):
         if isinstance(value, string_types) and re.search(r'^\d{4}-\d{2}-\d{2}$', value):
             # convert to datetime.date
+            import dateutil.parser
             return dateutil.parser.parse(value).date()
         elif isinstance(value, string_types) and re.search(r'^\d{4}-\d{2}-\d{2}T[\d:\.]+Z$', value):
             # convert to datetime.datetime, default timezone is utc
+            import dateutil.parser
             return dateutil.parser.parse(value)
         else:
             return value
 
+    # typed counterpart of convert_to_date for values known to hold dates,
+    # which avoids the regex checks for the common YYYY-MM-DD form
+    @staticmethod
+    def parse_date(value):
+        if isinstance(value, string_types):
+            try:
+                return datetime.datetime.strptime(value, Util.DATE_FORMAT).date()
+            except ValueError:
+                return Util.convert_to_date(value)
+        return value
+
+    # the lower case name of a metadata column type without its precision, so
+    # 'BigDecimal(11,4)' and 'bigdecimal' name the same type
+    @staticmethod
+    def normalize_column_type(column_type):
+        return str(column_type).split('(')[0].strip().lower()
+
+    # convert a whole column of dates at once instead of cell by cell
+    @staticmethod
+    def convert_column_to_datetimes(values):
+        import pandas
+        try:
+            return pandas.to_datetime(values, format=Util.DATE_FORMAT)
+        except (ValueError, TypeError):
+            return pandas.to_datetime(values)
+
+    # timestamps such as 2015-07-13T10:00:00Z are kept in UTC, as the cells
+    # converted by convert_to_date are. Columns that do not parse are left as text
+    @staticmethod
+    def convert_column_to_utc_datetimes(values):
+        import pandas
+        try:
+            return pandas.to_datetime(values, utc=True)
+        except (ValueError, TypeError):
+            return values
+
     @staticmethod
     def convert_options(request_type, **options):
         if request_type == 'get':
@@ -69,13 +109,23 @@ class Util(object):
         else:
             raise Exception('Can only convert options for get or post requests')
 
+    # a pandas Series can only be passed in once the caller has imported pandas,
+    # so it is not imported here just to check for one
+    @staticmethod
+    def _list_types():
+        pandas = sys.modules.get('pandas')
+        if pandas is None:
+            return (list,)
+        return (list, pandas.Series)
+
     @staticmethod
     def _convert_options_for_get_request(**options):
         new_options = dict()
+        list_types = Util._list_types()
         if 'params' in options.keys():
             for key, value in options['params'].items():
                 is_dict = False
-                if isinstance(value, (list, pandas.Series)):
+                if isinstance(value, list_types):
                     key = key + '[]'
                 else:
                     if isinstance(value, dict) and value != {}:
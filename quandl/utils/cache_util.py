@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from quandl.api_config import ApiConfig
+
+
+class ResponseCache(object):
+    """ Persistent cache of GET responses kept under `ApiConfig.cache_dir`.
+    Entries are keyed on the url and the normalized query params (the api key
+    is left out) and written atomically so several processes can share one
+    directory. Stale entries carrying an ETag or Last-Modified header are
+    revalidated with a conditional request, and the least recently used
+    entries are removed once the directory grows past `ApiConfig.cache_max_size`.
+    The size of the directory is counted once and then kept up to date in memory,
+    so entries written by other processes are only seen at the next eviction.
+    """
+    FILE_SUFFIX = '.cache'
+    # headers describing how the body was transferred rather than the stored body
+    TRANSFER_HEADERS = ('connection', 'content-encoding', 'content-length', 'transfer-encoding')
+    # datatable pages are read through a cursor, handed out in the JSON meta or
+    # in a header of CSV pages, that only belongs to the snapshot it came from
+    CURSOR_PARAM = 'qopts.cursor_id'
+    CURSOR_HEADER = 'cursor_id'
+    NEXT_CURSOR_PATTERN = re.compile(br'"next_cursor_id"\s*:\s*"')
+    _evict_lock = threading.Lock()
+    # bytes stored in each cache directory, counted when it is first written to
+    _sizes = {}
+
+    @classmethod
+    def is_cacheable(cls, http_verb, **options):
+        # streamed bodies are consumed by the caller and never read whole
+        return bool(ApiConfig.cache_dir) and http_verb == 'get' and not options.get('stream')
+
+    @classmethod
+    def key(cls, http_verb, url, params=None):
+        items = []
+        for name, value in sorted((params or {}).items()):
+            if name == 'api_key':
+                continue
+            if isinstance(value, (list, tuple)) or hasattr(value, 'tolist'):
+                value = list([str(x) for x in value])
+            else:
+                value = str(value)
+            items.append([name, value])
+        identity = json.dumps([http_verb.lower(), url, items])
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def load(cls, key):
+        path = cls._path(key)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline().decode('utf-8'))
+                body = f.read()
+            # mark the entry as recently used for eviction
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            return None
+        return meta, body
+
+    @classmethod
+    def is_fresh(cls, meta, ttl):
+        # a page reused from an older snapshot would hand out a stale cursor
+        if meta.get('cursor_paginated'):
+            return False
+        return time.time() - meta['stored_at'] < ttl
+
+    @classmethod
+    def is_cursor_paginated(cls, response, params=None):
+        if params and cls.CURSOR_PARAM in params:
+            return True
+        if response.headers.get(cls.CURSOR_HEADER):
+            return True
+        return cls.NEXT_CURSOR_PATTERN.search(response.content) is not None
+
+    @classmethod
+    def validators(cls, meta):
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    @classmethod
+    def store(cls, key, response, params=None):
+        if 'no-store' in response.headers.get('cache-control', ''):
+            return
+        headers = dict([(name, value) for name, value in response.headers.items()
+                        if name.lower() not in cls.TRANSFER_HEADERS])
+        meta = {
+            'url': response.url,
+            'status_code': response.status_code,
+            'encoding': response.encoding,
+            'headers': headers,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'cursor_paginated': cls.is_cursor_paginated(response, params),
+            'stored_at': time.time()
+        }
+        cls._write(key, meta, response.content)
+        if cls._size() > ApiConfig.cache_max_size:
+            cls.evict()
+
+    @classmethod
+    def revalidated(cls, key, meta, body, response):
+        # a 304 may carry new validators for the body that is already stored
+        meta = dict(meta)
+        for name, header in (('etag', 'etag'), ('last_modified', 'last-modified')):
+            if response.headers.get(header):
+                meta[name] = response.headers[header]
+        meta['stored_at'] = time.time()
+        cls._write(key, meta, body)
+        return meta
+
+    @classmethod
+    def build_response(cls, meta, body):
+        response = requests.Response()
+        response.status_code = meta['status_code']
+        response.url = meta['url']
+        response.encoding = meta['encoding']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.reason = 'OK'
+        response._content = body
+        return response
+
+    @classmethod
+    def evict(cls, max_size=None):
+        if max_size is None:
+            max_size = ApiConfig.cache_max_size
+        with cls._evict_lock:
+            entries = cls._entries()
+            total_size = sum(entry[2] for entry in entries)
+            for path, _, size in sorted(entries, key=lambda entry: entry[1]):
+                if total_size <= max_size:
+                    break
+                cls._remove(path)
+                total_size -= size
+            cls._sizes[ApiConfig.cache_dir] = total_size
+
+    @classmethod
+    def clear(cls):
+        with cls._evict_lock:
+            for path, _, _ in cls._entries():
+                cls._remove(path)
+            cls._sizes.pop(ApiConfig.cache_dir, None)
+
+    @classmethod
+    def _size(cls):
+        directory = ApiConfig.cache_dir
+        with cls._evict_lock:
+            if directory not in cls._sizes:
+                cls._sizes[directory] = sum(entry[2] for entry in cls._entries())
+            return cls._sizes[directory]
+
+    @classmethod
+    def _write(cls, key, meta, body):
+        directory = ApiConfig.cache_dir
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        path = cls._path(key)
+        header = json.dumps(meta).encode('utf-8') + b'\n'
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                f.write(body)
+            replaced_size = cls._file_size(path)
+            # readers only ever see complete entries
+            os.replace(temp_path, path)
+        except Exception:
+            cls._remove(temp_path)
+            raise
+        with cls._evict_lock:
+            if directory in cls._sizes:
+                cls._sizes[directory] += len(header) + len(body) - replaced_size
+
+    @classmethod
+    def _entries(cls):
+        entries = []
+        if not ApiConfig.cache_dir or not os.path.isdir(ApiConfig.cache_dir):
+            return entries
+        for entry in os.scandir(ApiConfig.cache_dir):
+            if not entry.name.endswith(cls.FILE_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry.path, stat.st_mtime, stat.st_size))
+        return entries
+
+    @classmethod
+    def _path(cls, key):
+        return os.path.join(ApiConfig.cache_dir, key + cls.FILE_SUFFIX)
+
+    @staticmethod
+    def _file_size(path):
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
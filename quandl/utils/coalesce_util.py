@@ -0,0 +1,79 @@
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from quandl.api_config import ApiConfig
+from quandl.utils.cache_util import ResponseCache
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class RequestCoalescer(object):
+    """ Lets identical GET requests made at the same time from several threads
+    share one HTTP call. The first caller sends the request while the others
+    wait for it, then each of them receives its own copy of the response, or
+    the error it raised. Requests only match when the url, the normalized
+    params and the headers, api key included, are all the same. A caller with
+    a deadline waits for the shared call until its own deadline at most.
+    """
+    _lock = threading.Lock()
+    _in_flight = {}
+
+    @classmethod
+    def is_coalescable(cls, http_verb, **options):
+        # streamed bodies can only be read by one caller
+        return ApiConfig.coalesce_requests and http_verb == 'get' and not options.get('stream')
+
+    @classmethod
+    def key(cls, http_verb, url, **options):
+        params = options.get('params') or {}
+        headers = options.get('headers') or {}
+        return (ResponseCache.key(http_verb, url, params), str(params.get('api_key')),
+                tuple(sorted((str(k).lower(), str(v)) for k, v in headers.items())))
+
+    @classmethod
+    def request(cls, key, send, deadline=None):
+        with cls._lock:
+            call = cls._in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = cls._in_flight[key] = _Call()
+
+        if not is_leader:
+            timeout = None if deadline is None else max(0, deadline.remaining())
+            if not call.done.wait(timeout):
+                raise deadline.error()
+            if call.error is not None:
+                raise call.error
+            return cls.copy_response(call.response)
+
+        try:
+            call.response = send()
+            return call.response
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with cls._lock:
+                del cls._in_flight[key]
+            call.done.set()
+
+    @classmethod
+    def copy_response(cls, response):
+        copy = requests.Response()
+        copy.status_code = response.status_code
+        copy.url = response.url
+        copy.encoding = response.encoding
+        copy.reason = response.reason
+        copy.headers = CaseInsensitiveDict(response.headers)
+        copy.request = response.request
+        copy.elapsed = response.elapsed
+        copy._content = response.content
+        return copy
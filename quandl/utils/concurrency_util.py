@@ -0,0 +1,182 @@
+import email.utils
+import threading
+import time
+from contextlib import contextmanager
+
+from quandl.api_config import ApiConfig
+
+
+class AdaptiveConcurrency(object):
+    """ Bounds the API requests in flight at once across every thread of the
+    process, and adapts the bound to the throttling signals of the API. A
+    throttled response (429, 503 or a rate limit with nothing remaining) halves
+    the bound and pauses every caller until its `Retry-After` or rate limit
+    reset has passed, up to `ApiConfig.max_throttle_pause`, while each round of
+    successful requests raises it by one again, up to
+    `ApiConfig.max_concurrent_requests`. A caller with a deadline that would
+    pass before a slot frees up gets its `DeadlineExceededError` instead.
+    """
+    THROTTLE_STATUS_CODES = (429, 503)
+    DECREASE_FACTOR = 0.5
+    # throttled responses of requests sent in the same burst only shrink the bound once
+    DECREASE_INTERVAL = 1.0
+    REMAINING_HEADERS = ('x-ratelimit-remaining', 'ratelimit-remaining')
+    RESET_HEADERS = ('x-ratelimit-reset', 'ratelimit-reset')
+    # reset headers holding more seconds than this are epoch timestamps
+    EPOCH_THRESHOLD = 10 ** 9
+
+    _condition = threading.Condition()
+    _limit = None
+    _in_flight = 0
+    _paused_until = 0
+    _decreased_at = 0
+
+    @classmethod
+    def is_enabled(cls):
+        return bool(ApiConfig.max_concurrent_requests)
+
+    @classmethod
+    @contextmanager
+    def slot(cls, deadline=None):
+        acquired = cls.acquire(deadline)
+        try:
+            yield
+        finally:
+            if acquired:
+                cls.release()
+
+    @classmethod
+    def acquire(cls, deadline=None):
+        if not cls.is_enabled():
+            return False
+        with cls._condition:
+            while True:
+                acquired, wait = cls._try_acquire()
+                if acquired:
+                    return True
+                if deadline is not None:
+                    remaining = deadline.remaining()
+                    if remaining <= 0 or (wait is not None and wait >= remaining):
+                        raise deadline.error()
+                    wait = remaining if wait is None else wait
+                cls._condition.wait(wait)
+
+    @classmethod
+    def try_acquire(cls):
+        """ Takes a slot without blocking. Returns whether a slot was taken and
+        otherwise the seconds worth waiting before trying again, or None when
+        the wait lasts until another request finishes.
+        """
+        if not cls.is_enabled():
+            return False, None
+        with cls._condition:
+            return cls._try_acquire()
+
+    @classmethod
+    def release(cls):
+        with cls._condition:
+            cls._in_flight = max(0, cls._in_flight - 1)
+            cls._condition.notify_all()
+
+    @classmethod
+    def record(cls, status_code, headers):
+        if not cls.is_enabled():
+            return
+        delay = cls.throttle_delay(status_code, headers)
+        if delay is not None and ApiConfig.max_throttle_pause is not None:
+            delay = min(delay, ApiConfig.max_throttle_pause)
+        now = time.time()
+        with cls._condition:
+            limit = cls._current_limit()
+            if delay is not None:
+                if now - cls._decreased_at >= cls.DECREASE_INTERVAL:
+                    cls._limit = max(1.0, limit * cls.DECREASE_FACTOR)
+                    cls._decreased_at = now
+                cls._paused_until = max(cls._paused_until, now + delay)
+            elif 200 <= status_code < 300:
+                cls._limit = min(float(ApiConfig.max_concurrent_requests), limit + 1.0 / limit)
+            cls._condition.notify_all()
+
+    @classmethod
+    def current_limit(cls):
+        with cls._condition:
+            return int(cls._current_limit())
+
+    @classmethod
+    def reset(cls):
+        with cls._condition:
+            cls._limit = None
+            cls._in_flight = 0
+            cls._paused_until = 0
+            cls._decreased_at = 0
+            cls._condition.notify_all()
+
+    @classmethod
+    def throttle_delay(cls, status_code, headers):
+        """ Seconds to hold every request back after a response, or None when
+        the response does not ask the client to slow down.
+        """
+        headers = headers or {}
+        if status_code in cls.THROTTLE_STATUS_CODES:
+            return cls.retry_after(headers) or 0
+        remaining = cls._header_number(headers, cls.REMAINING_HEADERS)
+        if remaining is not None and remaining <= 0:
+            return cls._reset_delay(headers) or 0
+        return None
+
+    @staticmethod
+    def retry_after(headers):
+        """ Seconds given by a `Retry-After` header, as a number of seconds or an
+        HTTP date, or None when there is no usable header.
+        """
+        value = (headers or {}).get('retry-after')
+        if value is None:
+            return None
+        value = str(value).strip()
+        if value.isdigit():
+            return int(value)
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return max(0, retry_at.timestamp() - time.time())
+
+    @classmethod
+    def _try_acquire(cls):
+        pause = cls._paused_until - time.time()
+        if pause > 0:
+            return False, pause
+        if cls._in_flight < int(cls._current_limit()):
+            cls._in_flight += 1
+            return True, None
+        return False, None
+
+    @classmethod
+    def _current_limit(cls):
+        maximum = float(ApiConfig.max_concurrent_requests)
+        if cls._limit is None or cls._limit > maximum:
+            cls._limit = maximum
+        return cls._limit
+
+    @classmethod
+    def _reset_delay(cls, headers):
+        reset = cls._header_number(headers, cls.RESET_HEADERS)
+        if reset is None:
+            return cls.retry_after(headers)
+        if reset > cls.EPOCH_THRESHOLD:
+            return max(0, reset - time.time())
+        return reset
+
+    @staticmethod
+    def _header_number(headers, names):
+        for name in names:
+            value = headers.get(name)
+            if value is None:
+                continue
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+        return None
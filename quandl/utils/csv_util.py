@@ -0,0 +1,52 @@
+import io
+
+from quandl.model.data_list import DataColumns
+
+
+class CsvDecoder(object):
+    """ Decodes a CSV data response with the C parser of pandas into the same
+    structure its JSON counterpart decodes to, the rows held column by column
+    in `DataColumns` as numpy or pandas arrays. Columns are typed with `dtypes`
+    where given, dates are kept as text to be converted like JSON ones, and
+    empty cells of text columns become None as JSON nulls do.
+    """
+    # datatable pages served as CSV carry their cursor in a header
+    CURSOR_HEADER = 'cursor_id'
+
+    def __init__(self, dtypes=None):
+        self.dtypes = dtypes
+
+    def decode_dataset_data(self, response):
+        names, columns = self._read(response)
+        return {'dataset_data': {'column_names': names, 'data': columns}}
+
+    def decode_datatable(self, response, column_types):
+        names, columns = self._read(response)
+        return {'datatable': {'data': columns,
+                              'columns': list([{'name': name,
+                                                'type': column_types.get(name, 'String')}
+                                               for name in names])},
+                'meta': {'next_cursor_id': response.headers.get(self.CURSOR_HEADER) or None}}
+
+    def _read(self, response):
+        import pandas as pd
+        columns = DataColumns()
+        try:
+            df = pd.read_csv(io.BytesIO(response.content), engine='c', dtype=self.dtypes,
+                             keep_default_na=False, na_values=[''])
+        except pd.errors.EmptyDataError:
+            return [], columns
+        columns.columns = list([self._column(df.iloc[:, index])
+                                for index in range(len(df.columns))])
+        columns.row_count = len(df.index)
+        return list(df.columns), columns
+
+    @staticmethod
+    def _column(series):
+        import pandas as pd
+        if pd.api.types.is_extension_array_dtype(series.dtype):
+            return series.array
+        values = series.to_numpy()
+        if values.dtype == object:
+            values[pd.isna(values)] = None
+        return values
@@ -0,0 +1,107 @@
+import threading
+import time
+
+from urllib3.util.timeout import Timeout
+
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import DeadlineExceededError
+from quandl.message import Message
+
+
+class Deadline(object):
+    """ The time by which a call, and every request it sends, has to be done.
+    The call records what it has received so far with `advance`, and `check`
+    raises `DeadlineExceededError` with that progress once the time is up.
+    Requests sent under a deadline never wait longer than what is left of it.
+    """
+
+    def __init__(self, seconds, description=None):
+        self.seconds = seconds
+        self.description = description
+        self.expires_at = time.monotonic() + seconds
+        self.progress = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def start(cls, seconds=None, description=None):
+        if seconds is None:
+            seconds = ApiConfig.deadline
+        if seconds is None:
+            return None
+        return cls(seconds, description)
+
+    def remaining(self):
+        return self.expires_at - time.monotonic()
+
+    def advance(self, **counts):
+        # datasets of a multiset call are fetched by several threads at once
+        with self._lock:
+            for name, count in counts.items():
+                self.progress[name] = self.progress.get(name, 0) + count
+
+    def check(self):
+        if self.remaining() <= 0:
+            raise self.error()
+
+    def error(self):
+        with self._lock:
+            progress = dict(self.progress)
+        received = ', '.join(['%s %s' % (count, name) for name, count in sorted(progress.items())])
+        return DeadlineExceededError(
+            Message.ERROR_DEADLINE_EXCEEDED % (self.description or 'The call', self.seconds,
+                                               received or 'nothing'),
+            deadline=self.seconds, progress=progress)
+
+    def timeout(self, timeout):
+        """ The (connect, read) timeout of a request sent now, shortened so it
+        ends by the deadline at the latest.
+        """
+        self.check()
+        remaining = self.remaining()
+        connect, read = Deadline.split_timeout(timeout)
+        return (remaining if connect is None else min(connect, remaining),
+                remaining if read is None else min(read, remaining))
+
+    def request_timeout(self, timeout):
+        """ The timeout given to urllib3 for a request sent now, which also
+        shortens the attempts urllib3 retries the request with.
+        """
+        connect, read = self.timeout(timeout)
+        return DeadlineTimeout(connect=connect, read=read, deadline=self)
+
+    @staticmethod
+    def split_timeout(timeout):
+        if isinstance(timeout, (tuple, list)):
+            return timeout[0], timeout[1]
+        return timeout, timeout
+
+
+class DeadlineTimeout(Timeout):
+    """ urllib3 `Timeout` of a request sent under a deadline. The connect and
+    read timeouts of every attempt at the request, retries included, are
+    shortened to what is left of the deadline when the attempt is made.
+    """
+    # a socket timeout of 0 would make the socket non-blocking instead
+    MIN_TIMEOUT = 0.001
+
+    def __init__(self, connect=None, read=None, deadline=None):
+        super(DeadlineTimeout, self).__init__(connect=connect, read=read)
+        self.deadline = deadline
+
+    # urllib3 clones the timeout for every attempt
+    def clone(self):
+        return DeadlineTimeout(connect=self._connect, read=self._read, deadline=self.deadline)
+
+    @property
+    def connect_timeout(self):
+        return self._shorten(super(DeadlineTimeout, self).connect_timeout)
+
+    @property
+    def read_timeout(self):
+        return self._shorten(super(DeadlineTimeout, self).read_timeout)
+
+    def _shorten(self, timeout):
+        remaining = max(self.deadline.remaining(), self.MIN_TIMEOUT)
+        if timeout is None or timeout is Timeout.DEFAULT_TIMEOUT:
+            return remaining
+        return min(timeout, remaining)
@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from quandl.api_config import ApiConfig
+from quandl.connection import Connection
+from quandl.errors.quandl_error import QuandlError
+from quandl.message import Message
+
+
+class FileDownloader(object):
+    """ Downloads a file into `file_path` from a streamed response. When the
+    server accepts byte ranges the file is split into parts fetched over
+    several connections at once into a preallocated `.part` file, otherwise the
+    response is copied with a read size that grows with the throughput.
+    Progress is recorded next to the `.part` file so a failed download resumes
+    where it stopped, as long as the server still reports the same file.
+    """
+    PART_SUFFIX = '.part'
+    STATE_SUFFIX = '.part.json'
+    MIN_CHUNK_SIZE = 64 * 1024
+    MAX_CHUNK_SIZE = 8 * 1024 * 1024
+    # reads taking less than this grow the chunk size, ten times as long shrink it
+    TARGET_READ_SECONDS = 0.05
+
+    def __init__(self, file_path, chunk_size=None, workers=None, part_size=None):
+        self.file_path = file_path
+        self.part_path = file_path + self.PART_SUFFIX
+        self.state_path = file_path + self.STATE_SUFFIX
+        self.chunk_size = chunk_size or self.MIN_CHUNK_SIZE
+        self.workers = workers or ApiConfig.bulk_download_workers
+        self.part_size = part_size or ApiConfig.bulk_download_part_size
+        self._state_lock = threading.Lock()
+
+    def download(self, response):
+        size = self._content_length(response)
+        identity = {'size': size,
+                    'etag': response.headers.get('etag'),
+                    'last_modified': response.headers.get('last-modified')}
+        accepts_ranges = size is not None and response.headers.get('accept-ranges') == 'bytes'
+        state = self._read_state(identity)
+
+        if accepts_ranges and (self.workers > 1 and size > self.part_size or
+                               state.get('parts') is not None):
+            response.close()
+            self._download_parts(response.url, size, identity, state)
+        elif accepts_ranges and state.get('stream') and os.path.getsize(self.part_path) > 0:
+            response.close()
+            self._download_rest(response.url, identity)
+        else:
+            self._download_stream(response, identity)
+
+        os.replace(self.part_path, self.file_path)
+        self._remove(self.state_path)
+        return self.file_path
+
+    # the bytes already in the .part file are the progress of a streamed download
+    def _download_stream(self, response, identity, mode='wb'):
+        self._write_state(dict(identity, stream=True))
+        with open(self.part_path, mode) as fd:
+            for chunk in self._read_chunks(response):
+                fd.write(chunk)
+        response.close()
+
+    def _download_rest(self, url, identity):
+        response = self._request_range(url, os.path.getsize(self.part_path))
+        self._download_stream(response, identity, mode='ab')
+
+    def _download_parts(self, url, size, identity, state):
+        parts = list([(start, min(start + self.part_size, size) - 1)
+                      for start in range(0, size, self.part_size)])
+        done = set(state.get('parts') or [])
+        if not done or not os.path.exists(self.part_path):
+            done = set()
+            self._preallocate(size)
+        self._write_state(dict(identity, parts=sorted(done)))
+
+        def download_part(index):
+            start, end = parts[index]
+            length = end - start + 1
+            response = self._request_range(url, start, end)
+            received = 0
+            with open(self.part_path, 'r+b') as fd:
+                fd.seek(start)
+                for chunk in self._read_chunks(response):
+                    # bytes past the range would overwrite the next part
+                    fd.write(chunk[:max(length - received, 0)])
+                    received += len(chunk)
+            response.close()
+            # a part cut short is not recorded, so it is fetched again on resume
+            if received != length:
+                raise QuandlError(Message.ERROR_RANGE_INCOMPLETE %
+                                  (received, length, 'bytes=%s-%s' % (start, end)))
+            with self._state_lock:
+                done.add(index)
+                self._write_state(dict(identity, parts=sorted(done)))
+
+        pending = [index for index in range(len(parts)) if index not in done]
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(pending))))
+        futures = [executor.submit(download_part, index) for index in pending]
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _request_range(self, url, start, end=None):
+        byte_range = 'bytes=%s-%s' % (start, '' if end is None else end)
+        # the file is served from a signed url, so no api headers are sent
+        response = Connection.get_session().get(url, headers={'Range': byte_range},
+                                                stream=True, verify=ApiConfig.verify_ssl,
+                                                timeout=Connection.request_timeout())
+        # a 200 is the whole file and a range starting elsewhere belongs to other bytes
+        content_range = response.headers.get('content-range', 'bytes %s-' % start)
+        if response.status_code != 206 or not content_range.startswith('bytes %s-' % start):
+            response.close()
+            raise QuandlError(Message.ERROR_RANGE_NOT_SATISFIED % byte_range,
+                              http_status=response.status_code)
+        return response
+
+    def _read_chunks(self, response):
+        chunk_size = self.chunk_size
+        while True:
+            started = time.time()
+            chunk = response.raw.read(chunk_size, decode_content=True)
+            if not chunk:
+                return
+            elapsed = time.time() - started
+            yield chunk
+            if elapsed < self.TARGET_READ_SECONDS and len(chunk) == chunk_size:
+                chunk_size = min(chunk_size * 2, self.MAX_CHUNK_SIZE)
+            elif elapsed > self.TARGET_READ_SECONDS * 10:
+                chunk_size = max(chunk_size // 2, self.MIN_CHUNK_SIZE)
+
+    def _preallocate(self, size):
+        with open(self.part_path, 'wb') as fd:
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd.fileno(), 0, size)
+                    return
+                except OSError:
+                    pass
+            fd.truncate(size)
+
+    def _read_state(self, identity):
+        # progress only counts when the server still reports the same file
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not os.path.exists(self.part_path):
+            return {}
+        if any(state.get(key) != value for key, value in identity.items()):
+            return {}
+        return state
+
+    def _write_state(self, state):
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
+
+    @staticmethod
+    def _content_length(response):
+        try:
+            return int(response.headers['content-length'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,125 @@
+import heapq
+import itertools
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from quandl.api_config import ApiConfig
+from quandl.model.datatable import Datatable
+
+log = logging.getLogger(__name__)
+
+
+class ExportJob(object):
+    """ One table export followed by an `ExportManager`, with the time spent
+    waiting for the file to be generated and downloading it.
+    """
+
+    def __init__(self, datatable_code, params):
+        self.datatable_code = datatable_code
+        self.params = params
+        self.path = None
+        self.error = None
+        self.polls = 0
+        self.submitted_at = None
+        self.ready_at = None
+        self.finished_at = None
+
+    @property
+    def generation_seconds(self):
+        return self._elapsed(self.submitted_at, self.ready_at)
+
+    @property
+    def download_seconds(self):
+        return self._elapsed(self.ready_at, self.finished_at)
+
+    @property
+    def total_seconds(self):
+        return self._elapsed(self.submitted_at, self.finished_at)
+
+    @staticmethod
+    def _elapsed(start, end):
+        if start is None or end is None:
+            return None
+        return end - start
+
+    def __repr__(self):
+        return '<ExportJob %s polls=%s generation=%s download=%s error=%r>' % (
+            self.datatable_code, self.polls, self.generation_seconds,
+            self.download_seconds, self.error)
+
+
+class ExportManager(object):
+    """ Exports several tables at once. Every export is requested straight away
+    and polled on its own schedule, checked again after
+    `ApiConfig.export_poll_interval` seconds and then twice as late each time,
+    and downloaded as soon as its file is fresh. Polls and downloads share a
+    pool of `ApiConfig.export_workers` threads.
+    """
+
+    def __init__(self, folder='.', max_workers=None):
+        self.folder = folder
+        self.max_workers = max_workers or ApiConfig.export_workers
+        self.jobs = []
+
+    def submit(self, datatable_code, **params):
+        job = ExportJob(datatable_code, params)
+        self.jobs.append(job)
+        return job
+
+    def run(self):
+        order = itertools.count()
+        schedule = []
+        for job in self.jobs:
+            job.submitted_at = time.time()
+            heapq.heappush(schedule, (job.submitted_at, next(order), job, None))
+
+        in_flight = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while schedule or in_flight:
+                while schedule and schedule[0][0] <= time.time():
+                    _, _, job, interval = heapq.heappop(schedule)
+                    in_flight[executor.submit(self._poll, job)] = (job, interval)
+
+                timeout = max(0, schedule[0][0] - time.time()) if schedule else None
+                if not in_flight:
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(list(in_flight.keys()), timeout=timeout,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, interval = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        job.error = e
+                        job.finished_at = time.time()
+                        log.debug('Export of %s failed: %s', job.datatable_code, e)
+                        continue
+                    if job.ready_at is None and result is None:
+                        interval = Datatable.next_generation_wait(interval)
+                        heapq.heappush(schedule, (time.time() + interval, next(order),
+                                                  job, interval))
+                    elif job.ready_at is None:
+                        job.ready_at = time.time()
+                        in_flight[executor.submit(self._download, job, result)] = (job, None)
+                    else:
+                        job.path = result
+                        job.finished_at = time.time()
+                        log.debug('Exported %s in %.1fs (%.1fs generating)', job.datatable_code,
+                                  job.total_seconds, job.generation_seconds)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+        return self.jobs
+
+    def _poll(self, job):
+        job.polls += 1
+        params = dict(job.params)
+        return Datatable(job.datatable_code)._request_file_link(params=params)
+
+    def _download(self, job, file_link):
+        return Datatable(job.datatable_code)._download_file_with_link(
+            self.folder, file_link, job.datatable_code)
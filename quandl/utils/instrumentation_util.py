@@ -0,0 +1,120 @@
+import threading
+import time
+
+
+class Instrumentation(object):
+    """ Sends timing events to the callbacks registered with `register`. Every
+    event is a dict holding its name under `event`, the seconds it took under
+    `seconds` and fields describing it, such as the bytes received:
+
+    - `request`: one HTTP call, with `method`, `url`, `status`, `bytes`,
+      `ttfb_seconds` (until the headers of its last attempt arrived),
+      `download_seconds`, the `retries` made and the `retry_wait_seconds` spent
+      waiting before them. `seconds` starts once the request holds a slot of
+      `AdaptiveConcurrency`; the time spent waiting for that slot and for the
+      `RateLimiter` is reported as `slot_wait_seconds` and `rate_limit_wait_seconds`
+    - `decode`: the JSON body of a list or page response decoded, with `bytes`
+    - `convert_dates`: the dates of a response converted
+    - `build`: the rows of a response turned into a list, with `model` and `rows`
+    - `to_pandas`: a list turned into a dataframe, with `rows` and `columns`
+
+    While no callback is registered `start` returns None and the call sites
+    skip measuring altogether.
+    """
+    _callbacks = ()
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, callback):
+        with cls._lock:
+            cls._callbacks = cls._callbacks + (callback,)
+        return callback
+
+    @classmethod
+    def unregister(cls, callback):
+        with cls._lock:
+            cls._callbacks = tuple([c for c in cls._callbacks if c != callback])
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._callbacks = ()
+
+    @classmethod
+    def start(cls):
+        if not cls._callbacks:
+            return None
+        return time.perf_counter()
+
+    @classmethod
+    def finish(cls, event, started, **fields):
+        if started is None:
+            return
+        fields['event'] = event
+        fields['seconds'] = time.perf_counter() - started
+        cls.emit(fields)
+
+    @classmethod
+    def emit(cls, event):
+        # a failing callback must never break the request it is measuring
+        for callback in cls._callbacks:
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+
+class TimingAggregator(object):
+    """ Callback collecting the events it receives, to report the count, total
+    and percentiles of the seconds spent, and the bytes received, per event.
+
+        aggregator = Instrumentation.register(TimingAggregator())
+        quandl.get_table('ZACKS/FC', paginate=True)
+        print(aggregator.report())
+    """
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seconds = {}
+        self._bytes = {}
+
+    def __call__(self, event):
+        with self._lock:
+            self._seconds.setdefault(event['event'], []).append(event['seconds'])
+            if event.get('bytes') is not None:
+                self._bytes[event['event']] = self._bytes.get(event['event'], 0) + event['bytes']
+
+    def summary(self):
+        with self._lock:
+            seconds = dict([(name, sorted(values)) for name, values in self._seconds.items()])
+            received = dict(self._bytes)
+        summary = {}
+        for name, values in seconds.items():
+            stats = {'count': len(values), 'total': sum(values), 'max': values[-1],
+                     'bytes': received.get(name)}
+            for percentile in self.PERCENTILES:
+                stats['p%s' % percentile] = self.percentile(values, percentile)
+            summary[name] = stats
+        return summary
+
+    def report(self):
+        columns = ['count', 'total'] + ['p%s' % p for p in self.PERCENTILES] + ['max']
+        lines = ['%-14s' % 'event' + ''.join(['%10s' % c for c in columns]) + '%14s' % 'bytes']
+        for name, stats in sorted(self.summary().items()):
+            line = '%-14s%10d' % (name, stats['count'])
+            line += ''.join(['%10.4f' % stats[c] for c in columns[1:]])
+            line += '%14s' % ('-' if stats['bytes'] is None else stats['bytes'])
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._seconds = {}
+            self._bytes = {}
+
+    @staticmethod
+    def percentile(sorted_values, percentile):
+        # nearest rank, so every reported value is one that was measured
+        rank = int(-(-percentile * len(sorted_values) // 100))
+        return sorted_values[max(0, rank - 1)]
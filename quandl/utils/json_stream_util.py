@@ -0,0 +1,135 @@
+import codecs
+import json
+
+from quandl.model.data_list import DataColumns
+
+
+class StreamingJsonDecoder(object):
+    """ Decodes a streamed JSON response without holding the whole body in memory.
+    Arrays found at one of `data_paths` (e.g. ('datatable', 'data')) are read one
+    row at a time into `DataColumns` buffers, everything else is decoded as usual.
+    """
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, data_paths, chunk_size=None):
+        self.data_paths = [tuple(path) for path in data_paths]
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self._decoder = json.JSONDecoder()
+
+    def decode(self, response):
+        self._chunks = response.iter_content(chunk_size=self.chunk_size)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._exhausted = False
+
+        self._skip_whitespace()
+        value = self._parse_value(())
+        self._skip_whitespace(allow_end=True)
+        if self._pos < len(self._buffer):
+            raise ValueError('Extra data after JSON document at position %s' % self._pos)
+        return value
+
+    def _parse_value(self, path):
+        char = self._peek()
+        if char == '{' and self._leads_to_data(path):
+            return self._parse_object(path)
+        elif char == '[' and path in self.data_paths:
+            return self._parse_rows()
+        return self._decode_value()
+
+    def _parse_object(self, path):
+        self._pos += 1
+        result = {}
+        self._skip_whitespace()
+        if self._peek() == '}':
+            self._pos += 1
+            return result
+
+        while True:
+            self._skip_whitespace()
+            key = self._decode_value()
+            self._skip_whitespace()
+            self._expect(':')
+            self._skip_whitespace()
+            result[key] = self._parse_value(path + (key,))
+            self._skip_whitespace()
+            char = self._expect(',}')
+            if char == '}':
+                return result
+
+    def _parse_rows(self):
+        self._pos += 1
+        columns = DataColumns()
+        self._skip_whitespace()
+        if self._peek() == ']':
+            self._pos += 1
+            return columns
+
+        while True:
+            self._skip_whitespace()
+            columns.append_row(self._decode_value())
+            self._skip_whitespace()
+            char = self._expect(',]')
+            if char == ']':
+                return columns
+
+    def _decode_value(self):
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                # the value continues in a chunk that has not been read yet
+                if self._read_more():
+                    continue
+                raise
+            # a number ending the buffer may have more digits in the next chunk
+            if end == len(self._buffer) and self._read_more():
+                continue
+            self._pos = end
+            return value
+
+    def _leads_to_data(self, path):
+        return any(len(data_path) > len(path) and data_path[:len(path)] == path
+                   for data_path in self.data_paths)
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char not in chars:
+            raise ValueError('Expecting one of %r at position %s' % (chars, self._pos))
+        self._pos += 1
+        return char
+
+    def _peek(self):
+        while self._pos >= len(self._buffer):
+            if not self._read_more():
+                raise ValueError('Unexpected end of JSON document')
+        return self._buffer[self._pos]
+
+    def _skip_whitespace(self, allow_end=False):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\n\r':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return
+            if not self._read_more():
+                if allow_end:
+                    return
+                raise ValueError('Unexpected end of JSON document')
+
+    def _read_more(self):
+        if self._exhausted:
+            return False
+        text = ''
+        while not text:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                text = self._text_decoder.decode(b'', final=True)
+                self._exhausted = True
+                break
+            text = self._text_decoder.decode(chunk)
+        # drop what has already been parsed so the buffer stays small
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return bool(text)
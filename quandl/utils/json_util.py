@@ -0,0 +1,48 @@
+import json
+
+from quandl.api_config import ApiConfig
+
+
+class JsonUtil(object):
+    """ Decodes JSON response bodies with `ApiConfig.json_decoder` when it is set,
+    otherwise with the fastest decoder installed (orjson, then ujson), falling
+    back to the standard library.
+    """
+    _default_decoder = None
+
+    @classmethod
+    def decode_response(cls, response):
+        return cls.loads(response.content)
+
+    @classmethod
+    def loads(cls, content):
+        decoder = cls.decoder()
+        if decoder is json.loads:
+            return json.loads(content)
+        try:
+            return decoder(content)
+        except ValueError:
+            # fast decoders reject some valid documents, e.g. integers above 64 bits
+            return json.loads(content)
+
+    @classmethod
+    def decoder(cls):
+        if ApiConfig.json_decoder is not None:
+            return ApiConfig.json_decoder
+        if cls._default_decoder is None:
+            cls._default_decoder = cls._detect_decoder()
+        return cls._default_decoder
+
+    @staticmethod
+    def _detect_decoder():
+        try:
+            import orjson
+            return orjson.loads
+        except ImportError:
+            pass
+        try:
+            import ujson
+            return ujson.loads
+        except ImportError:
+            pass
+        return json.loads
@@ -0,0 +1,76 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from quandl.api_config import ApiConfig
+from quandl.utils.cache_util import ResponseCache
+
+
+class MetadataCache(object):
+    """ Process wide cache of the metadata fetched by `GetOperation` models,
+    keyed on the model class, its code and the request params. Entries expire
+    after `ApiConfig.metadata_cache_ttl` seconds and the least recently used
+    ones are dropped beyond `ApiConfig.metadata_cache_max_entries`. Every model
+    gets its own copy, so changing one never changes another.
+    """
+    _lock = threading.Lock()
+    _entries = OrderedDict()
+
+    @classmethod
+    def is_enabled(cls):
+        return ApiConfig.metadata_cache_ttl is not None and ApiConfig.metadata_cache_max_entries > 0
+
+    @classmethod
+    def key(cls, klass, code, path, params=None):
+        return (klass.__name__, str(code), ResponseCache.key('get', path, params))
+
+    @classmethod
+    def get(cls, klass, code, path, params=None):
+        if not cls.is_enabled():
+            return None
+        key = cls.key(klass, code, path, params)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, raw_data = entry
+            if time.time() - stored_at >= ApiConfig.metadata_cache_ttl:
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+        return copy.deepcopy(raw_data)
+
+    @classmethod
+    def put(cls, klass, code, path, params, raw_data):
+        if not cls.is_enabled():
+            return
+        key = cls.key(klass, code, path, params)
+        raw_data = copy.deepcopy(raw_data)
+        with cls._lock:
+            cls._entries[key] = (time.time(), raw_data)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > ApiConfig.metadata_cache_max_entries:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, klass=None, code=None):
+        """ Drops the entries of a model class, of one code or of one code of a
+        class, or every entry when called without arguments.
+        """
+        with cls._lock:
+            for key in list(cls._entries.keys()):
+                if klass is not None and key[0] != klass.__name__:
+                    continue
+                if code is not None and key[1] != str(code):
+                    continue
+                del cls._entries[key]
+
+    @classmethod
+    def clear(cls):
+        cls.invalidate()
+
+    @classmethod
+    def size(cls):
+        with cls._lock:
+            return len(cls._entries)
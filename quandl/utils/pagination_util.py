@@ -0,0 +1,132 @@
+import copy
+import sys
+import threading
+import warnings
+
+from six.moves import queue
+
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import LimitExceededError
+from quandl.message import Message
+from quandl.model.data import Data
+
+
+class Paginator(object):
+    """ Iterates over the cursor pages of a datatable (or point in time) request.
+    When paginating, pages are requested by a background worker which follows
+    `next_cursor_id` as soon as each response is decoded, so building one page
+    overlaps with the network I/O of the next. At most `prefetch_pages`
+    responses are held ahead of the caller.
+    """
+
+    def __init__(self, datatable, options, paginate=None, prefetch_pages=None,
+                 cache_ttl=None, timeout=None, deadline=None, wire_format=None):
+        self.datatable = datatable
+        self.options = options
+        self.paginate = paginate
+        if prefetch_pages is None:
+            prefetch_pages = ApiConfig.prefetch_pages
+        self.prefetch_pages = prefetch_pages
+        self.deadline = deadline
+        self.request_options = {}
+        if cache_ttl is not None:
+            self.request_options['cache_ttl'] = cache_ttl
+        if timeout is not None:
+            self.request_options['timeout'] = timeout
+        if deadline is not None:
+            self.request_options['deadline'] = deadline
+        if wire_format is not None:
+            self.request_options['wire_format'] = wire_format
+
+    def __iter__(self):
+        responses = self._responses()
+        if self.paginate is True and self.prefetch_pages > 0:
+            responses = self._prefetch(responses)
+        for response_data in responses:
+            yield Data.build_page(response_data)
+
+    # one DataFrame per page, for callers processing a table a page at a time
+    def data_frames(self):
+        pages = iter(self)
+        try:
+            for page in pages:
+                yield page.to_pandas()
+        finally:
+            # stops the prefetch worker when the caller stops early
+            pages.close()
+
+    def _responses(self):
+        options = self.options
+        page_count = 0
+        while True:
+            if self.deadline is not None:
+                self.deadline.check()
+            next_options = copy.deepcopy(options)
+            response_data = Data.request_page(self.datatable, params=next_options,
+                                              **self.request_options)
+            # read the cursor before the page is handed over to be built
+            next_cursor_id = response_data['meta']['next_cursor_id']
+            if self.deadline is not None:
+                self.deadline.advance(pages=1, rows=len(response_data['datatable']['data']))
+
+            yield response_data
+
+            if not self._has_next_page(page_count, next_cursor_id):
+                break
+
+            page_count = page_count + 1
+            options['qopts.cursor_id'] = next_cursor_id
+
+    def _has_next_page(self, page_count, next_cursor_id):
+        if page_count >= ApiConfig.page_limit:
+            raise LimitExceededError(
+                Message.WARN_DATA_LIMIT_EXCEEDED % (self.datatable.code,
+                                                    ApiConfig.api_key
+                                                    )
+            )
+
+        if next_cursor_id is None:
+            return False
+        elif self.paginate is not True and next_cursor_id is not None:
+            warnings.warn(Message.WARN_PAGE_LIMIT_EXCEEDED, UserWarning)
+            return False
+        return True
+
+    def _prefetch(self, responses):
+        pending = queue.Queue(maxsize=self.prefetch_pages)
+        stopped = threading.Event()
+        done = object()
+
+        def put(item):
+            # give up when the caller stops iterating while the queue is full
+            while not stopped.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch():
+            try:
+                for response_data in responses:
+                    if not put((response_data, None)):
+                        return
+            except Exception:
+                put((None, sys.exc_info()[1]))
+                return
+            put((done, None))
+
+        worker = threading.Thread(target=fetch, name='quandl-prefetch')
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                response_data, error = pending.get()
+                if error is not None:
+                    raise error
+                if response_data is done:
+                    break
+                yield response_data
+        finally:
+            stopped.set()
@@ -0,0 +1,113 @@
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from quandl.api_config import ApiConfig
+
+
+class RateLimiter(object):
+    """ Spaces API requests so they stay within `ApiConfig.rate_limit_per_second`
+    and `ApiConfig.rate_limit_per_day`. Each request, and each of its retries,
+    reserves the next free slot and waits for it outside of any lock, so threads
+    queue up fairly. Requests
+    are spread evenly, one every 1 / rate_limit_per_second seconds, and once the
+    daily allowance is used up they wait for the next UTC day. When
+    `ApiConfig.rate_limit_file` is set the reservations are kept in that file,
+    locked while it is updated, so every process using it shares the limits.
+    A request made under a deadline it would run out of while waiting fails
+    straight away, without taking a slot from the others.
+    """
+    SECONDS_PER_DAY = 24 * 60 * 60
+    _lock = threading.Lock()
+    _state = {}
+
+    @classmethod
+    def is_enabled(cls):
+        return bool(ApiConfig.rate_limit_per_second or ApiConfig.rate_limit_per_day)
+
+    @classmethod
+    def wait(cls, deadline=None):
+        max_delay = None if deadline is None else deadline.remaining()
+        delay = cls.reserve(max_delay=max_delay)
+        if max_delay is not None and delay >= max_delay:
+            raise deadline.error()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    @classmethod
+    def reserve(cls, now=None, max_delay=None):
+        """ Reserves the next free slot and returns the seconds to wait for it.
+        A slot further away than `max_delay` is not reserved.
+        """
+        if not cls.is_enabled():
+            return 0
+        if now is None:
+            now = time.time()
+        with cls._lock:
+            if ApiConfig.rate_limit_file and fcntl is not None:
+                return cls._reserve_in_file(ApiConfig.rate_limit_file, now, max_delay)
+            return cls._reserve(cls._state, now, max_delay)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._state = {}
+
+    @classmethod
+    def _reserve(cls, state, now, max_delay=None):
+        reserved = dict(state)
+        start = max(now, reserved.get('next_at', 0))
+
+        if ApiConfig.rate_limit_per_day:
+            day = cls._day(start)
+            if reserved.get('day') != day:
+                reserved['day'] = day
+                reserved['count'] = 0
+            if reserved['count'] >= ApiConfig.rate_limit_per_day:
+                start = (day + 1) * cls.SECONDS_PER_DAY
+                reserved['day'] = day + 1
+                reserved['count'] = 0
+            reserved['count'] += 1
+
+        if ApiConfig.rate_limit_per_second:
+            reserved['next_at'] = start + 1.0 / ApiConfig.rate_limit_per_second
+        else:
+            reserved['next_at'] = start
+        if max_delay is None or start - now < max_delay:
+            state.update(reserved)
+        return start - now
+
+    @classmethod
+    def _reserve_in_file(cls, path, now, max_delay=None):
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'a+') as f:
+            # other processes block here until this reservation is written
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or '{}')
+                except ValueError:
+                    state = {}
+                delay = cls._reserve(state, now, max_delay)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return delay
+
+    @classmethod
+    def _day(cls, timestamp):
+        # days are counted in UTC, as a number of days since the epoch
+        return int(timestamp // cls.SECONDS_PER_DAY)
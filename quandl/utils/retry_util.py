@@ -0,0 +1,79 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from urllib3.util.retry import Retry
+
+from quandl.utils.concurrency_util import AdaptiveConcurrency
+from quandl.utils.rate_limit_util import RateLimiter
+
+
+class ApiRetry(Retry):
+    """ `Retry` whose longest backoff is kept on the instance, so sessions built
+    with different settings never share it through the `Retry` class, and which
+    reports every response it retries to `AdaptiveConcurrency` so throttling
+    seen by one request slows down the others too. Every retry waits for a
+    `RateLimiter` slot of its own after the backoff, so retries count against
+    the rate limits like the first attempt. Requests sent `within` a deadline
+    are only retried while the retry can start before it, and raise its
+    `DeadlineExceededError` otherwise. `within` yields the retries made, the
+    seconds waited before them and when the last attempt started.
+    """
+    DEFAULT_BACKOFF_MAX = 120
+    # the deadline and attempts of the request the current thread is sending
+    _local = threading.local()
+
+    @classmethod
+    @contextmanager
+    def within(cls, deadline):
+        previous = (getattr(cls._local, 'deadline', None), getattr(cls._local, 'attempts', None))
+        attempts = {'retries': 0, 'retry_wait_seconds': 0.0, 'last_attempt_at': None}
+        cls._local.deadline, cls._local.attempts = deadline, attempts
+        try:
+            yield attempts
+        finally:
+            cls._local.deadline, cls._local.attempts = previous
+
+    def __init__(self, *args, **kwargs):
+        # older urllib3 releases only read the longest backoff from the class
+        backoff_max = kwargs.pop('backoff_max', self.DEFAULT_BACKOFF_MAX)
+        super(ApiRetry, self).__init__(*args, **kwargs)
+        self.backoff_max = backoff_max
+
+    def new(self, **kw):
+        kw.setdefault('backoff_max', self.backoff_max)
+        return super(ApiRetry, self).new(**kw)
+
+    def get_backoff_time(self):
+        return min(self.backoff_max, super(ApiRetry, self).get_backoff_time())
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None,
+                  _stacktrace=None):
+        if response is not None:
+            AdaptiveConcurrency.record(response.status, response.headers)
+        retry = super(ApiRetry, self).increment(method=method, url=url, response=response,
+                                                error=error, _pool=_pool,
+                                                _stacktrace=_stacktrace)
+        deadline = getattr(self._local, 'deadline', None)
+        if deadline is not None and deadline.remaining() <= retry.wait_before_retry(response):
+            if response is not None:
+                response.drain_conn()
+            raise deadline.error()
+        return retry
+
+    def sleep(self, response=None):
+        waiting_since = time.perf_counter()
+        super(ApiRetry, self).sleep(response)
+        RateLimiter.wait(getattr(self._local, 'deadline', None))
+        attempts = getattr(self._local, 'attempts', None)
+        if attempts is not None:
+            attempts['last_attempt_at'] = time.perf_counter()
+            attempts['retries'] += 1
+            attempts['retry_wait_seconds'] += attempts['last_attempt_at'] - waiting_since
+
+    # the seconds urllib3 sleeps for before sending the request again
+    def wait_before_retry(self, response=None):
+        wait = self.get_backoff_time()
+        if response is not None and self.respect_retry_after_header:
+            wait = max(wait, self.get_retry_after(response) or 0)
+        return wait
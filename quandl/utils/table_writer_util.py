@@ -0,0 +1,125 @@
+from quandl.errors.quandl_error import InvalidRequestError
+from quandl.message import Message
+from quandl.util import Util
+
+
+class TableWriter(object):
+    """ Writes the pages of a datatable request to a file as they arrive, so
+    only the page being written is held in memory. Subclasses handle one
+    output format each.
+    """
+
+    @classmethod
+    def write_pages(cls, output, path, pages):
+        writer_class = OUTPUT_WRITERS.get(output)
+        if writer_class is None:
+            raise InvalidRequestError(Message.ERROR_OUTPUT_FORMAT % (output, ', '.join(
+                sorted(OUTPUT_WRITERS.keys()))))
+        if not path:
+            raise InvalidRequestError(Message.ERROR_OUTPUT_PATH_REQUIRED % output)
+
+        writer = writer_class(path)
+        try:
+            for page in pages:
+                writer.write(page)
+        finally:
+            writer.close()
+        return path
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, data_list):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class CsvTableWriter(TableWriter):
+
+    def __init__(self, path):
+        super(CsvTableWriter, self).__init__(path)
+        self._file = open(path, 'w', newline='')
+        self._header = True
+
+    def write(self, data_list):
+        data_list.to_pandas().to_csv(self._file, header=self._header, index=False)
+        self._header = False
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetTableWriter(TableWriter):
+    """ Writes every page as one row group of a single Parquet file. The schema
+    comes from the datatable column types so every page is written with the
+    same types, even when a page holds only nulls in some column. Columns of
+    types without a Parquet counterpart here take the type pyarrow infers
+    from the first page.
+    """
+
+    def __init__(self, path):
+        super(ParquetTableWriter, self).__init__(path)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise InvalidRequestError(Message.ERROR_OUTPUT_REQUIRES_PYARROW)
+        self._pyarrow = pyarrow
+        self._parquet = pyarrow.parquet
+        self._schema = None
+        self._writer = None
+
+    def write(self, data_list):
+        self.write_data_frame(data_list.to_pandas(), data_list.column_types)
+
+    def write_data_frame(self, data_frame, column_types):
+        if self._writer is None:
+            self._schema = self.schema(data_frame, column_types)
+            self._writer = self._parquet.ParquetWriter(self.path, self._schema)
+        table = self._pyarrow.Table.from_pandas(
+            data_frame, schema=self._schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+    def schema(self, data_frame, column_types):
+        pyarrow = self._pyarrow
+        inferred = pyarrow.Schema.from_pandas(data_frame, preserve_index=False)
+        fields = []
+        for index, (name, column_type) in enumerate(zip(data_frame.columns, column_types)):
+            arrow_type = self.column_type(column_type)
+            if arrow_type is None:
+                arrow_type = inferred.field(index).type
+                # a column with no values yet could hold anything, text keeps them all
+                if pyarrow.types.is_null(arrow_type):
+                    arrow_type = pyarrow.string()
+            fields.append((name, arrow_type))
+        return pyarrow.schema(fields)
+
+    # the Parquet type of a datatable column type, or None when it has none here
+    def column_type(self, column_type):
+        pyarrow = self._pyarrow
+        column_type = Util.normalize_column_type(column_type)
+        if column_type == 'date':
+            return pyarrow.date32()
+        elif column_type == 'datetime':
+            return pyarrow.timestamp('ns', tz='UTC')
+        elif column_type == 'integer':
+            return pyarrow.int64()
+        elif column_type == 'boolean':
+            return pyarrow.bool_()
+        elif column_type in ['double', 'float', 'bigdecimal']:
+            return pyarrow.float64()
+        elif column_type == 'string':
+            return pyarrow.string()
+        return None
+
+
+OUTPUT_WRITERS = {
+    'csv': CsvTableWriter,
+    'parquet': ParquetTableWriter
+}
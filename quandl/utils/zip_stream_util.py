@@ -0,0 +1,124 @@
+import io
+import struct
+import zipfile
+import zlib
+
+
+class ZipStreamReader(io.RawIOBase):
+    """ Reads the first member of a zip archive from a stream that cannot seek,
+    such as an HTTP response, decompressing it while it downloads. Only the
+    local file header in front of the member is used, so the archive never has
+    to be written to disk. Wrap it in `io.BufferedReader` for line access.
+    """
+    LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+    LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+    DATA_DESCRIPTOR_SIGNATURE = b'PK\x07\x08'
+    HAS_DATA_DESCRIPTOR = 0x08
+    ZIP64_EXTRA_ID = 0x0001
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, stream, read_size=None):
+        super(ZipStreamReader, self).__init__()
+        self.stream = stream
+        self.read_size = read_size or self.READ_SIZE
+        self.name = None
+        self._started = False
+        self._finished = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self._started:
+            self._read_local_header()
+        while not self._finished:
+            data = self._read_member(len(buffer))
+            if data:
+                buffer[:len(data)] = data
+                return len(data)
+        return 0
+
+    def _read_local_header(self):
+        self._started = True
+        header = self._read_exactly(self.LOCAL_HEADER.size)
+        (signature, _, flags, method, _, _, crc, compressed_size, _,
+         name_length, extra_length) = self.LOCAL_HEADER.unpack(header)
+        if signature != self.LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile('File is not a zip file')
+        self.name = self._read_exactly(name_length).decode('utf-8', 'replace')
+        extra = self._read_exactly(extra_length)
+
+        self._method = method
+        self._has_data_descriptor = bool(flags & self.HAS_DATA_DESCRIPTOR)
+        self._expected_crc = crc
+        self._crc = 0
+        if method == zipfile.ZIP_DEFLATED:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        elif method == zipfile.ZIP_STORED:
+            if self._has_data_descriptor:
+                raise zipfile.BadZipFile('Stored members of unknown size cannot be streamed')
+            self._remaining = self._zip64_size(extra, compressed_size)
+        else:
+            raise zipfile.BadZipFile('Unsupported compression method %s' % method)
+
+    def _read_member(self, limit):
+        if self._method == zipfile.ZIP_STORED:
+            data = self.stream.read(min(limit, self._remaining)) if self._remaining else b''
+            if self._remaining and not data:
+                raise zipfile.BadZipFile('Unexpected end of zip file')
+            self._remaining -= len(data)
+            self._crc = zlib.crc32(data, self._crc)
+            if not self._remaining:
+                self._finish(b'')
+        else:
+            compressed = self._decompressor.unconsumed_tail
+            if not compressed:
+                compressed = self.stream.read(self.read_size)
+                if not compressed:
+                    raise zipfile.BadZipFile('Unexpected end of zip file')
+            data = self._decompressor.decompress(compressed, limit)
+            self._crc = zlib.crc32(data, self._crc)
+            if self._decompressor.eof:
+                self._finish(self._decompressor.unused_data)
+        return data
+
+    def _finish(self, unused_data):
+        self._finished = True
+        expected_crc = self._expected_crc
+        if self._has_data_descriptor:
+            # the crc follows the data, after an optional signature
+            descriptor = unused_data + self._read_upto(8 - len(unused_data))
+            if descriptor[:4] == self.DATA_DESCRIPTOR_SIGNATURE:
+                descriptor = descriptor[4:]
+                descriptor += self._read_upto(4 - len(descriptor))
+            expected_crc = struct.unpack('<I', descriptor[:4])[0]
+        if self._crc != expected_crc:
+            raise zipfile.BadZipFile('Bad CRC-32 for file %r' % self.name)
+
+    def close(self):
+        super(ZipStreamReader, self).close()
+        if hasattr(self.stream, 'close'):
+            self.stream.close()
+
+    def _read_exactly(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.stream.read(size - len(data))
+            if not chunk:
+                raise zipfile.BadZipFile('Unexpected end of zip file')
+            data += chunk
+        return data
+
+    def _read_upto(self, size):
+        return self._read_exactly(size) if size > 0 else b''
+
+    def _zip64_size(self, extra, compressed_size):
+        if compressed_size != 0xFFFFFFFF:
+            return compressed_size
+        while len(extra) >= 4:
+            header_id, size = struct.unpack('<HH', extra[:4])
+            if header_id == self.ZIP64_EXTRA_ID:
+                # the uncompressed size comes first, then the compressed one
+                return struct.unpack('<Q', extra[12:20])[0]
+            extra = extra[4 + size:]
+        raise zipfile.BadZipFile('Missing zip64 size of a stored member')
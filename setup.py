@@ -29,8 +29,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'quandl'))
 from version import VERSION  # NOQA
 
 INSTALL_REQUIRES = [
-    'pandas >= 0.14',
-    'numpy >= 1.8',
+    'pandas >= 1.0',
+    'numpy >= 1.13.3',
     'requests >= 2.7.0',
     'inflection >= 0.3.1',
     'python-dateutil',
@@ -45,11 +45,17 @@ TEST_REQUIRES = [
         'mock',
         'factory_boy',
         'jsondate',
-        'parameterized'
+        'parameterized',
+        'aiohttp'
 ]
 
+EXTRAS_REQUIRE = {
+    'aio': ['aiohttp >= 3.5']
+}
+
 PACKAGES = [
     'quandl',
+    'quandl.aio',
     'quandl.errors',
     'quandl.model',
     'quandl.operations',
@@ -77,6 +83,7 @@ setup(
         "Programming Language :: Python :: 3.8"
     ],
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     tests_require=TEST_REQUIRES,
     python_requires='>= 3.6',
     test_suite="nose.collector",
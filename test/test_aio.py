@@ -0,0 +1,214 @@
+import asyncio
+import json
+import time
+import unittest
+import warnings
+
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import (DeadlineExceededError, InvalidRequestError,
+                                        NotFoundError)
+from quandl.model.data import Data
+from quandl.model.data_list import DataList
+from quandl.model.dataset import Dataset
+from test.factories.dataset import DatasetFactory
+from test.factories.dataset_data import DatasetDataFactory
+from test.factories.datatable_data import DatatableDataFactory
+from test.test_retries import ModifyRetrySettingsTestCase
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    import quandl.aio
+except ImportError:
+    web = None
+
+
+@unittest.skipIf(web is None, 'aiohttp is not installed')
+class AsyncApiTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        self.api_base = ApiConfig.api_base
+        ApiConfig.retry_backoff_factor = 0
+        self.requests = []
+        self.responses = {}
+        self.delay = 0
+
+    def tearDown(self):
+        ApiConfig.api_base = self.api_base
+        ApiConfig.api_key = None
+
+    def respond(self, path, *bodies, **kwargs):
+        self.responses[path] = [(body, kwargs.get('status', 200)) for body in bodies]
+
+    async def handle(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        bodies = self.responses.get(request.path)
+        if not bodies:
+            body, status = {'quandl_error': {'code': 'QECx02', 'message': 'not found'}}, 404
+        elif len(bodies) > 1:
+            body, status = bodies.pop(0)
+        else:
+            body, status = bodies[0]
+        return web.Response(text=json.dumps(body), status=status,
+                            content_type='application/json')
+
+    def run_with_server(self, coroutine_function, *args, **kwargs):
+        async def serve():
+            app = web.Application()
+            app.router.add_route('*', '/{tail:.*}', self.handle)
+            server = TestServer(app)
+            await server.start_server()
+            ApiConfig.api_base = str(server.make_url('/api/v3'))
+            try:
+                return await coroutine_function(*args, **kwargs)
+            finally:
+                await quandl.aio.close()
+                await server.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(serve())
+        finally:
+            loop.close()
+
+    def dataset_data(self, **kwargs):
+        return {'dataset_data': DatasetDataFactory.build(**kwargs)}
+
+    def expected_data_frame(self, response):
+        data = dict(response['dataset_data'])
+        return DataList(Data, data.pop('data'), data).to_pandas()
+
+    def test_get_single_dataset(self):
+        response = self.dataset_data()
+        self.respond('/api/v3/datasets/NSE/OIL/data', response)
+        result = self.run_with_server(quandl.aio.get, 'NSE/OIL', start_date='2015-01-01',
+                                      api_key='key')
+
+        self.assertTrue(result.equals(self.expected_data_frame(response)))
+        request = self.requests[0]
+        self.assertEqual(request.query['start_date'], '2015-01-01')
+        self.assertEqual(request.query['order'], 'asc')
+        self.assertEqual(request.headers['x-api-token'], 'key')
+        self.assertEqual(request.headers['request-source'], 'python')
+
+    def test_get_returns_numpy(self):
+        self.respond('/api/v3/datasets/NSE/OIL/data', self.dataset_data())
+        result = self.run_with_server(quandl.aio.get, 'NSE/OIL', returns='numpy')
+        self.assertEqual(len(result), 4)
+
+    def test_multiset_datasets_are_requested_concurrently(self):
+        codes = ['NSE/OIL%s' % index for index in range(5)]
+        for code in codes:
+            self.respond('/api/v3/datasets/%s/data' % code, self.dataset_data())
+        self.delay = 0.2
+
+        started = time.time()
+        result = self.run_with_server(quandl.aio.get, codes + ['NSE/MISSING'])
+
+        self.assertLess(time.time() - started, 0.2 * len(codes))
+        self.assertEqual(len(self.requests), len(codes) + 1)
+        self.assertEqual(list(result.columns)[:3],
+                         ['NSE/OIL0 - column.1', 'NSE/OIL0 - column.2', 'NSE/OIL0 - column.3'])
+        self.assertEqual(list(result.columns)[-1], 'NSE/MISSING - Not Found')
+        self.assertEqual(len(result.index), 4)
+
+    def test_multiset_single_column_index_is_sent(self):
+        self.respond('/api/v3/datasets/NSE/OIL/data', self.dataset_data(
+            column_names=['Date', 'column.1'],
+            data=[['2015-07-11', 444.3], ['2015-07-13', 433.3]]))
+        self.respond('/api/v3/datasets/WIKI/AAPL/data', self.dataset_data())
+        result = self.run_with_server(quandl.aio.get, ['NSE/OIL.1', 'WIKI/AAPL'])
+
+        queries = dict((request.path, request.query) for request in self.requests)
+        self.assertEqual(queries['/api/v3/datasets/NSE/OIL/data']['column_index'], '1')
+        self.assertNotIn('column_index', queries['/api/v3/datasets/WIKI/AAPL/data'])
+        self.assertEqual(list(result.columns), ['NSE/OIL - column.1', 'WIKI/AAPL - column.1',
+                                                'WIKI/AAPL - column.2', 'WIKI/AAPL - column.3'])
+
+    def test_get_table_follows_cursors(self):
+        page = DatatableDataFactory.build()
+        self.respond('/api/v3/datatables/ZACKS/FC',
+                     {'datatable': page, 'meta': {'next_cursor_id': 'abc'}},
+                     {'datatable': page, 'meta': {'next_cursor_id': None}})
+        result = self.run_with_server(quandl.aio.get_table, 'ZACKS/FC',
+                                      ticker=['AAPL', 'MSFT'], paginate=True)
+
+        self.assertEqual(len(result.index), 8)
+        self.assertEqual(list(result.columns), ['per_end_date', 'ticker', 'tot_oper_exp'])
+        self.assertEqual(self.requests[0].query.getall('ticker[]'), ['AAPL', 'MSFT'])
+        self.assertNotIn('qopts.cursor_id', self.requests[0].query)
+        self.assertEqual(self.requests[1].query['qopts.cursor_id'], 'abc')
+
+    def test_get_table_without_paginate_warns(self):
+        page = DatatableDataFactory.build()
+        self.respond('/api/v3/datatables/ZACKS/FC',
+                     {'datatable': page, 'meta': {'next_cursor_id': 'abc'}})
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            result = self.run_with_server(quandl.aio.get_table, 'ZACKS/FC')
+        self.assertEqual(len(result.index), 4)
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(any(issubclass(w.category, UserWarning) for w in caught))
+
+    def test_get_point_in_time(self):
+        page = DatatableDataFactory.build()
+        self.respond('/api/v3/pit/ZACKS/FC/between/2020-01-01/2020-02-01',
+                     {'datatable': page, 'meta': {'next_cursor_id': None}})
+        result = self.run_with_server(quandl.aio.get_point_in_time, 'ZACKS/FC',
+                                      interval='between', start_date='2020-01-01',
+                                      end_date='2020-02-01')
+        self.assertEqual(len(result.index), 4)
+
+    def test_errors_are_raised_like_the_blocking_client(self):
+        self.assertRaises(NotFoundError,
+                          lambda: self.run_with_server(quandl.aio.get, 'NSE/MISSING'))
+
+    def test_retries_status_codes(self):
+        self.respond('/api/v3/datasets/NSE/OIL/data',
+                     {'quandl_error': {'code': 'QEMx01', 'message': 'error'}},
+                     self.dataset_data(), status=500)
+        self.responses['/api/v3/datasets/NSE/OIL/data'][1] = (self.dataset_data(), 200)
+        result = self.run_with_server(quandl.aio.get, 'NSE/OIL')
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(len(result.index), 4)
+
+    def test_get_raw_data(self):
+        metadata = {'dataset': DatasetFactory.build(database_code='NSE', dataset_code='OIL')}
+        self.respond('/api/v3/datasets/NSE/OIL/metadata', metadata)
+        dataset = Dataset('NSE/OIL')
+        self.run_with_server(quandl.aio.AsyncOperation.get_raw_data, dataset)
+        self.assertEqual(dataset.dataset_code, 'OIL')
+        self.assertEqual(dataset.name, metadata['dataset']['name'])
+
+    def test_connection_options_are_not_sent_as_params(self):
+        page = DatatableDataFactory.build()
+        self.respond('/api/v3/datatables/ZACKS/FC',
+                     {'datatable': page, 'meta': {'next_cursor_id': None}})
+        self.respond('/api/v3/datasets/NSE/OIL/data', self.dataset_data())
+        self.run_with_server(quandl.aio.get_table, 'ZACKS/FC', ticker='AAPL', timeout=5,
+                             deadline=3, prefetch_pages=2, wire_format='json')
+        self.run_with_server(quandl.aio.get, ['NSE/OIL', 'NSE/OIL'], timeout=(1, 5), deadline=3)
+
+        self.assertEqual(dict(self.requests[0].query), {'ticker': 'AAPL'})
+        for request in self.requests[1:]:
+            self.assertEqual(dict(request.query), {'order': 'asc'})
+
+    def test_get_table_raises_at_its_deadline(self):
+        page = DatatableDataFactory.build()
+        self.respond('/api/v3/datatables/ZACKS/FC',
+                     {'datatable': page, 'meta': {'next_cursor_id': 'abc'}})
+        self.delay = 0.3
+        started = time.time()
+        with self.assertRaises(DeadlineExceededError) as context:
+            self.run_with_server(quandl.aio.get_table, 'ZACKS/FC', paginate=True,
+                                 deadline=0.75)
+        self.assertLess(time.time() - started, 1.25)
+        self.assertEqual(context.exception.progress['pages'], 2)
+
+    def test_unsupported_options_raise(self):
+        self.assertRaises(InvalidRequestError, lambda: self.run_with_server(
+            quandl.aio.get_table, 'ZACKS/FC', cache_ttl=60))
+        self.assertRaises(InvalidRequestError, lambda: self.run_with_server(
+            quandl.aio.get, 'NSE/OIL', wire_format='csv'))
+        self.assertEqual(self.requests, [])
@@ -0,0 +1,218 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+import httpretty
+from mock import patch
+
+import quandl
+from quandl.api_config import ApiConfig
+from quandl.connection import Connection
+from quandl.utils.cache_util import ResponseCache
+from test.factories.dataset_data import DatasetDataFactory
+from test.test_retries import ModifyRetrySettingsTestCase
+
+URL = 'https://data.nasdaq.com/api/v3/datasets/NSE/OIL/data'
+
+
+class ResponseCacheTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        ApiConfig.use_retries = False
+        self.cache_dir = tempfile.mkdtemp()
+        ApiConfig.cache_dir = self.cache_dir
+        httpretty.enable()
+        httpretty.reset()
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        ApiConfig.cache_dir = None
+        ApiConfig.cache_ttl = 24 * 60 * 60
+        ApiConfig.cache_max_size = 512 * 1024 * 1024
+        ApiConfig.api_key = None
+
+    def register(self, body='{"foo": "bar"}', **kwargs):
+        httpretty.register_uri(httpretty.GET, URL, body=body, **kwargs)
+
+    def request_count(self):
+        return len(httpretty.latest_requests())
+
+    def expire_entries(self):
+        for path, _, _ in ResponseCache._entries():
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline().decode('utf-8'))
+                body = f.read()
+            meta['stored_at'] -= ApiConfig.cache_ttl + 1
+            with open(path, 'wb') as f:
+                f.write(json.dumps(meta).encode('utf-8') + b'\n' + body)
+
+    def test_fresh_responses_are_served_from_disk(self):
+        self.register()
+        first = Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': 2})
+        second = Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': 2})
+        self.assertEqual(self.request_count(), 1)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second.status_code, 200)
+
+    def test_key_ignores_api_key_and_param_order(self):
+        ApiConfig.api_key = 'first_key'
+        self.assertEqual(
+            ResponseCache.key('get', URL, {'rows': 2, 'order': 'asc', 'api_key': 'a'}),
+            ResponseCache.key('GET', URL, {'order': 'asc', 'rows': 2}))
+        self.assertNotEqual(ResponseCache.key('get', URL, {'rows': 2}),
+                            ResponseCache.key('get', URL, {'rows': 3}))
+        self.register()
+        Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': 2})
+        ApiConfig.api_key = 'second_key'
+        Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': 2})
+        self.assertEqual(self.request_count(), 1)
+
+    def test_different_params_are_fetched(self):
+        self.register()
+        Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': 2})
+        Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': 3})
+        self.assertEqual(self.request_count(), 2)
+
+    def test_stale_responses_are_revalidated_with_validators(self):
+        self.register(responses=[
+            httpretty.Response(body='{"foo": "bar"}', etag='"v1"',
+                               last_modified='Wed, 01 Jan 2020 00:00:00 GMT'),
+            httpretty.Response(body='', status=304, etag='"v2"')])
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        self.expire_entries()
+        response = Connection.request('get', 'datasets/NSE/OIL/data')
+
+        self.assertEqual(response.json(), {'foo': 'bar'})
+        headers = httpretty.last_request().headers
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(headers['If-Modified-Since'], 'Wed, 01 Jan 2020 00:00:00 GMT')
+        # the revalidated entry is fresh again and keeps the new validator
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        self.assertEqual(self.request_count(), 2)
+        meta, _ = ResponseCache.load(ResponseCache.key('get', URL))
+        self.assertEqual(meta['etag'], '"v2"')
+
+    def test_stale_responses_without_validators_are_fetched_again(self):
+        self.register(responses=[httpretty.Response(body='{"version": 1}'),
+                                 httpretty.Response(body='{"version": 2}')])
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        self.expire_entries()
+        response = Connection.request('get', 'datasets/NSE/OIL/data')
+        self.assertEqual(response.json(), {'version': 2})
+        self.assertNotIn('If-None-Match', httpretty.last_request().headers)
+
+    def test_cache_ttl_per_call(self):
+        self.register()
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        Connection.request('get', 'datasets/NSE/OIL/data', cache_ttl=0)
+        self.assertEqual(self.request_count(), 2)
+
+    def test_no_store_responses_are_not_cached(self):
+        self.register(adding_headers={'Cache-Control': 'no-store'})
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        self.assertEqual(self.request_count(), 2)
+
+    def test_post_and_streamed_requests_bypass_the_cache(self):
+        httpretty.register_uri(httpretty.POST, URL, body='{"foo": "bar"}')
+        self.register()
+        Connection.request('post', 'datasets/NSE/OIL/data')
+        Connection.request('get', 'datasets/NSE/OIL/data', stream=True)
+        self.assertEqual(ResponseCache._entries(), [])
+
+    def test_cache_is_disabled_without_a_directory(self):
+        ApiConfig.cache_dir = None
+        self.register()
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        self.assertEqual(self.request_count(), 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.register(body='x' * 1000)
+        for rows in range(3):
+            Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': rows})
+        paths = dict((ResponseCache._path(ResponseCache.key('get', URL, {'rows': rows})), rows)
+                     for rows in range(3))
+        now = time.time()
+        for path, rows in paths.items():
+            os.utime(path, (now - 100 + rows, now - 100 + rows))
+        # reading the oldest entry makes it the most recently used one
+        Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': 0})
+
+        # going one byte over the limit removes exactly one entry
+        ResponseCache.evict(max_size=sum(entry[2] for entry in ResponseCache._entries()) - 1)
+        remaining = set(paths[entry[0]] for entry in ResponseCache._entries())
+        self.assertEqual(remaining, set([0, 2]))
+
+    def test_stores_count_the_directory_size_once(self):
+        self.register(body='x' * 1000)
+        with patch.object(ResponseCache, '_entries', wraps=ResponseCache._entries) as entries:
+            for rows in range(5):
+                Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': rows})
+        self.assertEqual(entries.call_count, 1)
+        self.assertEqual(ResponseCache._size(),
+                         sum(entry[2] for entry in ResponseCache._entries()))
+
+    def test_stores_evict_once_the_size_limit_is_crossed(self):
+        self.register(body='x' * 1000)
+        Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': 0})
+        # room for two and a half entries
+        ApiConfig.cache_max_size = ResponseCache._size() * 5 // 2
+        for rows in range(1, 5):
+            Connection.request('get', 'datasets/NSE/OIL/data', params={'rows': rows})
+        sizes = [entry[2] for entry in ResponseCache._entries()]
+        self.assertEqual(len(sizes), 2)
+        self.assertEqual(ResponseCache._size(), sum(sizes))
+
+    def test_cursor_paginated_pages_are_not_reused_within_the_ttl(self):
+        datatable_url = 'https://data.nasdaq.com/api/v3/datatables/ZACKS/FC'
+        httpretty.register_uri(httpretty.GET, datatable_url, responses=[
+            httpretty.Response(body='{"meta": {"next_cursor_id": "abc"}}', etag='"v1"'),
+            httpretty.Response(body='', status=304),
+            httpretty.Response(body='{"meta": {"next_cursor_id": null}}'),
+            httpretty.Response(body='{"meta": {"next_cursor_id": null}}'),
+            httpretty.Response(body='{"meta": {"next_cursor_id": null}}')])
+        for _ in range(2):
+            Connection.request('get', 'datatables/ZACKS/FC', params={'ticker': 'AAPL'})
+        self.assertEqual(httpretty.last_request().headers['If-None-Match'], '"v1"')
+        for _ in range(2):
+            Connection.request('get', 'datatables/ZACKS/FC',
+                               params={'ticker': 'AAPL', 'qopts.cursor_id': 'abc'})
+        # the last page neither carries nor hands out a cursor
+        for _ in range(2):
+            Connection.request('get', 'datatables/ZACKS/FC', params={'ticker': 'MSFT'})
+        self.assertEqual(self.request_count(), 5)
+
+    def test_clear(self):
+        self.register()
+        Connection.request('get', 'datasets/NSE/OIL/data')
+        ResponseCache.clear()
+        self.assertEqual(ResponseCache._entries(), [])
+
+    @patch('quandl.model.data.Data.all')
+    def test_get_passes_cache_ttl(self, mock):
+        quandl.get('NSE/OIL', cache_ttl=60)
+        self.assertEqual(mock.call_args[1]['cache_ttl'], 60)
+        self.assertNotIn('cache_ttl', mock.call_args[1]['params'])
+
+    @patch('quandl.model.data.Data.request_page')
+    def test_get_table_passes_cache_ttl(self, mock):
+        mock.return_value = {'meta': {'next_cursor_id': None}}
+        with patch('quandl.model.data.Data.build_page'):
+            quandl.get_table('ZACKS/FC', ticker='AAPL', cache_ttl=60)
+        self.assertEqual(mock.call_args[1]['cache_ttl'], 60)
+        self.assertEqual(mock.call_args[1]['params'], {'ticker': 'AAPL'})
+
+    def test_get_reuses_cached_data(self):
+        httpretty.register_uri(httpretty.GET, re.compile(URL + '*'),
+                               body=json.dumps({'dataset_data': DatasetDataFactory.build()}))
+        first = quandl.get('NSE/OIL')
+        second = quandl.get('NSE/OIL')
+        self.assertEqual(self.request_count(), 1)
+        self.assertTrue(first.equals(second))
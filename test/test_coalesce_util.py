@@ -0,0 +1,113 @@
+import json
+import re
+import threading
+import time
+import unittest
+
+import httpretty
+
+from quandl.api_config import ApiConfig
+from quandl.connection import Connection
+from quandl.errors.quandl_error import DeadlineExceededError, NotFoundError
+from quandl.utils.coalesce_util import RequestCoalescer
+from quandl.utils.deadline_util import Deadline
+
+
+class RequestCoalescerTest(unittest.TestCase):
+
+    def setUp(self):
+        ApiConfig.use_retries = False
+        ApiConfig.coalesce_requests = True
+        self.calls = []
+        self.lock = threading.Lock()
+        httpretty.reset()
+        httpretty.enable()
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datasets/*'),
+                               body=self.respond)
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        ApiConfig.use_retries = True
+        ApiConfig.coalesce_requests = False
+
+    def respond(self, request, uri, headers):
+        with self.lock:
+            self.calls.append(uri)
+        # keep the request in flight while the other threads ask for the same data
+        time.sleep(0.2)
+        if 'MISSING' in uri:
+            return [404, headers, json.dumps({'quandl_error': {
+                'code': 'QECx02', 'message': 'not found'}})]
+        return [200, headers, json.dumps({'dataset': {'dataset_code': 'AAPL'}})]
+
+    def request_in_threads(self, paths, **options):
+        results = [None] * len(paths)
+        barrier = threading.Barrier(len(paths))
+
+        def request(index):
+            barrier.wait()
+            try:
+                results[index] = Connection.parse(
+                    Connection.request('get', paths[index], **dict(options)))
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(len(paths))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_requests_share_one_call(self):
+        results = self.request_in_threads(['datasets/WIKI/AAPL/metadata'] * 5,
+                                          params={'a': 1})
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(results, [{'dataset': {'dataset_code': 'AAPL'}}] * 5)
+        results[0]['dataset']['dataset_code'] = 'changed'
+        self.assertEqual(results[1]['dataset']['dataset_code'], 'AAPL')
+
+    def test_different_params_are_not_shared(self):
+        self.request_in_threads(['datasets/WIKI/AAPL'] * 2, params={'a': 1})
+        self.request_in_threads(['datasets/WIKI/AAPL', 'datasets/WIKI/MSFT'])
+        self.assertEqual(len(self.calls), 3)
+
+    def test_errors_are_raised_in_every_caller(self):
+        results = self.request_in_threads(['datasets/WIKI/MISSING'] * 3)
+        self.assertEqual(len(self.calls), 1)
+        for result in results:
+            self.assertIsInstance(result, NotFoundError)
+        self.assertEqual(RequestCoalescer._in_flight, {})
+
+    def test_followers_give_up_at_their_deadline(self):
+        leader = threading.Thread(target=lambda: Connection.request('get', 'datasets/WIKI/AAPL'))
+        leader.start()
+        time.sleep(0.05)
+        started = time.time()
+        self.assertRaises(DeadlineExceededError, lambda: Connection.request(
+            'get', 'datasets/WIKI/AAPL', deadline=Deadline(0.05)))
+        self.assertLess(time.time() - started, 0.15)
+        leader.join()
+        self.assertEqual(len(self.calls), 1)
+
+    def test_disabled(self):
+        ApiConfig.coalesce_requests = False
+        self.assertFalse(RequestCoalescer.is_coalescable('get'))
+        self.request_in_threads(['datasets/WIKI/AAPL'] * 3)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_key_includes_api_key(self):
+        url = 'https://data.nasdaq.com/api/v3/datasets/WIKI/AAPL'
+        self.assertNotEqual(RequestCoalescer.key('get', url, headers={'x-api-token': 'a'}),
+                            RequestCoalescer.key('get', url, headers={'x-api-token': 'b'}))
+        self.assertNotEqual(RequestCoalescer.key('get', url, params={'api_key': 'a'}),
+                            RequestCoalescer.key('get', url, params={'api_key': 'b'}))
+        self.assertEqual(RequestCoalescer.key('get', url, params={'b': 1, 'a': [1, 2]}),
+                         RequestCoalescer.key('get', url, params={'a': [1, 2], 'b': 1}))
+
+    def test_streamed_and_post_requests_are_not_coalesced(self):
+        self.assertFalse(RequestCoalescer.is_coalescable('get', stream=True))
+        self.assertFalse(RequestCoalescer.is_coalescable('post'))
+        self.assertTrue(RequestCoalescer.is_coalescable('get'))
@@ -0,0 +1,193 @@
+import email.utils
+import json
+import re
+import threading
+import time
+import unittest
+
+import httpretty
+from mock import Mock
+
+from quandl.api_config import ApiConfig
+from quandl.connection import Connection
+from quandl.errors.quandl_error import DeadlineExceededError, LimitExceededError
+from quandl.utils.concurrency_util import AdaptiveConcurrency
+from quandl.utils.deadline_util import Deadline
+from quandl.utils.retry_util import ApiRetry
+from test.test_retries import ModifyRetrySettingsTestCase
+
+
+class AdaptiveConcurrencyTest(unittest.TestCase):
+
+    def setUp(self):
+        ApiConfig.max_concurrent_requests = 8
+        AdaptiveConcurrency.reset()
+
+    def tearDown(self):
+        ApiConfig.max_concurrent_requests = None
+        ApiConfig.max_throttle_pause = 60
+        AdaptiveConcurrency.reset()
+
+    def test_disabled_by_default(self):
+        ApiConfig.max_concurrent_requests = None
+        self.assertFalse(AdaptiveConcurrency.acquire())
+        AdaptiveConcurrency.record(429, {'retry-after': '60'})
+        self.assertEqual(AdaptiveConcurrency._paused_until, 0)
+
+    def test_throttle_delay(self):
+        self.assertEqual(AdaptiveConcurrency.throttle_delay(429, {'retry-after': '3'}), 3)
+        self.assertEqual(AdaptiveConcurrency.throttle_delay(503, {}), 0)
+        self.assertEqual(AdaptiveConcurrency.throttle_delay(
+            200, {'x-ratelimit-remaining': '0', 'x-ratelimit-reset': '5'}), 5)
+        self.assertAlmostEqual(AdaptiveConcurrency.throttle_delay(
+            200, {'ratelimit-remaining': '0', 'ratelimit-reset': str(time.time() + 10)}),
+            10, places=0)
+        self.assertIsNone(AdaptiveConcurrency.throttle_delay(200, {'x-ratelimit-remaining': '4'}))
+        self.assertIsNone(AdaptiveConcurrency.throttle_delay(500, {}))
+
+    def test_retry_after_accepts_http_dates(self):
+        retry_at = email.utils.formatdate(time.time() + 30, usegmt=True)
+        self.assertAlmostEqual(AdaptiveConcurrency.retry_after({'retry-after': retry_at}),
+                               30, delta=1)
+        self.assertIsNone(AdaptiveConcurrency.retry_after({'retry-after': 'soon'}))
+        self.assertIsNone(AdaptiveConcurrency.retry_after({}))
+
+    def test_throttling_halves_the_limit_once_per_burst(self):
+        AdaptiveConcurrency.record(429, {})
+        AdaptiveConcurrency.record(429, {})
+        self.assertEqual(AdaptiveConcurrency.current_limit(), 4)
+        AdaptiveConcurrency._decreased_at -= AdaptiveConcurrency.DECREASE_INTERVAL
+        AdaptiveConcurrency.record(429, {})
+        self.assertEqual(AdaptiveConcurrency.current_limit(), 2)
+
+    def test_successes_grow_the_limit_back(self):
+        AdaptiveConcurrency.record(429, {})
+        # one more request in flight after every round of limit successes
+        for _ in range(5):
+            AdaptiveConcurrency.record(200, {})
+        self.assertEqual(AdaptiveConcurrency.current_limit(), 5)
+        for _ in range(100):
+            AdaptiveConcurrency.record(200, {})
+        self.assertEqual(AdaptiveConcurrency.current_limit(), 8)
+
+    def test_retry_after_pauses_every_caller(self):
+        AdaptiveConcurrency.record(429, {'retry-after': '1'})
+        acquired, wait = AdaptiveConcurrency.try_acquire()
+        self.assertFalse(acquired)
+        self.assertGreater(wait, 0.9)
+
+    def test_pauses_are_capped(self):
+        ApiConfig.max_throttle_pause = 5
+        AdaptiveConcurrency.record(429, {'retry-after': '3600'})
+        self.assertLessEqual(AdaptiveConcurrency.try_acquire()[1], 5)
+
+    def test_pause_past_the_deadline_raises(self):
+        AdaptiveConcurrency.record(429, {'retry-after': '30'})
+        started = time.time()
+        with self.assertRaises(DeadlineExceededError):
+            AdaptiveConcurrency.acquire(Deadline(10))
+        self.assertLess(time.time() - started, 1)
+
+    def test_wait_for_a_slot_ends_at_the_deadline(self):
+        ApiConfig.max_concurrent_requests = 1
+        self.assertTrue(AdaptiveConcurrency.acquire())
+        started = time.time()
+        self.assertRaises(DeadlineExceededError,
+                          lambda: AdaptiveConcurrency.acquire(Deadline(0.2)))
+        self.assertLess(time.time() - started, 1)
+
+    def test_bounds_requests_in_flight(self):
+        ApiConfig.max_concurrent_requests = 3
+        state = {'in_flight': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def request():
+            with AdaptiveConcurrency.slot():
+                with lock:
+                    state['in_flight'] += 1
+                    state['peak'] = max(state['peak'], state['in_flight'])
+                time.sleep(0.01)
+                with lock:
+                    state['in_flight'] -= 1
+
+        threads = [threading.Thread(target=request) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(state['peak'], 3)
+        self.assertEqual(AdaptiveConcurrency._in_flight, 0)
+
+
+class ApiRetryTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(ApiRetryTest, self).setUp()
+        ApiConfig.max_concurrent_requests = 8
+        AdaptiveConcurrency.reset()
+
+    def tearDown(self):
+        super(ApiRetryTest, self).tearDown()
+        ApiConfig.max_concurrent_requests = None
+        AdaptiveConcurrency.reset()
+
+    def test_backoff_max_is_kept_per_instance(self):
+        short = ApiRetry(total=5, backoff_factor=10, backoff_max=1)
+        long = ApiRetry(total=5, backoff_factor=10, backoff_max=100)
+        response = Mock(status=500, headers={}, **{'get_redirect_location.return_value': None})
+        for _ in range(3):
+            short = short.increment(method='GET', url='/', response=response)
+            long = long.increment(method='GET', url='/', response=response)
+        self.assertEqual(short.get_backoff_time(), 1)
+        self.assertEqual(long.get_backoff_time(), 40)
+
+    def test_session_retries_use_max_wait_between_retries(self):
+        ApiConfig.use_retries = True
+        ApiConfig.max_wait_between_retries = 3
+        retries = Connection.get_session().get_adapter(ApiConfig.api_protocol).max_retries
+        self.assertIsInstance(retries, ApiRetry)
+        self.assertEqual(retries.new().backoff_max, 3)
+
+    def test_retried_responses_are_recorded(self):
+        retries = ApiRetry(total=5, status_forcelist=[429])
+        retries.increment(method='GET', url='/',
+                          response=Mock(status=429, headers={'retry-after': '2'}))
+        self.assertEqual(AdaptiveConcurrency.current_limit(), 4)
+        self.assertGreater(AdaptiveConcurrency._paused_until, time.time() + 1)
+
+
+class ConnectionThrottleTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(ConnectionThrottleTest, self).setUp()
+        ApiConfig.use_retries = False
+        ApiConfig.max_concurrent_requests = 8
+        AdaptiveConcurrency.reset()
+        httpretty.enable()
+
+    def tearDown(self):
+        super(ConnectionThrottleTest, self).tearDown()
+        httpretty.disable()
+        httpretty.reset()
+        ApiConfig.max_concurrent_requests = None
+        AdaptiveConcurrency.reset()
+
+    def test_limit_exceeded_error_carries_retry_after(self):
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datasets/*'),
+            body=json.dumps({'quandl_error': {'code': 'QELx01', 'message': 'slow down'}}),
+            status=429, adding_headers={'Retry-After': '1'})
+        with self.assertRaises(LimitExceededError) as context:
+            Connection.request('get', 'datasets/WIKI/AAPL')
+        self.assertEqual(context.exception.retry_after, 1)
+        self.assertEqual(AdaptiveConcurrency.current_limit(), 4)
+        self.assertEqual(AdaptiveConcurrency._in_flight, 0)
+
+    def test_successful_requests_grow_the_limit(self):
+        AdaptiveConcurrency.record(429, {})
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datasets/*'),
+            body=json.dumps({'dataset': {}}))
+        for _ in range(5):
+            Connection.request('get', 'datasets/WIKI/AAPL')
+        self.assertEqual(AdaptiveConcurrency.current_limit(), 5)
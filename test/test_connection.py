@@ -79,5 +79,45 @@ class ConnectionTest(ModifyRetrySettingsTestCase):
                                             'application/vnd.quandl+json;version=2015-04-09'),
                                  'request-source': 'python',
                                  'request-source-version': VERSION},
-                        params={'per_page': 10, 'page': 2})
+                        params={'per_page': 10, 'page': 2},
+                        timeout=(ApiConfig.connect_timeout, ApiConfig.read_timeout),
+                        deadline=None)
         self.assertEqual(mock.call_args, expected)
+
+
+class ConnectionSessionTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(ConnectionSessionTest, self).setUp()
+        Connection.close_session()
+
+    def tearDown(self):
+        Connection.close_session()
+        super(ConnectionSessionTest, self).tearDown()
+
+    def test_session_is_reused_between_requests(self):
+        self.assertIs(Connection.get_session(), Connection.get_session())
+
+    def test_session_uses_configured_pool_size(self):
+        default_pool_maxsize = ApiConfig.pool_maxsize
+        ApiConfig.pool_maxsize = 42
+        try:
+            adapter = Connection.get_session().get_adapter(ApiConfig.api_protocol)
+            self.assertEqual(adapter._pool_maxsize, 42)
+        finally:
+            ApiConfig.pool_maxsize = default_pool_maxsize
+
+    def test_session_is_rebuilt_when_config_changes(self):
+        session = Connection.get_session()
+        ApiConfig.number_of_retries = 1
+        self.assertIsNot(session, Connection.get_session())
+
+    def test_session_is_rebuilt_after_fork(self):
+        session = Connection.get_session()
+        with patch('quandl.connection.os.getpid', return_value=-1):
+            self.assertIsNot(session, Connection.get_session())
+
+    def test_close_session(self):
+        session = Connection.get_session()
+        Connection.close_session()
+        self.assertIsNot(session, Connection.get_session())
@@ -0,0 +1,135 @@
+import json
+import re
+import unittest
+
+import httpretty
+import numpy
+import pandas
+
+import quandl
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import InvalidRequestError
+from quandl.model.dataset import Dataset
+from quandl.model.datatable import Datatable
+from quandl.utils.csv_util import CsvDecoder
+from quandl.utils.metadata_cache_util import MetadataCache
+
+DATASET_CSV = 'Date,Open,High\n2015-07-15,440.0,445.5\n2015-07-14,437.5,\n2015-07-13,433.3,434.0\n'
+DATATABLE_COLUMNS = [{'name': 'ticker', 'type': 'String'},
+                     {'name': 'per_end_date', 'type': 'Date'},
+                     {'name': 'shares_out', 'type': 'Integer'},
+                     {'name': 'tot_oper_exp', 'type': 'BigDecimal(11,4)'}]
+DATATABLE_PAGES = [
+    'ticker,per_end_date,shares_out,tot_oper_exp\nAAPL,2015-07-11,100,456.9\n'
+    'NA,2015-07-13,,433.3\n',
+    'ticker,per_end_date,shares_out,tot_oper_exp\n,2015-07-14,300,419.1\n'
+]
+
+
+class CsvWireFormatTest(unittest.TestCase):
+
+    def setUp(self):
+        ApiConfig.api_key = 'api_token'
+        MetadataCache.clear()
+        self.requests = []
+        httpretty.reset()
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datasets/(.+)/data.csv'),
+            body=self.dataset_data)
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datatables/(.+)/metadata'),
+            body=json.dumps({'datatable': {'vendor_code': 'ZACKS', 'datatable_code': 'FC',
+                                           'columns': DATATABLE_COLUMNS}}))
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datatables/ZACKS/FC.csv'),
+            body=self.datatable_page)
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        ApiConfig.wire_format = 'json'
+
+    def dataset_data(self, request, uri, headers):
+        self.requests.append(request)
+        headers['content-type'] = 'text/csv'
+        return [200, headers, DATASET_CSV]
+
+    def datatable_page(self, request, uri, headers):
+        self.requests.append(request)
+        index = 1 if 'qopts.cursor_id' in request.querystring else 0
+        if index == 0:
+            headers['cursor_id'] = 'abc123'
+        return [200, headers, DATATABLE_PAGES[index]]
+
+    def test_get_requests_csv(self):
+        quandl.get('NSE/OIL', wire_format='csv')
+        self.assertTrue(self.requests[0].path.startswith('/api/v3/datasets/NSE/OIL/data.csv'))
+        self.assertEqual(self.requests[0].headers['accept'], 'text/csv')
+
+    def test_get_builds_the_same_data_frame_as_json(self):
+        df = quandl.get('NSE/OIL', wire_format='csv')
+        self.assertEqual(list(df.columns), ['Open', 'High'])
+        self.assertEqual(df.index.name, 'Date')
+        self.assertIsInstance(df.index, pandas.DatetimeIndex)
+        self.assertEqual(df['Open'].tolist(), [440.0, 437.5, 433.3])
+        self.assertTrue(numpy.isnan(df['High'].iloc[1]))
+
+    def test_merged_get_uses_csv_for_every_dataset(self):
+        df = quandl.get(['NSE/OIL', 'WIKI/AAPL'], wire_format='csv')
+        self.assertEqual(len(self.requests), 2)
+        self.assertTrue(self.requests[1].path.startswith('/api/v3/datasets/WIKI/AAPL/data.csv'))
+        self.assertEqual(list(df.columns), ['NSE/OIL - Open', 'NSE/OIL - High',
+                                            'WIKI/AAPL - Open', 'WIKI/AAPL - High'])
+
+    def test_dataset_data_returns_a_data_list(self):
+        data = Dataset('NSE/OIL').data(wire_format='csv')
+        self.assertEqual(len(data), 3)
+        self.assertEqual(data.column_names, ['Date', 'Open', 'High'])
+        self.assertEqual(data[0].open, 440.0)
+
+    def test_get_table_follows_the_cursor_header(self):
+        df = quandl.get_table('ZACKS/FC', paginate=True, wire_format='csv')
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1].querystring['qopts.cursor_id'], ['abc123'])
+        self.assertEqual(df['ticker'].tolist(), ['AAPL', 'NA', None])
+
+    def test_get_table_types_columns_from_the_metadata(self):
+        df = quandl.get_table('ZACKS/FC', paginate=True, wire_format='csv')
+        self.assertEqual(str(df['shares_out'].dtype), 'Int64')
+        self.assertTrue(df['shares_out'].isna().tolist()[1])
+        self.assertEqual(df['tot_oper_exp'].tolist(), [456.9, 433.3, 419.1])
+        self.assertEqual(str(df['per_end_date'].dtype), 'datetime64[ns]')
+
+    def test_datatable_data_uses_the_configured_wire_format(self):
+        ApiConfig.wire_format = 'csv'
+        data = Datatable('ZACKS/FC').data()
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data.meta['next_cursor_id'], 'abc123')
+
+    def test_unknown_wire_format_raises(self):
+        self.assertRaises(InvalidRequestError,
+                          lambda: quandl.get('NSE/OIL', wire_format='xml'))
+
+
+class CsvDecoderTest(unittest.TestCase):
+
+    class Response(object):
+
+        def __init__(self, content, headers=None):
+            self.content = content.encode('utf-8')
+            self.headers = headers or {}
+
+    def test_decodes_datatable_columns(self):
+        response_data = CsvDecoder({'shares_out': 'Int64'}).decode_datatable(
+            self.Response(DATATABLE_PAGES[0]),
+            dict([(column['name'], column['type']) for column in DATATABLE_COLUMNS]))
+        self.assertEqual(response_data['datatable']['columns'], DATATABLE_COLUMNS)
+        self.assertIsNone(response_data['meta']['next_cursor_id'])
+        self.assertEqual(len(response_data['datatable']['data']), 2)
+        self.assertEqual(response_data['datatable']['data'][0][0], 'AAPL')
+
+    def test_empty_body_has_no_rows(self):
+        response_data = CsvDecoder().decode_dataset_data(self.Response(''))
+        self.assertEqual(response_data['dataset_data']['column_names'], [])
+        self.assertEqual(len(response_data['dataset_data']['data']), 0)
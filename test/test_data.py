@@ -77,8 +77,9 @@ class ListDataTest(unittest.TestCase):
         httpretty.disable()
         httpretty.reset()
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_data_calls_connection(self, mock):
+    def test_data_calls_connection(self, mock, decode_response):
         Data.all(params={'database_code': 'NSE', 'dataset_code': 'OIL'})
         expected = call('get', 'datasets/NSE/OIL/data', params={})
         self.assertEqual(mock.call_args, expected)
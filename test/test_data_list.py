@@ -0,0 +1,103 @@
+import datetime
+import unittest
+
+import numpy
+import pandas
+
+from quandl.model.data import Data
+from quandl.model.data_list import DataColumns, DataList
+
+
+class DataListTest(unittest.TestCase):
+
+    def setUp(self):
+        self.meta = self.build_meta()
+        self.rows = [[datetime.date(2015, 7, 11), 'AAPL', 456.9],
+                     [datetime.date(2015, 7, 13), 'MSFT', 433.3]]
+
+    def build_meta(self):
+        return {'columns': [{'name': 'per_end_date', 'type': 'Date'},
+                            {'name': 'ticker', 'type': 'String'},
+                            {'name': 'tot_oper_exp', 'type': 'BigDecimal(11,4)'}],
+                'next_cursor_id': None}
+
+    def test_to_pandas_does_not_build_data_objects(self):
+        data_list = DataList(Data, self.rows, self.meta)
+        df = data_list.to_pandas()
+        self.assertEqual(df['ticker'].tolist(), ['AAPL', 'MSFT'])
+        self.assertIsNone(data_list._values)
+
+    def test_to_pandas_matches_row_wise_data_frame(self):
+        df = DataList(Data, self.rows, self.meta).to_pandas()
+        expected = pandas.DataFrame(data=self.rows,
+                                    columns=['per_end_date', 'ticker', 'tot_oper_exp'])
+        expected['per_end_date'] = expected['per_end_date'].apply(pandas.to_datetime)
+        expected.index.name = 'None'
+        pandas.testing.assert_frame_equal(df, expected)
+
+    def test_rows_are_data_objects_when_indexed(self):
+        data_list = DataList(Data, self.rows, self.meta)
+        self.assertEqual(len(data_list), 2)
+        self.assertIsInstance(data_list[1], Data)
+        self.assertEqual(data_list[1].ticker, 'MSFT')
+
+    def test_extend_appends_rows_of_another_list(self):
+        data_list = DataList(Data, self.rows[:1], self.meta)
+        self.assertEqual(data_list[0].ticker, 'AAPL')
+        data_list.extend(DataList(Data, self.rows[1:], self.build_meta()))
+        self.assertEqual(len(data_list), 2)
+        self.assertEqual(data_list.to_list(), self.rows)
+        self.assertEqual(data_list[1].ticker, 'MSFT')
+
+    def test_short_rows_are_padded(self):
+        data_list = DataList(Data, [['2015-07-11', 'AAPL', 456.9], ['2015-07-13', 433.3]],
+                             self.meta)
+        self.assertEqual(data_list.to_list()[1], [datetime.date(2015, 7, 13), 433.3, None])
+
+    def test_empty_list_keeps_column_names(self):
+        df = DataList(Data, [], {'column_names': ['None', 'Not Found']}).to_pandas()
+        self.assertEqual(df.columns.tolist(), ['Not Found'])
+        self.assertEqual(len(df.index), 0)
+
+    def test_only_date_typed_columns_are_converted(self):
+        rows = [['2015-07-11', '2015-07-11', 456.9], ['2015-07-13', '2015-07-13', 433.3]]
+        data_list = DataList(Data, rows, self.meta)
+        df = data_list.to_pandas()
+        self.assertTrue(pandas.api.types.is_datetime64_any_dtype(df['per_end_date']))
+        self.assertEqual(df['ticker'].tolist(), ['2015-07-11', '2015-07-13'])
+        self.assertEqual(data_list[0].per_end_date, datetime.date(2015, 7, 11))
+        self.assertEqual(data_list[0].ticker, '2015-07-11')
+
+    def test_datetime_typed_columns_are_converted_to_utc(self):
+        meta = {'columns': [{'name': 'ticker', 'type': 'String'},
+                            {'name': 'updated_at', 'type': 'datetime'}]}
+        rows = [['AAPL', '2015-07-13T10:00:00Z'], ['MSFT', '2015-07-14T11:30:00Z']]
+        data_list = DataList(Data, rows, meta)
+        df = data_list.to_pandas()
+        self.assertEqual(str(df['updated_at'].dtype), 'datetime64[ns, UTC]')
+        self.assertEqual(df['updated_at'][0], pandas.Timestamp('2015-07-13 10:00:00', tz='UTC'))
+        updated_at = data_list.to_list()[0][1]
+        self.assertEqual(updated_at, datetime.datetime(2015, 7, 13, 10, tzinfo=updated_at.tzinfo))
+        self.assertEqual(updated_at.utcoffset(), datetime.timedelta(0))
+
+    def test_decoded_columns_keep_numbers_in_arrays(self):
+        columns = DataColumns()
+        for row in [[1, 1.5, 'a'], [2, 2.5, 'b'], [3, 3.5, 4]]:
+            columns.append_row(row)
+        ints, floats, mixed = columns.columns
+        self.assertEqual(ints.typecode, 'q')
+        self.assertEqual(floats.typecode, 'd')
+        self.assertEqual(mixed, ['a', 'b', 4])
+
+    def test_decoded_columns_with_nulls_fall_back_to_lists(self):
+        columns = DataColumns()
+        for row in [[1, 1.5, 2 ** 63], [2, None, 2], [None, 2.5, 3]]:
+            columns.append_row(row)
+        ints, floats, big_ints = columns.columns
+        self.assertEqual(ints, [1, 2, None])
+        self.assertEqual(floats, [1.5, None, 2.5])
+        self.assertEqual(big_ints, [2 ** 63, 2, 3])
+        df = DataList(Data, columns, {'column_names': ['Date', 'x', 'y']})._build_data_frame(
+            ['Date', 'x', 'y'])
+        self.assertEqual(df['Date'].dtype, numpy.float64)
+        self.assertTrue(numpy.isnan(df['x'][1]))
@@ -30,8 +30,9 @@ class GetDatasetTest(unittest.TestCase):
         httpretty.disable()
         httpretty.reset()
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_dataset_calls_connection(self, mock):
+    def test_dataset_calls_connection(self, mock, decode_response):
         d = Dataset('NSE/OIL')
         d.data_fields()
         expected = call('get', 'datasets/NSE/OIL/metadata', params={})
@@ -84,8 +85,9 @@ class ListDatasetsTest(unittest.TestCase):
         httpretty.disable()
         httpretty.reset()
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_datasets_calls_connection(self, mock):
+    def test_datasets_calls_connection(self, mock, decode_response):
         Dataset.all()
         expected = call('get', 'datasets', params={})
         self.assertEqual(mock.call_args, expected)
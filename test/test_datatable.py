@@ -1,15 +1,22 @@
+import io
 import json
+import os
 import re
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 import httpretty
 import six
 from mock import call, mock_open, patch
 from six.moves.urllib.parse import urlparse
 
+import quandl
 from quandl.api_config import ApiConfig
-from quandl.errors.quandl_error import (InternalServerError, QuandlError)
+from quandl.errors.quandl_error import (InternalServerError, InvalidRequestError, QuandlError)
 from quandl.model.datatable import Datatable
+from quandl.utils.metadata_cache_util import MetadataCache
 from test.factories.datatable import DatatableFactory
 from test.test_retries import ModifyRetrySettingsTestCase
 from quandl.utils.request_type_util import RequestType
@@ -37,27 +44,33 @@ class GetDatatableDatasetTest(ModifyRetrySettingsTestCase):
     def tearDown(self):
         RequestType.USE_GET_REQUEST = True
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_datatable_metadata_calls_connection(self, mock):
+    def test_datatable_metadata_calls_connection(self, mock, decode_response):
         Datatable('ZACKS/FC').data_fields()
         expected = call('get', 'datatables/ZACKS/FC/metadata', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_datatable_data_calls_connection_with_no_params_for_get_request(self, mock):
+    def test_datatable_data_calls_connection_with_no_params_for_get_request(self, mock,
+                                                                            decode_response):
         Datatable('ZACKS/FC').data()
         expected = call('get', 'datatables/ZACKS/FC', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_datatable_data_calls_connection_with_no_params_for_post_request(self, mock):
+    def test_datatable_data_calls_connection_with_no_params_for_post_request(self, mock,
+                                                                             decode_response):
         RequestType.USE_GET_REQUEST = False
         Datatable('ZACKS/FC').data()
         expected = call('post', 'datatables/ZACKS/FC', json={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_datatable_calls_connection_with_params_for_get_request(self, mock):
+    def test_datatable_calls_connection_with_params_for_get_request(self, mock, decode_response):
         params = {'ticker': ['AAPL', 'MSFT'],
                   'per_end_date': {'gte': '2015-01-01'},
                   'qopts': {'columns': ['ticker', 'per_end_date']},
@@ -76,8 +89,9 @@ class GetDatatableDatasetTest(ModifyRetrySettingsTestCase):
         expected = call('get', 'datatables/ZACKS/FC', params=expected_params)
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_datatable_calls_connection_with_params_for_post_request(self, mock):
+    def test_datatable_calls_connection_with_params_for_post_request(self, mock, decode_response):
         RequestType.USE_GET_REQUEST = False
         params = {'ticker': ['AAPL', 'MSFT'],
                   'per_end_date': {'gte': '2015-01-01'},
@@ -195,3 +209,110 @@ class ExportDataTableTest(unittest.TestCase):
 
         self.assertRaises(
             InternalServerError, lambda: self.datatable.download_file('.', params={}))
+
+
+class ExportDataFramesTest(unittest.TestCase):
+
+    def setUp(self):
+        ApiConfig.api_key = 'api_token'
+        ApiConfig.api_version = '2015-04-09'
+        MetadataCache.clear()
+        self.directory = tempfile.mkdtemp()
+        httpretty.reset()
+        httpretty.enable()
+        self.columns = [{'name': 'date', 'type': 'Date'},
+                        {'name': 'ticker', 'type': 'String'},
+                        {'name': 'volume', 'type': 'Integer'},
+                        {'name': 'price', 'type': 'BigDecimal(11,4)'}]
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datatables/AUSBS/D/metadata'),
+            body=lambda request, uri, headers: [200, headers, json.dumps({'datatable': {
+                'vendor_code': 'AUSBS', 'datatable_code': 'D', 'columns': self.columns}})])
+        httpretty.register_uri(
+            httpretty.GET, re.compile(r'https://data.nasdaq.com/api/v3/datatables/AUSBS/D\.json'),
+            body=json.dumps({'datatable_bulk_download': {'file': {
+                'status': 'fresh', 'link': 'https://www.blah.com/download/db.zip'}}}))
+
+        rows = ['2017-01-%02d,T%d,%s,%d.5' % (day, day, '' if day == 3 else day * 100, day)
+                for day in range(1, 6)]
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr('AUSBS_D.csv', '\n'.join(['date,ticker,volume,price'] + rows))
+        self.archive = archive.getvalue()
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        shutil.rmtree(self.directory)
+
+    def urlopen(self):
+        return patch('quandl.model.datatable.urlopen',
+                     side_effect=lambda link, **kwargs: io.BytesIO(self.archive))
+
+    def test_export_table_yields_typed_data_frames(self):
+        with self.urlopen() as m:
+            frames = list(quandl.export_table('AUSBS/D', returns='iterator', chunksize=2))
+        self.assertEqual(m.call_args, call('https://www.blah.com/download/db.zip',
+                                           timeout=ApiConfig.read_timeout))
+        self.assertEqual([len(frame) for frame in frames], [2, 2, 1])
+        frame = frames[1]
+        self.assertEqual(str(frame['date'].dtype), 'datetime64[ns]')
+        self.assertEqual(str(frame['volume'].dtype), 'Int64')
+        self.assertEqual(str(frame['price'].dtype), 'float64')
+        self.assertEqual(frame['ticker'].tolist(), ['T3', 'T4'])
+        self.assertTrue(frame['volume'].isna().tolist()[0])
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_export_table_requests_the_export(self):
+        with self.urlopen():
+            list(quandl.export_table('AUSBS/D', returns='iterator', ticker='T1'))
+        request = [r for r in httpretty.latest_requests() if 'D.json' in r.path][0]
+        self.assertEqual(request.querystring['qopts.export'], ['true'])
+        self.assertEqual(request.querystring['ticker'], ['T1'])
+
+    def test_export_table_writes_parquet(self):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        with self.urlopen():
+            path = quandl.export_table('AUSBS/D', returns='parquet', filename=self.directory,
+                                       chunksize=2)
+        self.assertEqual(path, os.path.join(self.directory, 'AUSBS_D.parquet'))
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        table = parquet_file.read()
+        self.assertEqual([str(field.type) for field in table.schema],
+                         ['date32[day]', 'string', 'int64', 'double'])
+        self.assertEqual(table.column('volume').to_pylist(), [100, 200, None, 400, 500])
+
+    def test_export_table_types_lowercase_and_datetime_columns(self):
+        self.columns = [{'name': 'date', 'type': 'datetime'},
+                        {'name': 'ticker', 'type': 'string'},
+                        {'name': 'volume', 'type': 'integer'},
+                        {'name': 'price', 'type': 'double'}]
+        rows = ['2017-01-0%dT10:00:00Z,T%d,%d,%d.5' % (day, day, day * 100, day)
+                for day in range(1, 3)]
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr('AUSBS_D.csv', '\n'.join(['date,ticker,volume,price'] + rows))
+        self.archive = archive.getvalue()
+
+        with self.urlopen():
+            frame = list(quandl.export_table('AUSBS/D', returns='iterator'))[0]
+        self.assertEqual(str(frame['date'].dtype), 'datetime64[ns, UTC]')
+        self.assertEqual(str(frame['volume'].dtype), 'Int64')
+        self.assertEqual(str(frame['price'].dtype), 'float64')
+
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            return
+        with self.urlopen():
+            path = quandl.export_table('AUSBS/D', returns='parquet', filename=self.directory)
+        self.assertEqual([str(field.type) for field in pyarrow.parquet.read_schema(path)],
+                         ['timestamp[ns, tz=UTC]', 'string', 'int64', 'double'])
+
+    def test_export_table_rejects_unknown_returns(self):
+        self.assertRaises(InvalidRequestError,
+                          lambda: quandl.export_table('AUSBS/D', returns='xml'))
@@ -82,8 +82,9 @@ class ListDatatableDataTest(unittest.TestCase):
     def tearDown(self):
         RequestType.USE_GET_REQUEST = True
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_data_calls_connection_get(self, mock):
+    def test_data_calls_connection_get(self, mock, decode_response):
         datatable = Datatable('ZACKS/FC')
         Data.page(datatable, params={'ticker': ['AAPL', 'MSFT'],
                                      'per_end_date': {'gte': '2015-01-01'},
@@ -94,8 +95,9 @@ class ListDatatableDataTest(unittest.TestCase):
                                 'qopts.columns[]': ['ticker', 'per_end_date']})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_data_calls_connection_post(self, mock):
+    def test_data_calls_connection_post(self, mock, decode_response):
         RequestType.USE_GET_REQUEST = False
         datatable = Datatable('ZACKS/FC')
         Data.page(datatable, params={'ticker': ['AAPL', 'MSFT'],
@@ -0,0 +1,221 @@
+import json
+import re
+import socket
+import threading
+import time
+import unittest
+
+import httpretty
+import requests
+from mock import patch
+
+import quandl
+from quandl.api_config import ApiConfig
+from quandl.connection import Connection
+from quandl.errors.quandl_error import DeadlineExceededError
+from quandl.utils.deadline_util import Deadline
+from test.factories.dataset_data import DatasetDataFactory
+from test.factories.datatable_data import DatatableDataFactory
+from test.test_retries import ModifyRetrySettingsTestCase
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+class DeadlineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.patcher = patch('quandl.utils.deadline_util.time', self.clock)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        ApiConfig.deadline = None
+
+    def test_start_without_seconds_has_no_deadline(self):
+        self.assertIsNone(Deadline.start())
+
+    def test_start_defaults_to_the_configured_deadline(self):
+        ApiConfig.deadline = 30
+        self.assertEqual(Deadline.start().seconds, 30)
+        self.assertEqual(Deadline.start(5).seconds, 5)
+
+    def test_check_raises_with_progress_once_expired(self):
+        deadline = Deadline(10, 'get_table(ZACKS/FC)')
+        deadline.advance(pages=1, rows=100)
+        deadline.advance(pages=1, rows=50)
+        deadline.check()
+        self.clock.now = 10
+        with self.assertRaises(DeadlineExceededError) as context:
+            deadline.check()
+        self.assertEqual(context.exception.progress, {'pages': 2, 'rows': 150})
+        self.assertEqual(context.exception.deadline, 10)
+        self.assertIn('get_table(ZACKS/FC)', str(context.exception))
+        self.assertIn('2 pages, 150 rows', str(context.exception))
+
+    def test_timeout_is_shortened_to_what_is_left(self):
+        deadline = Deadline(10)
+        self.clock.now = 7
+        self.assertEqual(deadline.timeout((5, 60)), (3, 3))
+        self.assertEqual(deadline.timeout((1, None)), (1, 3))
+        self.assertEqual(deadline.timeout(2), (2, 2))
+
+    def test_timeout_raises_once_expired(self):
+        deadline = Deadline(10)
+        self.clock.now = 11
+        self.assertRaises(DeadlineExceededError, lambda: deadline.timeout((5, 60)))
+
+
+class ConnectionTimeoutTest(unittest.TestCase):
+
+    @patch('quandl.connection.Connection.execute_request')
+    def test_requests_use_the_configured_timeouts(self, mock):
+        Connection.request('get', 'databases')
+        self.assertEqual(mock.call_args[1]['timeout'],
+                         (ApiConfig.connect_timeout, ApiConfig.read_timeout))
+
+    @patch('quandl.connection.Connection.execute_request')
+    def test_requests_use_the_timeout_of_the_call(self, mock):
+        Connection.request('get', 'databases', timeout=3)
+        self.assertEqual(mock.call_args[1]['timeout'], 3)
+
+    @patch('quandl.connection.Connection.execute_request')
+    def test_timeouts_past_the_deadline_raise_deadline_exceeded(self, mock):
+        clock = FakeClock()
+        with patch('quandl.utils.deadline_util.time', clock):
+            deadline = Deadline(5, 'get(NSE/OIL)')
+
+            def time_out(*args, **kwargs):
+                clock.now = 5
+                raise requests.exceptions.ReadTimeout()
+            mock.side_effect = time_out
+            self.assertRaises(DeadlineExceededError,
+                              lambda: Connection.request('get', 'databases', deadline=deadline))
+
+    @patch('quandl.connection.Connection.execute_request')
+    def test_timeouts_before_the_deadline_are_raised_as_they_are(self, mock):
+        mock.side_effect = requests.exceptions.ReadTimeout()
+        self.assertRaises(requests.exceptions.ReadTimeout,
+                          lambda: Connection.request('get', 'databases', deadline=Deadline(60)))
+
+
+class CallDeadlineTest(unittest.TestCase):
+    """ Every response served moves the clock one second forward. """
+
+    def setUp(self):
+        ApiConfig.api_key = 'api_token'
+        self.clock = FakeClock()
+        self.patcher = patch('quandl.utils.deadline_util.time', self.clock)
+        self.patcher.start()
+        httpretty.reset()
+        httpretty.enable()
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/(datatables|pit)/*'),
+                               body=self.datatable_page)
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datasets/*'),
+                               body=self.dataset_data)
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        self.patcher.stop()
+
+    def datatable_page(self, request, uri, headers):
+        self.clock.now += 1
+        page = {'datatable': DatatableDataFactory.build(), 'meta': {'next_cursor_id': 'next'}}
+        return [200, headers, json.dumps(page)]
+
+    def dataset_data(self, request, uri, headers):
+        self.clock.now += 1
+        return [200, headers, json.dumps({'dataset_data': DatasetDataFactory.build()})]
+
+    def test_get_table_raises_with_the_pages_received(self):
+        with self.assertRaises(DeadlineExceededError) as context:
+            quandl.get_table('ZACKS/FC', paginate=True, prefetch_pages=0, deadline=2.5)
+        self.assertEqual(context.exception.progress, {'pages': 3, 'rows': 12})
+        self.assertIn('get_table(ZACKS/FC)', str(context.exception))
+
+    def test_get_point_in_time_raises_with_the_pages_received(self):
+        with self.assertRaises(DeadlineExceededError) as context:
+            quandl.get_point_in_time('ZACKS/FC', interval='asofdate', date='2020-01-01',
+                                     paginate=True, deadline=1.5)
+        self.assertEqual(context.exception.progress['pages'], 2)
+
+    def test_get_table_uses_the_configured_deadline(self):
+        ApiConfig.deadline = 0.5
+        try:
+            with self.assertRaises(DeadlineExceededError) as context:
+                quandl.get_table('ZACKS/FC', paginate=True, prefetch_pages=0)
+        finally:
+            ApiConfig.deadline = None
+        self.assertEqual(context.exception.progress['pages'], 1)
+
+    def test_merged_get_raises_with_the_datasets_received(self):
+        with self.assertRaises(DeadlineExceededError) as context:
+            quandl.get(['NSE/OIL', 'WIKI/AAPL', 'WIKI/MSFT'], deadline=1.5)
+        self.assertEqual(context.exception.progress, {'datasets': 2})
+
+    def test_get_within_its_deadline_returns_the_data(self):
+        data = quandl.get(['NSE/OIL', 'WIKI/AAPL'], deadline=10)
+        self.assertEqual(len(data.index), 4)
+
+
+class StalledServerDeadlineTest(ModifyRetrySettingsTestCase):
+    """ A server accepting connections but never answering them. """
+
+    def setUp(self):
+        super(StalledServerDeadlineTest, self).setUp()
+        ApiConfig.use_retries = True
+        ApiConfig.number_of_retries = 5
+        ApiConfig.retry_backoff_factor = 0.1
+        httpretty.disable()
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(16)
+        self.connections = []
+        self.accepting = threading.Thread(target=self.accept, daemon=True)
+        self.accepting.start()
+        self.api_protocol, self.api_base = ApiConfig.api_protocol, ApiConfig.api_base
+        ApiConfig.api_protocol = 'http://'
+        ApiConfig.api_base = 'http://127.0.0.1:%s/api/v3' % self.listener.getsockname()[1]
+
+    def tearDown(self):
+        ApiConfig.api_protocol, ApiConfig.api_base = self.api_protocol, self.api_base
+        Connection.close_session()
+        self.listener.close()
+        for connection in self.connections:
+            connection.close()
+        super(StalledServerDeadlineTest, self).tearDown()
+
+    def accept(self):
+        while True:
+            try:
+                self.connections.append(self.listener.accept()[0])
+            except OSError:
+                return
+
+    def test_retries_do_not_outlast_the_deadline(self):
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            quandl.get_table('ZACKS/FC', deadline=1)
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertEqual(len(self.connections), 1)
+
+    def test_retries_get_what_is_left_of_the_deadline(self):
+        ApiConfig.read_timeout = 0.4
+        try:
+            started = time.monotonic()
+            with self.assertRaises(DeadlineExceededError):
+                quandl.get_table('ZACKS/FC', deadline=1)
+        finally:
+            ApiConfig.read_timeout = 120
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertGreater(len(self.connections), 1)
@@ -0,0 +1,182 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+
+import httpretty
+
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import QuandlError
+from quandl.model.database import Database
+from quandl.utils.download_util import FileDownloader
+from test.test_retries import ModifyRetrySettingsTestCase
+
+FILE_URL = 'https://www.blah.com/download/db.zip'
+
+
+class FileDownloaderTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(FileDownloaderTest, self).setUp()
+        ApiConfig.use_retries = False
+        self.default_part_size = ApiConfig.bulk_download_part_size
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'db.zip')
+        self.content = bytes(bytearray(range(256))) * 4000
+        self.ranges = []
+        self.failing_ranges = set()
+        self.truncated_ranges = set()
+        self.ignored_ranges = set()
+        self.accept_ranges = True
+        self.etag = '"v1"'
+        httpretty.reset()
+        httpretty.enable()
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/databases/*'),
+                               adding_headers={'Location': FILE_URL},
+                               body='{}', status=302)
+        httpretty.register_uri(httpretty.GET, FILE_URL, body=self.serve_file)
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        shutil.rmtree(self.directory, ignore_errors=True)
+        ApiConfig.bulk_download_part_size = self.default_part_size
+        super(FileDownloaderTest, self).tearDown()
+
+    # serves the file like a storage service, honouring single byte ranges
+    def serve_file(self, request, uri, response_headers):
+        response_headers['etag'] = self.etag
+        if self.accept_ranges:
+            response_headers['accept-ranges'] = 'bytes'
+        byte_range = request.headers.get('Range')
+        if not byte_range or not self.accept_ranges or byte_range in self.ignored_ranges:
+            response_headers['content-length'] = str(len(self.content))
+            return [200, response_headers, self.content]
+
+        self.ranges.append(byte_range)
+        if byte_range in self.failing_ranges:
+            return [500, response_headers, b'']
+        start, end = re.match(r'bytes=(\d+)-(\d*)', byte_range).groups()
+        end = int(end) if end else len(self.content) - 1
+        body = self.content[int(start):end + 1]
+        if byte_range in self.truncated_ranges:
+            body = body[:len(body) // 2]
+        response_headers['content-length'] = str(len(body))
+        response_headers['content-range'] = 'bytes %s-%s/%s' % (start, end, len(self.content))
+        return [206, response_headers, body]
+
+    def download(self, **options):
+        return Database('NSE').bulk_download_to_file(self.directory, **options)
+
+    def downloaded(self):
+        with open(self.file_path, 'rb') as f:
+            return f.read()
+
+    def test_downloads_parts_concurrently(self):
+        ApiConfig.bulk_download_part_size = 100000
+        self.assertEqual(self.download(), self.file_path)
+
+        self.assertEqual(self.downloaded(), self.content)
+        self.assertEqual(len(self.ranges), 11)
+        self.assertIn('bytes=0-99999', self.ranges)
+        self.assertIn('bytes=1000000-1023999', self.ranges)
+        self.assertEqual(os.listdir(self.directory), ['db.zip'])
+
+    def test_streams_the_file_when_ranges_are_not_accepted(self):
+        ApiConfig.bulk_download_part_size = 100000
+        self.accept_ranges = False
+        self.download()
+        self.assertEqual(self.downloaded(), self.content)
+        self.assertEqual(self.ranges, [])
+
+    def test_streams_small_files(self):
+        self.download()
+        self.assertEqual(self.downloaded(), self.content)
+        self.assertEqual(self.ranges, [])
+
+    def test_resumes_the_missing_parts(self):
+        ApiConfig.bulk_download_part_size = 100000
+        self.failing_ranges = set(['bytes=300000-399999', 'bytes=700000-799999'])
+        self.assertRaises(QuandlError, self.download)
+        self.assertFalse(os.path.exists(self.file_path))
+        self.assertTrue(os.path.exists(self.file_path + FileDownloader.PART_SUFFIX))
+        with open(self.file_path + FileDownloader.STATE_SUFFIX) as f:
+            done = json.load(f)['parts']
+        self.assertNotIn(3, done)
+
+        self.failing_ranges = set()
+        self.ranges = []
+        self.download()
+        self.assertEqual(self.downloaded(), self.content)
+        self.assertEqual(len(self.ranges), 11 - len(done))
+        self.assertIn('bytes=300000-399999', self.ranges)
+        for index in done:
+            self.assertNotIn('bytes=%s-%s' % (index * 100000, index * 100000 + 99999),
+                             self.ranges)
+        self.assertEqual(os.listdir(self.directory), ['db.zip'])
+
+    def test_truncated_parts_are_not_recorded(self):
+        ApiConfig.bulk_download_part_size = 100000
+        self.truncated_ranges = set(['bytes=300000-399999'])
+        self.assertRaises(QuandlError, self.download)
+        with open(self.file_path + FileDownloader.STATE_SUFFIX) as f:
+            self.assertNotIn(3, json.load(f)['parts'])
+
+        self.truncated_ranges = set()
+        self.ranges = []
+        self.download()
+        self.assertEqual(self.downloaded(), self.content)
+        self.assertIn('bytes=300000-399999', self.ranges)
+
+    def test_parts_answered_with_the_whole_file_are_not_recorded(self):
+        ApiConfig.bulk_download_part_size = 100000
+        self.ignored_ranges = set(['bytes=300000-399999'])
+        self.assertRaises(QuandlError, self.download)
+        with open(self.file_path + FileDownloader.STATE_SUFFIX) as f:
+            self.assertNotIn(3, json.load(f)['parts'])
+
+    def test_resumes_a_streamed_download(self):
+        part_path = self.file_path + FileDownloader.PART_SUFFIX
+        with open(part_path, 'wb') as f:
+            f.write(self.content[:12345])
+        with open(self.file_path + FileDownloader.STATE_SUFFIX, 'w') as f:
+            json.dump({'size': len(self.content), 'etag': self.etag,
+                       'last_modified': None, 'stream': True}, f)
+
+        self.download()
+        self.assertEqual(self.downloaded(), self.content)
+        self.assertEqual(self.ranges, ['bytes=12345-'])
+
+    def test_restarts_when_the_file_changed(self):
+        ApiConfig.bulk_download_part_size = 100000
+        self.failing_ranges = set(['bytes=300000-399999'])
+        self.assertRaises(QuandlError, self.download)
+
+        self.failing_ranges = set()
+        self.ranges = []
+        self.etag = '"v2"'
+        self.content = self.content[::-1]
+        self.download()
+        self.assertEqual(self.downloaded(), self.content)
+        self.assertEqual(len(self.ranges), 11)
+
+    def test_read_size_grows_with_throughput(self):
+        class FakeRaw(object):
+            def __init__(self, content):
+                self.content = content
+                self.sizes = []
+
+            def read(self, size, decode_content=True):
+                self.sizes.append(size)
+                chunk, self.content = self.content[:size], self.content[size:]
+                return chunk
+
+        class FakeResponse(object):
+            raw = FakeRaw(b'x' * (10 * 1024 * 1024))
+
+        downloader = FileDownloader(self.file_path, chunk_size=64 * 1024)
+        self.assertEqual(b''.join(downloader._read_chunks(FakeResponse)), b'x' * 10485760)
+        self.assertEqual(FakeResponse.raw.sizes[:3], [65536, 131072, 262144])
+        self.assertEqual(max(FakeResponse.raw.sizes), FileDownloader.MAX_CHUNK_SIZE)
@@ -0,0 +1,141 @@
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+import httpretty
+from mock import call, patch
+
+import quandl
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import NotFoundError, QuandlError
+from quandl.model.datatable import Datatable
+from quandl.utils.export_manager_util import ExportManager
+
+
+class ExportManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        ApiConfig.api_key = 'api_token'
+        ApiConfig.use_retries = False
+        ApiConfig.export_poll_interval = 0.01
+        self.directory = tempfile.mkdtemp()
+        # polls answered with a regenerating file before each table is fresh
+        self.regenerating_polls = {'AUSBS/D': 0, 'ZACKS/FC': 2, 'MER/F1': 1}
+        self.poll_counts = dict([(code, 0) for code in self.regenerating_polls])
+        self.lock = threading.Lock()
+        httpretty.reset()
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET, re.compile(r'https://data.nasdaq.com/api/v3/datatables/(.+)\.json'),
+            body=self.respond)
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        shutil.rmtree(self.directory)
+        ApiConfig.use_retries = True
+        ApiConfig.export_poll_interval = 1
+
+    def respond(self, request, uri, headers):
+        code = re.search(r'datatables/(.+)\.json', uri).group(1)
+        if code not in self.poll_counts:
+            return [404, headers, json.dumps({'quandl_error': {
+                'code': 'QECx02', 'message': 'not found'}})]
+        with self.lock:
+            self.poll_counts[code] += 1
+            fresh = self.poll_counts[code] > self.regenerating_polls[code]
+        file_info = {'status': 'fresh' if fresh else 'regenerating',
+                     'link': 'https://www.blah.com/download/%s.zip' % code}
+        return [200, headers, json.dumps({'datatable_bulk_download': {'file': file_info}})]
+
+    def urlopen(self):
+        return patch('quandl.model.datatable.urlopen',
+                     side_effect=lambda link, **kwargs: io.BytesIO(link.encode('utf-8')))
+
+    def test_export_tables_downloads_every_table(self):
+        with self.urlopen():
+            jobs = quandl.export_tables(list(self.regenerating_polls.keys()),
+                                        filename=self.directory)
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ['AUSBS_D.zip', 'MER_F1.zip', 'ZACKS_FC.zip'])
+        with open(os.path.join(self.directory, 'ZACKS_FC.zip')) as f:
+            self.assertEqual(f.read(), 'https://www.blah.com/download/ZACKS/FC.zip')
+        self.assertEqual(dict([(job.datatable_code, job.polls) for job in jobs]),
+                         {'AUSBS/D': 1, 'ZACKS/FC': 3, 'MER/F1': 2})
+        for job in jobs:
+            self.assertEqual(job.path, os.path.join(
+                self.directory, job.datatable_code.replace('/', '_') + '.zip'))
+            self.assertIsNone(job.error)
+            self.assertGreaterEqual(job.generation_seconds, 0)
+            self.assertGreaterEqual(job.download_seconds, 0)
+            self.assertAlmostEqual(job.total_seconds,
+                                   job.generation_seconds + job.download_seconds)
+
+    def test_export_tables_backs_off_between_polls(self):
+        with self.urlopen():
+            jobs = quandl.export_tables(['ZACKS/FC'], filename=self.directory)
+        # checked at once, then after 0.01 and 0.02 more seconds
+        self.assertGreaterEqual(jobs[0].generation_seconds, 0.03)
+
+    def test_export_tables_sends_shared_and_table_filters(self):
+        with self.urlopen():
+            quandl.export_tables({'AUSBS/D': {'ticker': 'T1'}, 'MER/F1': {}},
+                                 filename=self.directory, date='2017-01-01')
+        queries = dict([(request.path.split('?')[0], request.querystring)
+                        for request in httpretty.latest_requests()])
+        self.assertEqual(queries['/api/v3/datatables/AUSBS/D.json']['ticker'], ['T1'])
+        self.assertEqual(queries['/api/v3/datatables/AUSBS/D.json']['date'], ['2017-01-01'])
+        self.assertEqual(queries['/api/v3/datatables/MER/F1.json']['date'], ['2017-01-01'])
+        self.assertNotIn('ticker', queries['/api/v3/datatables/MER/F1.json'])
+        self.assertEqual(queries['/api/v3/datatables/MER/F1.json']['qopts.export'], ['true'])
+
+    def test_export_tables_raises_failed_export_after_the_others(self):
+        with self.urlopen():
+            self.assertRaises(NotFoundError, lambda: quandl.export_tables(
+                ['AUSBS/D', 'NOPE/X', 'MER/F1'], filename=self.directory))
+        self.assertEqual(sorted(os.listdir(self.directory)), ['AUSBS_D.zip', 'MER_F1.zip'])
+
+    def test_manager_reports_failed_exports(self):
+        manager = ExportManager(self.directory)
+        manager.submit('NOPE/X')
+        manager.submit('AUSBS/D')
+        with self.urlopen():
+            failed, exported = manager.run()
+        self.assertIsInstance(failed.error, NotFoundError)
+        self.assertIsNone(failed.path)
+        self.assertIsNone(exported.error)
+
+    def test_export_tables_requires_a_folder(self):
+        self.assertRaises(QuandlError, lambda: quandl.export_tables(
+            ['AUSBS/D'], filename=os.path.join(self.directory, 'missing')))
+
+
+class GenerationWaitTest(unittest.TestCase):
+
+    def tearDown(self):
+        ApiConfig.export_poll_interval = 1
+
+    def test_wait_doubles_up_to_the_generation_interval(self):
+        waits = [Datatable.next_generation_wait()]
+        for _ in range(6):
+            waits.append(Datatable.next_generation_wait(waits[-1]))
+        self.assertEqual(waits, [1, 2, 4, 8, 16, 30, 30])
+
+    def test_first_wait_is_capped_by_the_generation_interval(self):
+        ApiConfig.export_poll_interval = 60
+        self.assertEqual(Datatable.next_generation_wait(), Datatable.WAIT_GENERATION_INTERVAL)
+
+    @patch('quandl.model.datatable.sleep')
+    @patch('quandl.model.datatable.Datatable._request_file_link')
+    def test_download_file_backs_off_while_the_file_generates(self, request_file_link, sleep):
+        request_file_link.side_effect = [None, None, None, 'https://www.blah.com/db.zip']
+        with patch('quandl.model.datatable.Datatable._download_file_with_link') as download:
+            Datatable('AUSBS/D').download_file('.', ticker='T1')
+        self.assertEqual(sleep.call_args_list, [call(1), call(2), call(4)])
+        self.assertEqual(download.call_args,
+                         call('.', 'https://www.blah.com/db.zip', 'AUSBS/D'))
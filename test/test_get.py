@@ -153,3 +153,10 @@ class GetMultipleDatasetsTest(unittest.TestCase):
                               params={'start_date': '2001-01-01', 'end_date': '2010-01-01',
                                       'collapse': 'annual', 'transform': 'rdiff',
                                       'rows': 4, 'order': 'desc'}))
+
+    @patch.object(MergedDataset, 'data')
+    def test_max_workers_is_not_sent_as_query_param(self, mock_method):
+        get(['WIKI/AAPL.1', 'WIKI/MSFT.2', 'NSE/OIL'], max_workers=4, rows=4)
+        self.assertEqual(mock_method.mock_calls[0],
+                         call(handle_not_found_error=True, handle_column_not_found=True,
+                              params={'rows': 4}, max_workers=4))
@@ -27,31 +27,36 @@ class GetPointInTimeTest(unittest.TestCase):
     def tearDown(self):
         RequestType.USE_GET_REQUEST = True
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_get_point_in_time_returns_data_frame_object(self, mock):
+    def test_get_point_in_time_returns_data_frame_object(self, mock, decode_response):
         df = quandl.get_point_in_time('ZACKS/FC', interval='asofdate', date='2020-01-01')
         self.assertIsInstance(df, pandas.core.frame.DataFrame)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_asofdate_call_connection(self, mock):
+    def test_asofdate_call_connection(self, mock, decode_response):
         quandl.get_point_in_time('ZACKS/FC', interval='asofdate', date='2020-01-01')
         expected = call('get', 'pit/ZACKS/FC/asofdate/2020-01-01', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_asofdate_call_connection_with_datetimes(self, mock):
+    def test_asofdate_call_connection_with_datetimes(self, mock, decode_response):
         quandl.get_point_in_time('ZACKS/FC', interval='asofdate', date='2020-01-01T12:55')
         expected = call('get', 'pit/ZACKS/FC/asofdate/2020-01-01T12:55', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_asofdate_call_without_date(self, mock):
+    def test_asofdate_call_without_date(self, mock, decode_response):
         quandl.get_point_in_time('ZACKS/FC', interval='asofdate')
         expected = call('get', "pit/ZACKS/FC/asofdate/%s" % date.today(), params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_from_call_connection(self, mock):
+    def test_from_call_connection(self, mock, decode_response):
         quandl.get_point_in_time(
             'ZACKS/FC',
             interval='from',
@@ -61,8 +66,9 @@ class GetPointInTimeTest(unittest.TestCase):
         expected = call('get', 'pit/ZACKS/FC/from/2020-01-01/to/2020-01-02', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_from_call_connection_with_datetimes(self, mock):
+    def test_from_call_connection_with_datetimes(self, mock, decode_response):
         quandl.get_point_in_time(
             'ZACKS/FC',
             interval='from',
@@ -72,8 +78,9 @@ class GetPointInTimeTest(unittest.TestCase):
         expected = call('get', 'pit/ZACKS/FC/from/2020-01-01T12:00/to/2020-01-02T14:00', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_between_call_connection(self, mock):
+    def test_between_call_connection(self, mock, decode_response):
         quandl.get_point_in_time(
             'ZACKS/FC',
             interval='between',
@@ -83,8 +90,9 @@ class GetPointInTimeTest(unittest.TestCase):
         expected = call('get', 'pit/ZACKS/FC/between/2020-01-01/2020-01-02', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_between_call_connection_with_datetimes(self, mock):
+    def test_between_call_connection_with_datetimes(self, mock, decode_response):
         quandl.get_point_in_time(
             'ZACKS/FC',
             interval='between',
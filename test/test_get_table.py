@@ -37,32 +37,38 @@ class GetDataTableTest(unittest.TestCase):
     def tearDown(self):
         RequestType.USE_GET_REQUEST = True
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_datatable_returns_datatable_object(self, mock):
+    def test_datatable_returns_datatable_object(self, mock, decode_response):
         df = quandl.get_table('ZACKS/FC', params={})
         self.assertIsInstance(df, pandas.core.frame.DataFrame)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_datatable_with_code_returns_datatable_object(self, mock):
+    def test_datatable_with_code_returns_datatable_object(self, mock, decode_response):
         df = quandl.get_table('AR/MWCF', code="ICEP_WAC_Z2017_S")
         self.assertIsInstance(df, pandas.core.frame.DataFrame)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_get_table_calls_connection_with_no_params_for_get_request(self, mock):
+    def test_get_table_calls_connection_with_no_params_for_get_request(self, mock, decode_response):
         quandl.get_table('ZACKS/FC')
         expected = call('get', 'datatables/ZACKS/FC', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_get_table_calls_connection_with_no_params_for_post_request(self, mock):
+    def test_get_table_calls_connection_with_no_params_for_post_request(self, mock,
+                                                                        decode_response):
         RequestType.USE_GET_REQUEST = False
 
         quandl.get_table('ZACKS/FC')
         expected = call('post', 'datatables/ZACKS/FC', json={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_get_table_calls_connection_with_params_for_get_request(self, mock):
+    def test_get_table_calls_connection_with_params_for_get_request(self, mock, decode_response):
         params = {'ticker': ['AAPL', 'MSFT'],
                   'per_end_date': {'gte': '2015-01-01'},
                   'qopts': {'columns': ['ticker', 'per_end_date']},
@@ -81,8 +87,9 @@ class GetDataTableTest(unittest.TestCase):
         expected = call('get', 'datatables/ZACKS/FC', params=expected_params)
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_get_table_calls_connection_with_params_for_post_request(self, mock):
+    def test_get_table_calls_connection_with_params_for_post_request(self, mock, decode_response):
         RequestType.USE_GET_REQUEST = False
         params = {'ticker': ['AAPL', 'MSFT'],
                   'per_end_date': {'gte': '2015-01-01'},
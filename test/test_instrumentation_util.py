@@ -0,0 +1,154 @@
+import json
+import re
+import time
+import unittest
+from contextlib import contextmanager
+
+import httpretty
+from mock import patch
+
+import quandl
+from quandl.api_config import ApiConfig
+from quandl.utils.concurrency_util import AdaptiveConcurrency
+from quandl.utils.instrumentation_util import Instrumentation, TimingAggregator
+from test.factories.datatable_data import DatatableDataFactory
+from test.factories.datatable_meta import DatatableMetaFactory
+from test.test_retries import ModifyRetrySettingsTestCase
+
+
+class InstrumentationTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(InstrumentationTest, self).setUp()
+        ApiConfig.api_key = 'api_token'
+        httpretty.reset()
+        httpretty.enable()
+        body = {'datatable': DatatableDataFactory.build(),
+                'meta': DatatableMetaFactory.build(next_cursor_id=None)}
+        self.body = json.dumps(body)
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datatables/*'),
+                               body=self.body)
+        self.events = []
+        Instrumentation.register(self.events.append)
+
+    def tearDown(self):
+        Instrumentation.clear()
+        httpretty.disable()
+        httpretty.reset()
+        super(InstrumentationTest, self).tearDown()
+
+    def test_get_table_emits_every_stage(self):
+        quandl.get_table('ZACKS/FC')
+        self.assertEqual([event['event'] for event in self.events],
+                         ['request', 'decode', 'convert_dates', 'build', 'to_pandas'])
+        for event in self.events:
+            self.assertGreaterEqual(event['seconds'], 0)
+
+    def test_request_event_fields(self):
+        quandl.get_table('ZACKS/FC')
+        request = self.events[0]
+        self.assertEqual(request['method'], 'get')
+        self.assertEqual(request['status'], 200)
+        self.assertEqual(request['bytes'], len(self.body))
+        self.assertTrue(request['url'].endswith('datatables/ZACKS/FC'))
+        self.assertAlmostEqual(request['ttfb_seconds'] + request['download_seconds'],
+                               request['seconds'], places=3)
+        self.assertEqual(request['retries'], 0)
+        self.assertEqual(request['retry_wait_seconds'], 0)
+
+    def test_retries_and_their_backoff_are_reported_apart(self):
+        ApiConfig.use_retries = True
+        ApiConfig.number_of_retries = 2
+        ApiConfig.retry_backoff_factor = 0.2
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datatables/*'),
+                               responses=[httpretty.Response(body='{}', status=503),
+                                          httpretty.Response(body='{}', status=503),
+                                          httpretty.Response(body=self.body)])
+        quandl.get_table('ZACKS/FC')
+        request = self.events[0]
+        self.assertEqual(request['retries'], 2)
+        # urllib3 retries once straight away, then backs off for 0.2 * 2 seconds
+        self.assertGreaterEqual(request['retry_wait_seconds'], 0.4)
+        # the time to the first byte and the download only cover the last attempt
+        self.assertLess(request['ttfb_seconds'] + request['download_seconds'], 0.4)
+        self.assertGreater(request['seconds'], request['retry_wait_seconds'])
+
+    def test_slot_wait_is_not_part_of_the_request_time(self):
+        @contextmanager
+        def slow_slot(deadline=None):
+            time.sleep(0.2)
+            yield
+
+        with patch.object(AdaptiveConcurrency, 'slot', side_effect=slow_slot):
+            quandl.get_table('ZACKS/FC')
+        request = self.events[0]
+        self.assertGreaterEqual(request['slot_wait_seconds'], 0.2)
+        self.assertLess(request['seconds'], 0.2)
+        self.assertEqual(request['rate_limit_wait_seconds'], 0)
+
+    def test_build_and_to_pandas_events_count_rows(self):
+        df = quandl.get_table('ZACKS/FC')
+        build = [event for event in self.events if event['event'] == 'build'][0]
+        to_pandas = [event for event in self.events if event['event'] == 'to_pandas'][0]
+        self.assertEqual(build['model'], 'Data')
+        self.assertEqual(build['rows'], len(df.index))
+        self.assertEqual(to_pandas['rows'], len(df.index))
+        self.assertEqual(to_pandas['columns'], len(df.columns))
+
+    def test_unregistered_callbacks_receive_nothing(self):
+        Instrumentation.unregister(self.events.append)
+        quandl.get_table('ZACKS/FC')
+        self.assertEqual(self.events, [])
+        self.assertIsNone(Instrumentation.start())
+
+    def test_failing_callback_does_not_break_the_request(self):
+        def fail(event):
+            raise ValueError('callback failed')
+        Instrumentation.register(fail)
+        df = quandl.get_table('ZACKS/FC')
+        self.assertEqual(len(df.index), 4)
+        self.assertEqual(len(self.events), 5)
+
+
+class TimingAggregatorTest(unittest.TestCase):
+
+    def test_summary_reports_percentiles_per_event(self):
+        aggregator = TimingAggregator()
+        for seconds in range(1, 101):
+            aggregator({'event': 'request', 'seconds': float(seconds), 'bytes': 10})
+        aggregator({'event': 'decode', 'seconds': 2.0, 'bytes': None})
+        summary = aggregator.summary()
+        self.assertEqual(summary['request']['count'], 100)
+        self.assertEqual(summary['request']['total'], 5050.0)
+        self.assertEqual(summary['request']['p50'], 50.0)
+        self.assertEqual(summary['request']['p90'], 90.0)
+        self.assertEqual(summary['request']['p99'], 99.0)
+        self.assertEqual(summary['request']['max'], 100.0)
+        self.assertEqual(summary['request']['bytes'], 1000)
+        self.assertIsNone(summary['decode']['bytes'])
+        self.assertEqual(summary['decode']['p99'], 2.0)
+
+    def test_report_has_a_line_per_event(self):
+        aggregator = TimingAggregator()
+        aggregator({'event': 'request', 'seconds': 0.5, 'bytes': 10})
+        aggregator({'event': 'build', 'seconds': 0.1})
+        lines = aggregator.report().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith('build'))
+        self.assertTrue(lines[2].startswith('request'))
+
+    def test_reset_forgets_events(self):
+        aggregator = TimingAggregator()
+        aggregator({'event': 'request', 'seconds': 0.5})
+        aggregator.reset()
+        self.assertEqual(aggregator.summary(), {})
+
+    def test_registered_aggregator_collects_events(self):
+        aggregator = Instrumentation.register(TimingAggregator())
+        try:
+            Instrumentation.finish('build', Instrumentation.start(), rows=3)
+        finally:
+            Instrumentation.unregister(aggregator)
+        self.assertEqual(aggregator.summary()['build']['count'], 1)
@@ -0,0 +1,74 @@
+import re
+
+import httpretty
+import pandas
+
+import quandl
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import InvalidRequestError, LimitExceededError
+from test.test_pagination_util import build_page
+from test.test_retries import ModifyRetrySettingsTestCase
+
+
+class IterTableTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(IterTableTest, self).setUp()
+        ApiConfig.use_retries = False
+        self.default_page_limit = ApiConfig.page_limit
+        httpretty.reset()
+        httpretty.enable()
+        self.pages = [httpretty.Response(body=build_page([['2015-07-11', 'AAPL']], 'abc')),
+                      httpretty.Response(body=build_page([['2015-07-12', 'MSFT'],
+                                                          ['2015-07-13', 'MSFT']], 'def')),
+                      httpretty.Response(body=build_page([['2015-07-13', 'GOOG']], None))]
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        ApiConfig.page_limit = self.default_page_limit
+        super(IterTableTest, self).tearDown()
+
+    def register_pages(self, url='https://data.nasdaq.com/api/v3/datatables/*'):
+        httpretty.register_uri(httpretty.GET, re.compile(url), responses=self.pages)
+
+    def test_yields_a_data_frame_per_page(self):
+        self.register_pages()
+        data_frames = list(quandl.iter_table('ZACKS/FC', ticker=['AAPL', 'MSFT', 'GOOG']))
+
+        self.assertEqual([len(df.index) for df in data_frames], [1, 2, 1])
+        for df in data_frames:
+            self.assertIsInstance(df, pandas.DataFrame)
+            self.assertEqual(list(df.columns), ['per_end_date', 'ticker'])
+            self.assertTrue(pandas.api.types.is_datetime64_any_dtype(df['per_end_date']))
+        self.assertEqual(list(data_frames[1]['ticker']), ['MSFT', 'MSFT'])
+        self.assertEqual(httpretty.last_request().querystring['qopts.cursor_id'], ['def'])
+
+    def test_stops_requesting_when_the_caller_stops(self):
+        self.register_pages()
+        data_frames = quandl.iter_table('ZACKS/FC', prefetch_pages=0)
+        next(data_frames)
+        data_frames.close()
+        self.assertEqual(len(httpretty.latest_requests()), 1)
+
+    def test_raises_error_when_page_limit_is_exceeded(self):
+        ApiConfig.page_limit = 1
+        self.register_pages()
+        data_frames = quandl.iter_table('ZACKS/FC')
+        self.assertEqual(len(next(data_frames).index), 1)
+        self.assertEqual(len(next(data_frames).index), 2)
+        self.assertRaises(LimitExceededError, lambda: next(data_frames))
+
+    def test_iter_point_in_time(self):
+        self.register_pages('https://data.nasdaq.com/api/v3/pit/*')
+        data_frames = list(quandl.iter_point_in_time(
+            'ZACKS/FC', interval='from', start_date='2020-01-01', end_date='2020-02-01'))
+
+        self.assertEqual(len(data_frames), 3)
+        self.assertEqual(httpretty.latest_requests()[0].path.split('?')[0],
+                         '/api/v3/pit/ZACKS/FC/from/2020-01-01/to/2020-02-01')
+        self.assertNotIn('start_date', httpretty.latest_requests()[0].querystring)
+
+    def test_iter_point_in_time_validates_options_immediately(self):
+        self.assertRaises(InvalidRequestError,
+                          lambda: quandl.iter_point_in_time('ZACKS/FC', interval='between'))
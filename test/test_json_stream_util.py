@@ -0,0 +1,104 @@
+import json
+import re
+import unittest
+
+import httpretty
+import pandas
+import six
+
+from quandl.api_config import ApiConfig
+from quandl.model.data import Data
+from quandl.model.data_list import DataList
+from quandl.model.datatable import Datatable
+from quandl.utils.json_stream_util import StreamingJsonDecoder
+from test.factories.datatable_data import DatatableDataFactory
+from test.factories.datatable_meta import DatatableMetaFactory
+
+
+class FakeStreamedResponse(object):
+
+    def __init__(self, body):
+        self.body = body.encode('utf-8')
+
+    def iter_content(self, chunk_size):
+        for index in range(0, len(self.body), chunk_size):
+            yield self.body[index:index + chunk_size]
+
+
+class StreamingJsonDecoderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.document = {'meta': {'next_cursor_id': None, 'total': 123456},
+                         'datatable': {
+                             'columns': [{'name': 'ticker', 'type': 'String'},
+                                         {'name': 'value', 'type': 'double'}],
+                             'data': [[six.u('café'), 1234567.25], ['AAPL', -2e-05],
+                                      ['MSFT', None], ['short'], ['GOOG', 3, True]]}}
+
+    def decode(self, document, chunk_size):
+        decoder = StreamingJsonDecoder([('datatable', 'data')], chunk_size=chunk_size)
+        return decoder.decode(FakeStreamedResponse(json.dumps(document, indent=1)))
+
+    def test_decodes_data_into_columns_for_any_chunk_size(self):
+        for chunk_size in [1, 3, 7, 64]:
+            result = self.decode(self.document, chunk_size)
+            columns = result['datatable'].pop('data')
+            tickers, values, flags = columns.columns
+            self.assertEqual(tickers, [six.u('café'), 'AAPL', 'MSFT', 'short', 'GOOG'])
+            self.assertEqual(values, [1234567.25, -2e-05, None, None, 3])
+            self.assertEqual(flags, [None, None, None, None, True])
+            self.assertEqual(len(columns), 5)
+            expected = dict(self.document)
+            expected['datatable'] = {'columns': self.document['datatable']['columns']}
+            self.assertEqual(result, expected)
+
+    def test_streamed_rows_match_decoded_rows(self):
+        self.document['datatable']['columns'][1]['type'] = 'Integer'
+        rows = [['AAPL', 1], ['MSFT', None], ['GOOG', 2 ** 60 + 1], ['IBM', 2]]
+        self.document['datatable']['data'] = rows
+        columns = self.document['datatable']['columns']
+        expected = DataList(Data, rows, {'columns': list(columns)})
+        for chunk_size in [3, 64]:
+            decoded = self.decode(self.document, chunk_size)['datatable']['data']
+            streamed = DataList(Data, decoded, {'columns': list(columns)})
+            self.assertEqual(streamed.to_list(), expected.to_list())
+            self.assertEqual([repr(row.to_list()[1]) for row in streamed],
+                             ['1', 'None', repr(2 ** 60 + 1), '2'])
+            pandas.testing.assert_frame_equal(streamed.to_pandas(), expected.to_pandas())
+
+    def test_decodes_empty_data(self):
+        self.document['datatable']['data'] = []
+        result = self.decode(self.document, 4)
+        self.assertEqual(len(result['datatable']['data']), 0)
+
+    def test_raises_error_on_truncated_document(self):
+        decoder = StreamingJsonDecoder([('datatable', 'data')], chunk_size=4)
+        body = json.dumps(self.document)[:-20]
+        self.assertRaises(ValueError, lambda: decoder.decode(FakeStreamedResponse(body)))
+
+
+class StreamedDatatableDataTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        httpretty.enable()
+        datatable_data = {'datatable': DatatableDataFactory.build()}
+        datatable_data.update({'meta': DatatableMetaFactory.build()})
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datatables/*'),
+                               body=json.dumps(datatable_data))
+
+    @classmethod
+    def tearDownClass(cls):
+        httpretty.disable()
+        httpretty.reset()
+
+    def tearDown(self):
+        ApiConfig.use_streaming_decoder = False
+
+    def test_streamed_page_matches_decoded_page(self):
+        expected = Data.page(Datatable('ZACKS/FC'), params={}).to_pandas()
+        ApiConfig.use_streaming_decoder = True
+        results = Data.page(Datatable('ZACKS/FC'), params={})
+        self.assertEqual(results.meta['next_cursor_id'], 'abc123')
+        pandas.testing.assert_frame_equal(results.to_pandas(), expected)
@@ -0,0 +1,43 @@
+import json
+import unittest
+
+import requests
+from mock import Mock, patch
+
+from quandl.api_config import ApiConfig
+from quandl.utils.json_util import JsonUtil
+
+
+class JsonUtilTest(unittest.TestCase):
+
+    def setUp(self):
+        JsonUtil._default_decoder = None
+
+    def tearDown(self):
+        ApiConfig.json_decoder = None
+        JsonUtil._default_decoder = None
+
+    def test_uses_configured_decoder(self):
+        ApiConfig.json_decoder = Mock(return_value={'foo': 'bar'})
+        response = Mock(content=b'{"foo": "baz"}')
+        self.assertEqual(JsonUtil.decode_response(response), {'foo': 'bar'})
+        ApiConfig.json_decoder.assert_called_once_with(b'{"foo": "baz"}')
+
+    def test_falls_back_to_standard_library(self):
+        with patch('quandl.utils.json_util.JsonUtil._detect_decoder', return_value=json.loads):
+            self.assertIs(JsonUtil.decoder(), json.loads)
+            self.assertEqual(JsonUtil.loads(b'{"foo": [1, 2.5, null]}'), {'foo': [1, 2.5, None]})
+
+    def test_retries_documents_the_fast_decoder_rejects(self):
+        ApiConfig.json_decoder = Mock(side_effect=ValueError('Integer exceeds 64-bit range'))
+        self.assertEqual(JsonUtil.loads(b'[123456789012345678901234567890]'),
+                         [123456789012345678901234567890])
+
+    def test_invalid_json_raises_value_error(self):
+        self.assertRaises(ValueError, lambda: JsonUtil.loads(b'not json'))
+
+    def test_decodes_response_content(self):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"foo": "bar"}'
+        self.assertEqual(JsonUtil.decode_response(response), {'foo': 'bar'})
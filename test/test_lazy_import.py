@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import unittest
+
+import quandl
+
+HEAVY_MODULES = ['pandas', 'numpy', 'requests', 'dateutil', 'inflection', 'more_itertools']
+
+
+def run_python(code):
+    return subprocess.check_output([sys.executable, '-c', code]).decode('utf-8').split()
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        loaded = run_python(
+            'import sys, quandl\n'
+            'quandl.ApiConfig.api_key = "key"\n'
+            'print(" ".join(m for m in %r if m in sys.modules))' % HEAVY_MODULES)
+        self.assertEqual(loaded, [])
+
+    def test_attributes_are_imported_on_first_use(self):
+        loaded = run_python(
+            'import sys, quandl\n'
+            'quandl.Dataset\n'
+            'print("requests" in sys.modules, quandl.Dataset.__module__)')
+        self.assertEqual(loaded, ['True', 'quandl.model.dataset'])
+
+    def test_pandas_is_imported_when_data_frames_are_built(self):
+        loaded = run_python(
+            'import sys, quandl\n'
+            'quandl.get_table, quandl.Datatable, quandl.Database\n'
+            'before = "pandas" in sys.modules\n'
+            'from quandl.model.data_list import DataList\n'
+            'from quandl.model.data import Data\n'
+            'DataList(Data, [["2015-01-01", 1]], {"column_names": ["Date", "Value"]}).to_pandas()\n'
+            'print(before, "pandas" in sys.modules)')
+        self.assertEqual(loaded, ['False', 'True'])
+
+    def test_functions_are_not_hidden_by_their_modules(self):
+        import quandl.get
+        import quandl.get_table
+        self.assertTrue(callable(quandl.get))
+        self.assertEqual(quandl.get.__name__, 'get')
+        self.assertEqual(quandl.get_table.__name__, 'get_table')
+        self.assertEqual(run_python(
+            'import quandl.sync, quandl\nprint(quandl.sync.__name__)'), ['sync'])
+
+    def test_star_import_exports_lazy_names(self):
+        namespace = {}
+        exec('from quandl import *', namespace)
+        for name in ['get', 'get_table', 'Dataset', 'MetadataCache', 'ApiConfig', 'QuandlError']:
+            self.assertIn(name, namespace)
+        self.assertNotIn('importlib', namespace)
+
+    def test_dir_lists_lazy_names(self):
+        self.assertIn('iter_table', dir(quandl))
+
+    def test_unknown_attribute(self):
+        self.assertRaises(AttributeError, lambda: quandl.not_an_attribute)
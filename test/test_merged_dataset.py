@@ -5,6 +5,7 @@ import datetime
 import pandas
 from quandl.model.dataset import Dataset
 from quandl.model.data import Data
+from quandl.model.data_list import DataList
 from quandl.model.merged_data_list import MergedDataList
 from quandl.model.merged_dataset import MergedDataset
 from mock import patch, call
@@ -212,3 +213,48 @@ class GetMergedDatasetTest(unittest.TestCase):
         dates = list([x[0] for x in results])
         self.assertTrue(all(dates[i] >= dates[i + 1]
                             for i in range(len(dates) - 1)))
+
+    def test_get_merged_dataset_concurrently_keeps_column_order(self):
+        codes = [('NSE/OIL', {'column_index': [1, 2]}),
+                 ('SINGLE/COLUMN', {'column_index': [1]}),
+                 'WIKI/MSFT']
+        expected = MergedDataset(codes).data(max_workers=1).to_pandas()
+        actual = MergedDataset(codes).data(max_workers=3).to_pandas()
+        pandas.testing.assert_frame_equal(actual, expected)
+
+    @patch.object(Dataset, 'data')
+    def test_get_merged_dataset_concurrently_raises_dataset_errors(self, mock_method):
+        mock_method.side_effect = ColumnNotFound('Requested column index 10 does not exist')
+        self.assertRaises(
+            ColumnNotFound,
+            lambda: MergedDataset(['NSE/OIL', 'WIKI/AAPL', 'WIKI/MSFT']).data(max_workers=3))
+
+    def test_merge_data_frames_matches_pairwise_merge(self):
+        data_frames = [
+            DataList(Data, [['2015-07-13', 1.0], ['2015-07-11', 2.0]],
+                     {'column_names': ['Date', 'A - x']}).to_pandas(),
+            DataList(Data, [], {'column_names': ['None', 'B - Not Found']}).to_pandas(),
+            DataList(Data, [['2015-07-12', 3.0], ['2015-07-13', 4.0]],
+                     {'column_names': ['Date', 'C - x']}).to_pandas(),
+            DataList(Data, [['2015-07-14', 5.0]],
+                     {'column_names': ['Date', 'C - x']}).to_pandas()]
+        expected = pandas.DataFrame()
+        for data_frame in data_frames:
+            expected = pandas.merge(expected, data_frame, right_index=True,
+                                    left_index=True, how='outer')
+        actual = MergedDataset([])._merge_data_frames(data_frames)
+        pandas.testing.assert_frame_equal(actual, expected, check_freq=False)
+
+    def test_merge_data_frames_with_duplicate_dates_matches_pairwise_merge(self):
+        data_frames = [
+            DataList(Data, [['2015-07-13', 1.0], ['2015-07-13', 2.0], ['2015-07-11', 3.0]],
+                     {'column_names': ['Date', 'A - x']}).to_pandas(),
+            DataList(Data, [['2015-07-12', 4.0], ['2015-07-13', 5.0]],
+                     {'column_names': ['Date', 'B - x']}).to_pandas()]
+        expected = pandas.DataFrame()
+        for data_frame in data_frames:
+            expected = pandas.merge(expected, data_frame, right_index=True,
+                                    left_index=True, how='outer')
+        actual = MergedDataset([])._merge_data_frames(data_frames)
+        pandas.testing.assert_frame_equal(actual, expected, check_freq=False)
+        self.assertEqual(len(actual.index), 4)
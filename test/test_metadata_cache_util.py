@@ -0,0 +1,110 @@
+import json
+import re
+import unittest
+
+import httpretty
+from mock import patch
+
+import quandl
+from quandl.api_config import ApiConfig
+from quandl.model.dataset import Dataset
+from quandl.model.datatable import Datatable
+from quandl.utils.metadata_cache_util import MetadataCache
+
+
+class MetadataCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        ApiConfig.metadata_cache_ttl = 60
+        MetadataCache.clear()
+        httpretty.reset()
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datasets/(.+)/metadata'),
+            body=self.dataset_metadata)
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datatables/(.+)/metadata'),
+            body=json.dumps({'datatable': {'vendor_code': 'ZACKS', 'datatable_code': 'FC'}}))
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        ApiConfig.metadata_cache_ttl = None
+        ApiConfig.metadata_cache_max_entries = 10000
+        MetadataCache.clear()
+
+    def dataset_metadata(self, request, uri, headers):
+        code = re.search(r'datasets/(.+)/metadata', uri).group(1)
+        return [200, headers, json.dumps({'dataset': {
+            'dataset_code': code, 'column_names': ['Date', 'Open'],
+            'newest_available_date': '2015-07-30'}})]
+
+    def requests_made(self):
+        return len(httpretty.latest_requests())
+
+    def test_new_objects_reuse_metadata(self):
+        self.assertEqual(Dataset('WIKI/AAPL').column_names, ['Date', 'Open'])
+        self.assertEqual(Dataset('WIKI/AAPL').column_names, ['Date', 'Open'])
+        Dataset('WIKI/MSFT').newest_available_date
+        self.assertEqual(self.requests_made(), 2)
+        self.assertEqual(MetadataCache.size(), 2)
+
+    def test_every_object_gets_its_own_copy(self):
+        Dataset('WIKI/AAPL').column_names.append('Close')
+        self.assertEqual(Dataset('WIKI/AAPL').column_names, ['Date', 'Open'])
+
+    def test_keyed_by_model_class(self):
+        Datatable('ZACKS/FC').data_fields()
+        Datatable('ZACKS/FC').data_fields()
+        Dataset('ZACKS/FC').data_fields()
+        self.assertEqual(self.requests_made(), 2)
+
+    def test_disabled_by_default(self):
+        ApiConfig.metadata_cache_ttl = None
+        Dataset('WIKI/AAPL').column_names
+        Dataset('WIKI/AAPL').column_names
+        self.assertEqual(self.requests_made(), 2)
+        self.assertEqual(MetadataCache.size(), 0)
+
+    @patch('quandl.utils.metadata_cache_util.time')
+    def test_entries_expire(self, clock):
+        clock.time.return_value = 1000
+        Dataset('WIKI/AAPL').column_names
+        clock.time.return_value = 1059
+        Dataset('WIKI/AAPL').column_names
+        clock.time.return_value = 1060
+        Dataset('WIKI/AAPL').column_names
+        self.assertEqual(self.requests_made(), 2)
+
+    def test_least_recently_used_entries_are_dropped(self):
+        ApiConfig.metadata_cache_max_entries = 2
+        Dataset('WIKI/AAPL').column_names
+        Dataset('WIKI/MSFT').column_names
+        Dataset('WIKI/AAPL').column_names
+        Dataset('WIKI/GOOG').column_names
+        self.assertEqual(self.requests_made(), 3)
+        Dataset('WIKI/AAPL').column_names
+        Dataset('WIKI/MSFT').column_names
+        self.assertEqual(self.requests_made(), 4)
+
+    def test_invalidate(self):
+        for code in ['WIKI/AAPL', 'WIKI/MSFT']:
+            Dataset(code).column_names
+        Datatable('ZACKS/FC').data_fields()
+        MetadataCache.invalidate(Dataset, 'WIKI/AAPL')
+        self.assertEqual(MetadataCache.size(), 2)
+        MetadataCache.invalidate(klass=Dataset)
+        self.assertEqual(MetadataCache.size(), 1)
+        MetadataCache.invalidate(code='ZACKS/FC')
+        self.assertEqual(MetadataCache.size(), 0)
+
+    def test_merged_dataset_reuses_metadata(self):
+        quandl.MergedDataset(['WIKI/AAPL', 'WIKI/MSFT']).column_names
+        quandl.MergedDataset(['WIKI/AAPL', 'WIKI/MSFT']).column_names
+        Dataset('WIKI/AAPL').newest_available_date
+        self.assertEqual(self.requests_made(), 2)
+
+    def test_other_params_are_cached_apart(self):
+        Dataset('WIKI/AAPL', params={'start_date': '2015-01-01'}).column_names
+        Dataset('WIKI/AAPL').column_names
+        self.assertEqual(self.requests_made(), 2)
@@ -0,0 +1,80 @@
+import json
+import re
+import warnings
+
+import httpretty
+from six.moves.urllib.parse import parse_qs, urlparse
+
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import InternalServerError, LimitExceededError
+from quandl.model.datatable import Datatable
+from quandl.utils.pagination_util import Paginator
+from test.test_retries import ModifyRetrySettingsTestCase
+
+
+def build_page(rows, next_cursor_id):
+    return json.dumps({'datatable': {
+        'columns': [{'name': 'per_end_date', 'type': 'Date'},
+                    {'name': 'ticker', 'type': 'String'}],
+        'data': rows},
+        'meta': {'next_cursor_id': next_cursor_id}})
+
+
+class PaginatorTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(PaginatorTest, self).setUp()
+        ApiConfig.use_retries = False
+        self.default_page_limit = ApiConfig.page_limit
+        httpretty.reset()
+        httpretty.enable()
+        self.pages = [httpretty.Response(body=build_page([['2015-07-11', 'AAPL']], 'abc')),
+                      httpretty.Response(body=build_page([['2015-07-12', 'MSFT']], 'def')),
+                      httpretty.Response(body=build_page([['2015-07-13', 'GOOG']], None))]
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        ApiConfig.page_limit = self.default_page_limit
+        super(PaginatorTest, self).tearDown()
+
+    def register_pages(self, pages):
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datatables/*'),
+                               responses=pages)
+
+    def tickers(self, prefetch_pages):
+        paginator = Paginator(Datatable('ZACKS/FC'), {}, paginate=True,
+                              prefetch_pages=prefetch_pages)
+        return [page.to_list()[0][1] for page in paginator]
+
+    def test_follows_cursors_until_the_last_page(self):
+        self.register_pages(self.pages)
+        self.assertEqual(self.tickers(prefetch_pages=0), ['AAPL', 'MSFT', 'GOOG'])
+        cursors = [parse_qs(urlparse(request.path).query).get('qopts.cursor_id')
+                   for request in httpretty.latest_requests()]
+        self.assertEqual(cursors, [None, ['abc'], ['def']])
+
+    def test_prefetching_returns_pages_in_order(self):
+        self.register_pages(self.pages)
+        self.assertEqual(self.tickers(prefetch_pages=2), ['AAPL', 'MSFT', 'GOOG'])
+
+    def test_prefetching_raises_request_errors(self):
+        error = httpretty.Response(body=json.dumps(
+            {'quandl_error': {'code': 'QEMx01', 'message': 'something went wrong'}}), status=500)
+        self.register_pages(self.pages[:1] + [error])
+        self.assertRaises(InternalServerError, lambda: self.tickers(prefetch_pages=1))
+
+    def test_raises_error_when_page_limit_is_exceeded(self):
+        ApiConfig.page_limit = 1
+        self.register_pages(self.pages)
+        self.assertRaises(LimitExceededError, lambda: self.tickers(prefetch_pages=1))
+
+    def test_stops_after_first_page_without_paginate(self):
+        self.register_pages(self.pages)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            pages = list(Paginator(Datatable('ZACKS/FC'), {}))
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(len(httpretty.latest_requests()), 1)
+        self.assertEqual(caught[0].category, UserWarning)
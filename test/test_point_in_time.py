@@ -26,8 +26,9 @@ class GetPointInTimeTest(ModifyRetrySettingsTestCase):
     def tearDown(self):
         RequestType.USE_GET_REQUEST = True
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_asofdate_call_connection(self, mock):
+    def test_asofdate_call_connection(self, mock, decode_response):
         PointInTime(
             'ZACKS/FC',
             pit={
@@ -38,8 +39,9 @@ class GetPointInTimeTest(ModifyRetrySettingsTestCase):
         expected = call('get', 'pit/ZACKS/FC/asofdate/2020-01-01', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_from_call_connection(self, mock):
+    def test_from_call_connection(self, mock, decode_response):
         PointInTime(
             'ZACKS/FC',
             pit={
@@ -51,8 +53,9 @@ class GetPointInTimeTest(ModifyRetrySettingsTestCase):
         expected = call('get', 'pit/ZACKS/FC/from/2020-01-01/to/2020-01-02', params={})
         self.assertEqual(mock.call_args, expected)
 
+    @patch('quandl.utils.json_util.JsonUtil.decode_response')
     @patch('quandl.connection.Connection.request')
-    def test_between_call_connection(self, mock):
+    def test_between_call_connection(self, mock, decode_response):
         PointInTime(
             'ZACKS/FC',
             pit={
@@ -0,0 +1,181 @@
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+import httpretty
+from mock import patch
+
+from quandl.api_config import ApiConfig
+from quandl.connection import Connection
+from quandl.errors.quandl_error import DeadlineExceededError
+from quandl.utils.deadline_util import Deadline
+from quandl.utils.rate_limit_util import RateLimiter, fcntl
+from test.test_retries import ModifyRetrySettingsTestCase
+
+DAY = RateLimiter.SECONDS_PER_DAY
+# noon UTC, so the day limit tests do not cross midnight by accident
+NOW = 17000 * DAY + DAY / 2
+
+
+def reserve_in_process(path, queue):
+    ApiConfig.rate_limit_per_second = 10
+    ApiConfig.rate_limit_file = path
+    queue.put([RateLimiter.reserve(now=NOW) for _ in range(5)])
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        RateLimiter.reset()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        RateLimiter.reset()
+        ApiConfig.rate_limit_per_second = None
+        ApiConfig.rate_limit_per_day = None
+        ApiConfig.rate_limit_file = None
+        shutil.rmtree(self.directory)
+
+    def test_disabled_by_default(self):
+        self.assertFalse(RateLimiter.is_enabled())
+        self.assertEqual(RateLimiter.reserve(now=NOW), 0)
+        self.assertEqual(RateLimiter._state, {})
+
+    def test_spaces_requests_by_rate(self):
+        ApiConfig.rate_limit_per_second = 4
+        delays = [RateLimiter.reserve(now=NOW) for _ in range(4)]
+        self.assertEqual(delays, [0, 0.25, 0.5, 0.75])
+
+    def test_idle_time_is_not_saved_up(self):
+        ApiConfig.rate_limit_per_second = 4
+        RateLimiter.reserve(now=NOW)
+        self.assertEqual(RateLimiter.reserve(now=NOW + 10), 0)
+        self.assertEqual(RateLimiter.reserve(now=NOW + 10), 0.25)
+
+    def test_waits_for_next_day_once_daily_limit_is_used(self):
+        ApiConfig.rate_limit_per_day = 3
+        delays = [RateLimiter.reserve(now=NOW) for _ in range(4)]
+        self.assertEqual(delays, [0, 0, 0, DAY / 2])
+        # the requests of the next day were already counted from the reservation
+        self.assertEqual([RateLimiter.reserve(now=NOW + DAY) for _ in range(3)],
+                         [0, 0, DAY / 2])
+
+    def test_slots_past_max_delay_are_not_reserved(self):
+        ApiConfig.rate_limit_per_second = 4
+        RateLimiter.reserve(now=NOW)
+        self.assertEqual(RateLimiter.reserve(now=NOW, max_delay=0.1), 0.25)
+        self.assertEqual(RateLimiter.reserve(now=NOW), 0.25)
+
+    @patch('quandl.utils.rate_limit_util.time.sleep')
+    def test_wait_past_the_deadline_raises_without_sleeping(self, sleep):
+        ApiConfig.rate_limit_per_day = 1
+        RateLimiter.wait()
+        self.assertRaises(DeadlineExceededError, lambda: RateLimiter.wait(Deadline(60)))
+        self.assertEqual(sleep.call_count, 0)
+
+    def test_concurrent_threads_get_distinct_slots(self):
+        ApiConfig.rate_limit_per_second = 100
+        delays = []
+        lock = threading.Lock()
+
+        def reserve():
+            delay = RateLimiter.reserve(now=NOW)
+            with lock:
+                delays.append(round(delay, 6))
+
+        threads = [threading.Thread(target=reserve) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(delays), [round(i * 0.01, 6) for i in range(20)])
+
+    @unittest.skipIf(fcntl is None, 'file locking is not available')
+    def test_file_shares_reservations(self):
+        ApiConfig.rate_limit_per_second = 10
+        ApiConfig.rate_limit_file = os.path.join(self.directory, 'limits', 'quandl.json')
+        self.assertEqual(RateLimiter.reserve(now=NOW), 0)
+        with open(ApiConfig.rate_limit_file) as f:
+            self.assertAlmostEqual(json.load(f)['next_at'], NOW + 0.1, places=5)
+        # another process starts with no state of its own
+        RateLimiter.reset()
+        self.assertAlmostEqual(RateLimiter.reserve(now=NOW), 0.1, places=5)
+
+    @unittest.skipIf(fcntl is None, 'file locking is not available')
+    def test_processes_share_limits_through_file(self):
+        path = os.path.join(self.directory, 'quandl.json')
+        queue = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=reserve_in_process, args=(path, queue))
+                     for _ in range(3)]
+        for process in processes:
+            process.start()
+        delays = sorted(sum([queue.get(timeout=30) for _ in processes], []))
+        for process in processes:
+            process.join()
+        self.assertEqual([round(delay, 4) for delay in delays],
+                         [round(i * 0.1, 4) for i in range(15)])
+
+
+class ConnectionRateLimitTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(ConnectionRateLimitTest, self).setUp()
+        RateLimiter.reset()
+        httpretty.enable()
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datasets/*'),
+                               body=json.dumps({'dataset': {}}))
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        RateLimiter.reset()
+        ApiConfig.rate_limit_per_second = None
+        ApiConfig.rate_limit_per_day = None
+        super(ConnectionRateLimitTest, self).tearDown()
+
+    @patch('quandl.utils.rate_limit_util.time.sleep')
+    def test_requests_wait_for_their_slot(self, sleep):
+        ApiConfig.rate_limit_per_second = 2
+        for _ in range(3):
+            Connection.request('get', 'datasets/WIKI/AAPL')
+        self.assertEqual(len(httpretty.latest_requests()), 3)
+        waits = [args[0] for args, _ in sleep.call_args_list]
+        self.assertEqual(len(waits), 2)
+        for wait in waits:
+            self.assertLessEqual(wait, 1)
+            self.assertGreater(wait, 0)
+
+    def test_retries_reserve_a_slot_of_their_own(self):
+        ApiConfig.use_retries = True
+        ApiConfig.number_of_retries = 1
+        ApiConfig.retry_backoff_factor = 0
+        ApiConfig.rate_limit_per_day = 100
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datasets/*'),
+                               responses=[httpretty.Response(body='{}', status=500),
+                                          httpretty.Response(body=json.dumps({'dataset': {}}))])
+        with patch.object(RateLimiter, 'reserve', wraps=RateLimiter.reserve) as reserve:
+            Connection.request('get', 'datasets/WIKI/AAPL')
+        self.assertEqual(len(httpretty.latest_requests()), 2)
+        self.assertEqual(reserve.call_count, 2)
+        self.assertEqual(RateLimiter._state['count'], 2)
+
+    def test_retries_past_the_deadline_do_not_wait_for_a_slot(self):
+        ApiConfig.use_retries = True
+        ApiConfig.number_of_retries = 1
+        ApiConfig.retry_backoff_factor = 0
+        ApiConfig.rate_limit_per_day = 1
+        httpretty.register_uri(httpretty.GET,
+                               re.compile('https://data.nasdaq.com/api/v3/datasets/*'),
+                               responses=[httpretty.Response(body='{}', status=500)])
+        self.assertRaises(
+            DeadlineExceededError,
+            lambda: Connection.request('get', 'datasets/WIKI/AAPL',
+                                       deadline=Deadline.start(5, 'get')))
+        self.assertEqual(len(httpretty.latest_requests()), 1)
@@ -74,7 +74,7 @@ class TestRetries(ModifyRetrySettingsTestCase):
         ApiConfig.max_wait_between_retries = 3000
 
         retries = Connection.get_session().get_adapter(ApiConfig.api_protocol).max_retries
-        self.assertEqual(retries.BACKOFF_MAX, ApiConfig.max_wait_between_retries)
+        self.assertEqual(retries.backoff_max, ApiConfig.max_wait_between_retries)
 
     @httpretty.enabled
     def test_correct_response_returned_if_retries_succeed(self):
@@ -0,0 +1,154 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+import pandas
+from mock import Mock, patch
+
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import InvalidRequestError
+from quandl.model.data_list import DataList
+from quandl.model.data import Data
+from quandl.sync import sync
+
+
+class SyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        dates = pandas.bdate_range('2020-01-01', '2020-03-31', name='Date')
+        self.source = pandas.DataFrame(
+            {'Value': numpy.arange(len(dates), dtype=float) ** 2}, index=dates)
+        self.available = len(dates) - 10
+        self.requests = []
+        patcher = patch('quandl.model.dataset.Dataset.data', side_effect=self.respond)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        ApiConfig.api_key = None
+
+    def respond(self, params, **options):
+        self.requests.append(dict(params))
+        return Mock(to_pandas=Mock(return_value=self.serve(params)))
+
+    # answers like the api would with the rows published so far
+    def serve(self, params):
+        df = self.source.iloc[:self.available]
+        if 'start_date' in params:
+            df = df[df.index >= params['start_date']]
+        if params.get('collapse') == 'monthly':
+            df = df.resample('M').last()
+        if params.get('transform') == 'diff':
+            df = df.diff().iloc[1:]
+        elif params.get('transform') == 'cumul':
+            df = df.cumsum()
+        return df
+
+    def publish(self, rows):
+        self.available += rows
+
+    def full(self, **params):
+        return self.serve(params)
+
+    def test_first_call_downloads_the_whole_dataset(self):
+        result = sync('NSE/OIL', directory=self.directory)
+        self.assertTrue(result.equals(self.full()))
+        self.assertNotIn('start_date', self.requests[0])
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_later_calls_only_fetch_new_rows(self):
+        sync('NSE/OIL', directory=self.directory)
+        stored_dates = self.source.index[:self.available]
+        self.publish(3)
+        result = sync('NSE/OIL', directory=self.directory)
+
+        self.assertEqual(self.requests[1]['start_date'],
+                         (stored_dates[-2] + pandas.Timedelta(days=1)).strftime('%Y-%m-%d'))
+        self.assertTrue(result.equals(self.full()))
+
+    def test_collapse_refreshes_the_period_in_progress(self):
+        sync('NSE/OIL', directory=self.directory, collapse='monthly')
+        self.publish(8)
+        result = sync('NSE/OIL', directory=self.directory, collapse='monthly')
+        self.assertTrue(result.equals(self.full(collapse='monthly')))
+
+    def test_row_on_row_transforms_refetch_one_more_row(self):
+        sync('NSE/OIL', directory=self.directory, transform='diff')
+        stored_dates = self.source.index[1:self.available]
+        self.publish(4)
+        result = sync('NSE/OIL', directory=self.directory, transform='diff')
+
+        self.assertEqual(self.requests[1]['start_date'],
+                         (stored_dates[-3] + pandas.Timedelta(days=1)).strftime('%Y-%m-%d'))
+        self.assertTrue(result.equals(self.full(transform='diff')))
+
+    def test_collapsed_row_on_row_transforms(self):
+        sync('NSE/OIL', directory=self.directory, collapse='monthly', transform='diff')
+        self.publish(10)
+        result = sync('NSE/OIL', directory=self.directory, collapse='monthly', transform='diff')
+        self.assertTrue(result.equals(self.full(collapse='monthly', transform='diff')))
+
+    def test_whole_range_transforms_are_fetched_in_full(self):
+        sync('NSE/OIL', directory=self.directory, transform='cumul')
+        self.publish(2)
+        result = sync('NSE/OIL', directory=self.directory, transform='cumul')
+        self.assertNotIn('start_date', self.requests[1])
+        self.assertTrue(result.equals(self.full(transform='cumul')))
+
+    def test_no_new_rows_keeps_the_stored_copy(self):
+        first = sync('NSE/OIL', directory=self.directory)
+        self.requests = []
+        self.source = self.source.iloc[:0]
+        result = sync('NSE/OIL', directory=self.directory)
+        self.assertTrue(result.equals(first))
+
+    def test_order_and_rows_are_applied_locally(self):
+        sync('NSE/OIL', directory=self.directory)
+        result = sync('NSE/OIL', directory=self.directory, order='desc', rows=5)
+
+        self.assertTrue(result.equals(self.full().iloc[::-1].iloc[:5]))
+        for params in self.requests:
+            self.assertEqual(params['order'], 'asc')
+            self.assertNotIn('rows', params)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_copies_are_kept_per_params_but_not_per_api_key(self):
+        sync('NSE/OIL', directory=self.directory, api_key='first')
+        sync('NSE/OIL', directory=self.directory, api_key='second')
+        sync('NSE/OIL', directory=self.directory, collapse='monthly')
+        sync('NSE/OIL.1', directory=self.directory)
+        self.assertEqual(len(os.listdir(self.directory)), 3)
+
+    def test_returns_numpy_when_requested(self):
+        result = sync('NSE/OIL', directory=self.directory, returns='numpy')
+        self.assertIsInstance(result, numpy.core.records.recarray)
+
+    def test_only_single_datasets_are_synced(self):
+        self.assertRaises(InvalidRequestError,
+                          lambda: sync(['NSE/OIL', 'WIKI/AAPL'], directory=self.directory))
+
+
+class SyncRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @patch('quandl.model.dataset.Dataset.data')
+    def test_requests_ascending_data_from_the_dataset(self, mock):
+        mock.return_value = DataList(
+            Data, [['2020-01-01', 1.0], ['2020-01-02', 2.0]],
+            {'column_names': ['Date', 'Value']})
+        sync('NSE/OIL', directory=self.directory, order='desc', collapse='weekly')
+        sync('NSE/OIL', directory=self.directory, order='desc', collapse='weekly')
+
+        self.assertEqual(mock.call_args_list[0][1]['params'],
+                         {'collapse': 'weekly', 'order': 'asc'})
+        self.assertEqual(mock.call_args_list[1][1]['params'],
+                         {'collapse': 'weekly', 'order': 'asc', 'start_date': '2020-01-02'})
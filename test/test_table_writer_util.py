@@ -0,0 +1,118 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+import httpretty
+import pandas
+
+import quandl
+from quandl.api_config import ApiConfig
+from quandl.errors.quandl_error import InvalidRequestError
+from test.test_retries import ModifyRetrySettingsTestCase
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def build_page(rows, next_cursor_id):
+    return json.dumps({'datatable': {
+        'columns': [{'name': 'per_end_date', 'type': 'Date'},
+                    {'name': 'ticker', 'type': 'String'},
+                    {'name': 'shares', 'type': 'Integer'},
+                    {'name': 'price', 'type': 'BigDecimal(11,4)'}],
+        'data': rows},
+        'meta': {'next_cursor_id': next_cursor_id}})
+
+
+class TableWriterTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(TableWriterTest, self).setUp()
+        ApiConfig.use_retries = False
+        self.directory = tempfile.mkdtemp()
+        httpretty.reset()
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datatables/*'),
+            responses=[
+                httpretty.Response(body=build_page(
+                    [['2015-07-11', 'AAPL', 10, 1.5], ['2015-07-12', 'AAPL', 11, 2.5]], 'abc')),
+                # a page of nulls must not change the column types
+                httpretty.Response(body=build_page([[None, None, None, None]], 'def')),
+                httpretty.Response(body=build_page([['2015-07-13', 'MSFT', 12, 3.0]], None))])
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        shutil.rmtree(self.directory, ignore_errors=True)
+        super(TableWriterTest, self).tearDown()
+
+    def test_csv_output_appends_every_page(self):
+        path = os.path.join(self.directory, 'fc.csv')
+        result = quandl.get_table('ZACKS/FC', paginate=True, output='csv', path=path)
+
+        self.assertEqual(result, path)
+        data = pandas.read_csv(path)
+        self.assertEqual(list(data.columns), ['per_end_date', 'ticker', 'shares', 'price'])
+        self.assertEqual(list(data['ticker'].fillna('')), ['AAPL', 'AAPL', '', 'MSFT'])
+        self.assertEqual(data['per_end_date'][0], '2015-07-11')
+        self.assertEqual(len(httpretty.latest_requests()), 3)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet_output_writes_a_row_group_per_page(self):
+        path = os.path.join(self.directory, 'fc.parquet')
+        result = quandl.get_table('ZACKS/FC', paginate=True, output='parquet', path=path)
+
+        self.assertEqual(result, path)
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        schema = parquet_file.schema_arrow
+        self.assertEqual([str(schema.field(name).type)
+                          for name in ['per_end_date', 'ticker', 'shares', 'price']],
+                         ['date32[day]', 'string', 'int64', 'double'])
+        table = parquet_file.read().to_pydict()
+        self.assertEqual(table['ticker'], ['AAPL', 'AAPL', None, 'MSFT'])
+        self.assertEqual(table['shares'], [10, 11, None, 12])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet_output_maps_types_regardless_of_case(self):
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/datatables/*'),
+            body=json.dumps({'datatable': {
+                'columns': [{'name': 'ticker', 'type': 'string'},
+                            {'name': 'value', 'type': 'double'},
+                            {'name': 'updated_at', 'type': 'datetime'},
+                            {'name': 'rating', 'type': 'Unknown'}],
+                'data': [['AAPL', 1.5, '2015-07-13T10:00:00Z', 3],
+                         ['MSFT', None, '2015-07-14T11:30:00Z', 4]]},
+                'meta': {'next_cursor_id': None}}))
+        path = os.path.join(self.directory, 'fc.parquet')
+        quandl.get_table('ZACKS/FC', output='parquet', path=path)
+
+        schema = pyarrow.parquet.ParquetFile(path).schema_arrow
+        self.assertEqual([str(schema.field(name).type)
+                          for name in ['ticker', 'value', 'updated_at', 'rating']],
+                         ['string', 'double', 'timestamp[ns, tz=UTC]', 'int64'])
+
+    def test_get_point_in_time_output(self):
+        path = os.path.join(self.directory, 'pit.csv')
+        httpretty.register_uri(
+            httpretty.GET, re.compile('https://data.nasdaq.com/api/v3/pit/*'),
+            body=build_page([['2015-07-11', 'AAPL', 10, 1.5]], None))
+        quandl.get_point_in_time('ZACKS/FC', interval='asofdate', date='2020-01-01',
+                                 output='csv', path=path)
+        self.assertEqual(len(pandas.read_csv(path).index), 1)
+
+    def test_unknown_output_raises(self):
+        self.assertRaises(InvalidRequestError, lambda: quandl.get_table(
+            'ZACKS/FC', output='xlsx', path=os.path.join(self.directory, 'fc.xlsx')))
+        self.assertEqual(len(httpretty.latest_requests()), 0)
+
+    def test_output_requires_a_path(self):
+        self.assertRaises(InvalidRequestError,
+                          lambda: quandl.get_table('ZACKS/FC', output='csv'))
@@ -26,6 +26,16 @@ class UtilTest(unittest.TestCase):
         self.assertIsInstance(result['foo'], datetime.date)
         self.assertIsInstance(result[d]['bar'], datetime.datetime)
 
+    def test_parse_date(self):
+        self.assertEqual(Util.parse_date('2015-04-09'), datetime.date(2015, 4, 9))
+        self.assertIsInstance(Util.parse_date('2015-07-24T02:39:40.624Z'), datetime.datetime)
+        self.assertEqual(Util.parse_date(None), None)
+
+    def test_convert_column_to_datetimes(self):
+        result = Util.convert_column_to_datetimes(pandas.Series(['2015-04-09', None]))
+        self.assertEqual(result[0], pandas.Timestamp('2015-04-09'))
+        self.assertTrue(pandas.isnull(result[1]))
+
     def test_merge_options_when_key_exists_in_options(self):
         params = {'foo': 'bar', 'foo2': 'bar2'}
         options = {'params': {'foo': 'bar3'}}
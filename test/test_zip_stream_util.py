@@ -0,0 +1,83 @@
+import io
+import unittest
+import zipfile
+
+from quandl.utils.zip_stream_util import ZipStreamReader
+
+CONTENT = b''.join([b'%d,row %d\n' % (i, i) for i in range(20000)])
+
+
+class UnseekableStream(object):
+    """ Only offers what an HTTP response offers: reads of at most `size` bytes """
+
+    def __init__(self, data, read_limit=1000):
+        self._stream = io.BytesIO(data)
+        self._read_limit = read_limit
+        self.closed = False
+
+    def read(self, size=-1):
+        return self._stream.read(min(size, self._read_limit))
+
+    def write(self, data):
+        return self._stream.write(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def build_zip(content, compression=zipfile.ZIP_DEFLATED, seekable=True):
+    output = io.BytesIO() if seekable else UnseekableStream(b'')
+    with zipfile.ZipFile(output, 'w', compression) as archive:
+        archive.writestr('table.csv', content)
+    if seekable:
+        return output.getvalue()
+    return output._stream.getvalue()
+
+
+class ZipStreamReaderTest(unittest.TestCase):
+
+    def read(self, data, **kwargs):
+        reader = ZipStreamReader(UnseekableStream(data), **kwargs)
+        return reader, io.BufferedReader(reader, 4096).read()
+
+    def test_decompresses_deflated_member(self):
+        reader, content = self.read(build_zip(CONTENT), read_size=512)
+        self.assertEqual(content, CONTENT)
+        self.assertEqual(reader.name, 'table.csv')
+
+    def test_reads_stored_member(self):
+        _, content = self.read(build_zip(CONTENT, compression=zipfile.ZIP_STORED))
+        self.assertEqual(content, CONTENT)
+
+    def test_reads_member_followed_by_data_descriptor(self):
+        data = build_zip(CONTENT, seekable=False)
+        self.assertTrue(ZipStreamReader.LOCAL_HEADER.unpack(data[:30])[2] &
+                        ZipStreamReader.HAS_DATA_DESCRIPTOR)
+        _, content = self.read(data)
+        self.assertEqual(content, CONTENT)
+
+    def test_reads_lines(self):
+        reader = ZipStreamReader(UnseekableStream(build_zip(CONTENT)))
+        lines = io.BufferedReader(reader).readlines()
+        self.assertEqual(len(lines), 20000)
+        self.assertEqual(lines[-1], b'19999,row 19999\n')
+
+    def test_raises_on_data_that_is_not_a_zip_file(self):
+        self.assertRaises(zipfile.BadZipFile, lambda: self.read(b'x' * 100))
+
+    def test_raises_on_truncated_file(self):
+        data = build_zip(CONTENT)
+        self.assertRaises(zipfile.BadZipFile, lambda: self.read(data[:200]))
+
+    def test_raises_on_corrupt_member(self):
+        data = bytearray(build_zip(CONTENT, compression=zipfile.ZIP_STORED))
+        data[100] = data[100] ^ 0xFF
+        self.assertRaises(zipfile.BadZipFile, lambda: self.read(bytes(data)))
+
+    def test_close_closes_stream(self):
+        stream = UnseekableStream(build_zip(CONTENT))
+        ZipStreamReader(stream).close()
+        self.assertTrue(stream.closed)